@@ -0,0 +1,403 @@
+import random
+import time
+from SearchPosition import SearchPosition, ORDER_WON, CHAOS_WON, ZOBRIST_CHAOS_TO_MOVE
+from TranspositionTable import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+from Symmetry import canonical_hash, transform_move, unique_moves, INVERSE_SYMMETRIES
+
+
+WIN_SCORE = 30000
+# values above this are wins found in the tree (WIN_SCORE - plies to win)
+WIN_THRESHOLD = WIN_SCORE - 100
+INFINITY = WIN_SCORE + 1
+# deadline is checked every (TIME_CHECK_NODES + 1) nodes
+TIME_CHECK_NODES = 63
+# root results cache is cleared when it reaches this size
+ROOT_CACHE_SIZE = 1 << 16
+
+
+class SearchTimeout(Exception):
+    "Raised inside search when its deadline passes or it is stopped"
+    pass
+
+
+class AlphaBetaSearch:
+    """
+    A class representing negamax alpha-beta search over (cell, symbol) moves for both roles.
+    Positions are keyed by Zobrist hash in a transposition table that is kept
+    between searches of one game.
+    Search is iteratively deepened - it can be stopped by a deadline or a stop event at any time
+    and returns the best move of the last completed depth.
+    Several searches can share one table (see `LazySmpSearch`), helpers vary their move ordering.
+    Root moves symmetric to each other are searched once and root results are cached
+    by canonical position (rotations, reflections and symbol swap), also between games.
+
+    ...
+
+    Attributes
+    ----------
+    table: TranspositionTable
+        Transposition table shared by every search of a game
+    position: SearchPosition
+        Position being searched
+    nodes: int
+        Number of nodes visited by the last search
+    search_time: float
+        Duration of the last search (in seconds)
+    best_value: int
+        Value of the best move from the last search (from searching side point of view)
+    completed_depth: int
+        Depth of the last fully completed iteration of the last search
+    deadline: float | None
+        `time.perf_counter()` time the running search has to end by
+    stop_event: threading.Event | None
+        Event that stops the running search when set
+    helper_id: int
+        0 for the main search, helpers of a shared table search get 1, 2, ...
+    root_cache: dict
+        Results of finished searches - (canonical hash, order to move): (depth, canonical move, value)
+
+    Methods
+    -------
+    new_game()
+        Clears transposition table.
+    search(values: list[int], order_to_move: bool, depth: int, deadline=None, new_search=True)
+        Returns best move for the side to move.
+    cached_search(values: list[int], order_to_move: bool, depth: int, deadline: float, deepening)
+        Returns root cache move or caches the move of given deepening search.
+    iterative_deepening(values: list[int], order_to_move: bool, depth: int, deadline=None, first_depth=1)
+        Returns best move without preparing transposition table.
+    stats()
+        Returns statistics of the last search.
+    negamax(depth: int, alpha: int, beta: int, ply: int, order_to_move: bool)
+        Returns value of the position from side to move point of view.
+    ordered_moves(order_to_move: bool, first_move: tuple[int, int])
+        Returns moves sorted from most promising.
+    """
+
+    def __init__(self, table_size_megabytes: float = 16, table: TranspositionTable = None,
+                 helper_id: int = 0) -> None:
+        """
+        Parameters
+        ----------
+        table_size_megabytes: float, optional
+            Transposition table memory size (deafult 16)
+        table: TranspositionTable, optional
+            Table shared with other searches (deafult None - a new table is created)
+        helper_id: int, optional
+            Helper number, non-zero helpers randomize their move ordering (deafult 0)
+        """
+
+        self.table = TranspositionTable(table_size_megabytes) if table is None else table
+        self.position = SearchPosition()
+        self.nodes = 0
+        self.search_time = 0.0
+        self.best_value = 0
+        self.completed_depth = 0
+        self.deadline = None
+        self.stop_event = None
+        self.helper_id = helper_id
+        self.root_cache = {}
+        self._random = random.Random(helper_id)
+
+    def new_game(self) -> None:
+        """
+        Clears transposition table - entries are only reused between moves of one game.
+        """
+
+        self.table.clear()
+
+    def search(self, values: list[int], order_to_move: bool, depth: int, deadline: float = None,
+               new_search: bool = True) -> tuple[int, int]:
+        """
+        Returns best move for the side to move found by iterative deepening search.
+        Depths 1, 2, ..., `depth` are searched until the deadline passes or a win/loss is proven.
+        If not even depth 1 completes in time, the first move of move ordering is returned.
+
+        Raises
+        ------
+        ValueError
+            If there is no move to make (board is full)
+
+        Parameters
+        ----------
+        values: list[int]
+            Board cells values
+        order_to_move: bool
+            True if order is to move, False if chaos
+        depth: int
+            Maximum search depth in plies (at least 1)
+        deadline: float, optional
+            `time.perf_counter()` time the search has to end by (deafult None - no deadline)
+        new_search: bool, optional
+            If False, transposition table age is not increased and its statistics are not reset -
+            for many searches that make up one, e.g. pondered replies (deafult True)
+
+        Returns
+        -------
+        (int, int)
+            > Index of board cell
+            > Symbol value
+        """
+
+        if new_search:
+            self.table.new_search()
+            self.table.probes = 0
+            self.table.hits = 0
+        return self.cached_search(values, order_to_move, depth, deadline, self.iterative_deepening)
+
+    def cached_search(self, values: list[int], order_to_move: bool, depth: int, deadline: float,
+                      deepening) -> tuple[int, int]:
+        """
+        Returns move from the root cache, or the move of `deepening` search which is then cached.
+        A shallower cached result makes `deepening` start from the next depth.
+        Lazy SMP search runs its threads through the same cache this way.
+
+        Parameters
+        ----------
+        values: list[int]
+            Board cells values
+        order_to_move: bool
+            True if order is to move, False if chaos
+        depth: int
+            Maximum search depth in plies (at least 1)
+        deadline: float | None
+            `time.perf_counter()` time the search has to end by
+        deepening: Callable[[list[int], bool, int, float | None, int], tuple[int, int]]
+            Search with `iterative_deepening()` arguments, leaving its results in this search
+
+        Returns
+        -------
+        (int, int)
+            > Index of board cell
+            > Symbol value
+        """
+
+        position_hash, symmetry = canonical_hash(values)
+        cache_key = (position_hash, order_to_move)
+        cached = self.root_cache.get(cache_key)
+        if cached is not None and (cached[0] >= depth or abs(cached[2]) > WIN_THRESHOLD):
+            self.nodes = 0
+            self.search_time = 0.0
+            self.completed_depth, move, self.best_value = cached
+            return transform_move(move, INVERSE_SYMMETRIES[symmetry])
+        if cached is None:
+            move = deepening(values, order_to_move, depth, deadline, 1)
+        else:  # shallower result is known - deepening continues from the next depth
+            move = deepening(values, order_to_move, depth, deadline, cached[0] + 1)
+            if self.completed_depth == 0:
+                self.completed_depth, move, self.best_value = cached
+                return transform_move(move, INVERSE_SYMMETRIES[symmetry])
+        if self.completed_depth > 0 and (cached is None or cached[0] < self.completed_depth):
+            if len(self.root_cache) >= ROOT_CACHE_SIZE:
+                self.root_cache.clear()
+            self.root_cache[cache_key] = (self.completed_depth, transform_move(move, symmetry), self.best_value)
+        return move
+
+    def iterative_deepening(self, values: list[int], order_to_move: bool, depth: int, deadline: float = None,
+                            first_depth: int = 1) -> tuple[int, int]:
+        """
+        Runs iterative deepening from `first_depth` to `depth` without preparing the
+        transposition table (helpers of a shared table search call it directly).
+        Arguments and result are the same as in `search()`.
+        """
+
+        self.position = SearchPosition(values)
+        self.nodes = 0
+        self.completed_depth = 0
+        self.deadline = deadline
+        start_time = time.perf_counter()
+        best_move = None
+        best_value = 0
+        for iteration_depth in range(min(first_depth, max(depth, 1)), max(depth, 1) + 1):
+            try:
+                move = self._search_root(iteration_depth, order_to_move)
+            except SearchTimeout:
+                while self.position.moves:  # search was stopped in the middle of the tree
+                    self.position.undo()
+                break
+            if move is None:
+                break
+            best_move = move
+            best_value = self.best_value
+            self.completed_depth = iteration_depth
+            if abs(best_value) > WIN_THRESHOLD:  # result is proven, deeper search won't change it
+                break
+        if best_move is None:
+            moves = self._ordered_moves(order_to_move, None)
+            if not moves:
+                raise ValueError
+            best_move = moves[0]
+        self.best_value = best_value
+        self.deadline = None
+        self.search_time = time.perf_counter() - start_time
+        return best_move
+
+    def stats(self) -> dict:
+        """
+        Returns statistics of the last search.
+
+        Returns
+        -------
+        dict
+            > "nodes"
+            > "depth" - last completed depth
+            > "time" - seconds
+            > "nodes_per_second"
+            > "table_hit_rate"
+            > "table_size_megabytes"
+        """
+
+        nodes_per_second = self.nodes / self.search_time if self.search_time > 0 else 0.0
+        return {
+            'nodes': self.nodes,
+            'depth': self.completed_depth,
+            'time': self.search_time,
+            'nodes_per_second': nodes_per_second,
+            'table_hit_rate': self.table.hit_rate(),
+            'table_size_megabytes': self.table.size_megabytes()
+            }
+
+    def _search_root(self, depth: int, order_to_move: bool) -> tuple[int, int] | None:
+        """
+        Searches every root move and returns the best one.
+        """
+
+        key = self.position.hash if order_to_move else self.position.hash ^ ZOBRIST_CHAOS_TO_MOVE
+        entry = self.table.probe(key)
+        best_move = None
+        best_value = -INFINITY
+        alpha = -INFINITY
+        moves = unique_moves(self.position.cells, self._ordered_moves(order_to_move, entry[3] if entry else None))
+        for move in moves:
+            value = self._move_value(move, depth, alpha, INFINITY, 0, order_to_move)
+            if value > best_value:
+                best_value = value
+                best_move = move
+            alpha = max(alpha, value)
+        if best_move is not None:
+            self.table.store(key, depth, best_value, EXACT, best_move)
+        self.best_value = best_value
+        return best_move
+
+    def _move_value(self, move: tuple[int, int], depth: int, alpha: int, beta: int, ply: int,
+                    order_to_move: bool) -> int:
+        """
+        Plays the move, returns its value from the moving side point of view and undoes it.
+        """
+
+        position = self.position
+        result = position.play(move[0], move[1])
+        if result == ORDER_WON:
+            value = WIN_SCORE - ply - 1
+            if not order_to_move:  # chaos completed five in a row
+                value = -value
+        elif result == CHAOS_WON:
+            value = WIN_SCORE - ply - 1
+            if order_to_move:
+                value = -value
+        else:
+            value = -self._negamax(depth - 1, -beta, -alpha, ply + 1, not order_to_move)
+        position.undo()
+        return value
+
+    def _negamax(self, depth: int, alpha: int, beta: int, ply: int, order_to_move: bool) -> int:
+        """
+        Returns value of the position from side to move point of view.
+        """
+
+        self.nodes += 1
+        if not self.nodes & TIME_CHECK_NODES:
+            if self.deadline is not None and time.perf_counter() >= self.deadline:
+                raise SearchTimeout
+            if self.stop_event is not None and self.stop_event.is_set():
+                raise SearchTimeout
+        position = self.position
+        if depth <= 0:
+            return position.score if order_to_move else -position.score
+
+        table = self.table
+        key = position.hash if order_to_move else position.hash ^ ZOBRIST_CHAOS_TO_MOVE
+        entry = table.probe(key)
+        table_move = None
+        if entry is not None:
+            entry_depth, value, bound, table_move = entry
+            value = _value_from_table(value, ply)
+            if entry_depth >= depth:
+                if bound == EXACT:
+                    return value
+                if bound == LOWER_BOUND:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        original_alpha = alpha
+        best_value = -INFINITY
+        best_move = None
+        for move in self._ordered_moves(order_to_move, table_move):
+            value = self._move_value(move, depth, alpha, beta, ply, order_to_move)
+            if value > best_value:
+                best_value = value
+                best_move = move
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        break
+
+        if best_value <= original_alpha:
+            bound = UPPER_BOUND
+        elif best_value >= beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+        table.store(key, depth, _value_to_table(best_value, ply), bound, best_move)
+        return best_value
+
+    def _ordered_moves(self, order_to_move: bool, first_move: tuple[int, int] | None) -> list[tuple[int, int]]:
+        """
+        Returns moves sorted from most promising - transposition table move first,
+        then by evaluation change (order raises it, chaos lowers it).
+        Helpers shuffle moves of equal evaluation change and swap neighbouring moves,
+        so threads sharing a table explore different parts of the tree.
+        """
+
+        position = self.position
+        moves = position.generate_moves()
+        if self.helper_id:
+            self._random.shuffle(moves)
+        if order_to_move:
+            moves.sort(key=lambda move: -position.move_score_change(move[0], move[1]))
+        else:
+            moves.sort(key=lambda move: position.move_score_change(move[0], move[1]))
+        if self.helper_id and len(moves) > 1:
+            swap_index = self._random.randrange(len(moves) - 1)
+            moves[swap_index], moves[swap_index + 1] = moves[swap_index + 1], moves[swap_index]
+        if first_move is not None and first_move in moves:
+            moves.remove(first_move)
+            moves.insert(0, first_move)
+        return moves
+
+
+def _value_to_table(value: int, ply: int) -> int:
+    """
+    Converts win value from root distance to distance from the stored position.
+    """
+
+    if value > WIN_THRESHOLD:
+        return value + ply
+    if value < -WIN_THRESHOLD:
+        return value - ply
+    return value
+
+
+def _value_from_table(value: int, ply: int) -> int:
+    """
+    Converts stored win value back to root distance.
+    """
+
+    if value > WIN_THRESHOLD:
+        return value - ply
+    if value < -WIN_THRESHOLD:
+        return value + ply
+    return value
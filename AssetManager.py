@@ -0,0 +1,285 @@
+import json
+import mmap
+import os
+import struct
+import pygame
+from FontCache import font_cache
+
+ATLAS_WIDTH = 512
+ATLAS_PADDING = 1
+BUNDLE_MAGIC = b"OCAB"
+BUNDLE_VERSION = 1
+BUNDLE_HEADER = struct.Struct("<4sII")  # magic, version, index length
+BUNDLE_ALIGNMENT = 16
+
+
+class AssetManager:
+    """
+    A class representing game assets loaded once from `config.json`.
+    Every image is read from file once, scaled to each size it is used in and packed
+    with the others into one atlas surface converted to the display format.
+    Images are returned as atlas subsurfaces, so blits draw from atlas rectangles
+    without pixel format conversion.
+    Built atlas and fonts can be saved to one bundle file, loaded at start
+    with one memory mapping instead of reading and scaling every asset file.
+
+    ...
+
+    Attributes
+    ----------
+    paths: dict
+        Asset paths - name: path (from `config.json`, relative ones resolved from its directory)
+    atlas: pygame.Surface | None
+        Surface holding every image, None before `build_atlas()`
+    regions: dict
+        Image rectangles on atlas - (name, size): pygame.Rect
+
+    Methods
+    -------
+    path(name: str)
+        Returns asset file path.
+    add_image(name: str, size=None, scale=None)
+        Adds image in given size to the atlas.
+    build_atlas()
+        Loads, scales and packs every added image.
+    image(name: str, size=None, scale=None)
+        Returns image from the atlas.
+    save_bundle(bundle_path: str)
+        Saves atlas and fonts to a bundle file.
+    """
+
+    def __init__(self, config_path: str = "config.json", bundle_path: str = None) -> None:
+        """
+        Parameters
+        ----------
+        config_path: str, optional
+            Path to the assets config (deafult "config.json")
+        bundle_path: str, optional
+            Path to the assets bundle, loaded instead of the config if given (deafult None)
+
+        Raises
+        ------
+        FileNotFoundError
+            If config or bundle file is missing
+        ValueError
+            If bundle file has wrong format
+        """
+
+        self.atlas = None
+        self.regions = dict()
+        self._requests = dict()
+        self._sources = dict()
+        self._source_sizes = dict()
+        self._bundle = None
+        if bundle_path is None:
+            with open(config_path) as json_file:
+                paths = json.load(json_file)
+            # config paths are relative to the config, not to the working directory
+            config_directory = os.path.dirname(os.path.abspath(config_path))
+            self.paths = {name: os.path.normpath(os.path.join(config_directory, path))
+                          for name, path in paths.items()}
+        else:
+            self._load_bundle(bundle_path)
+
+    def path(self, name: str) -> str:
+        """
+        Returns asset file path.
+
+        Parameters
+        ----------
+        name: str
+            Asset name in config
+
+        Returns
+        -------
+        str
+            Asset file path
+        """
+
+        return self.paths[name]
+
+    def add_image(self, name: str, size: tuple[int, int] = None, scale: float = None) -> tuple[int, int]:
+        """
+        Adds image in given size to the atlas built by `build_atlas()`.
+        The image file is read once, however many sizes are added.
+
+        Parameters
+        ----------
+        name: str
+            Image name in config
+        size: tuple[int, int], optional
+            Final image size (deafult None - image file size or scaled by `scale`)
+        scale: float, optional
+            Scaling factor used when size is not given (deafult None - no scaling)
+
+        Raises
+        ------
+        FileNotFoundError
+            If no image is found by config path.
+
+        Returns
+        -------
+        tuple[int, int]
+            Final image size
+        """
+
+        size = self._final_size(name, size, scale)
+        self._requests[(name, size)] = None
+        return size
+
+    def build_atlas(self) -> None:
+        """
+        Scales every added image and packs them in rows into the atlas.
+        The atlas is converted to the display format if display mode is set.
+        """
+
+        keys = sorted(self._requests, key=lambda key: -key[1][1])  # higher images first
+        regions = dict()
+        x = y = row_height = 0
+        for name, size in keys:
+            if x + size[0] > ATLAS_WIDTH and x > 0:
+                x = 0
+                y += row_height + ATLAS_PADDING
+                row_height = 0
+            regions[(name, size)] = pygame.Rect((x, y), size)
+            x += size[0] + ATLAS_PADDING
+            row_height = max(row_height, size[1])
+
+        width = max([rect.right for rect in regions.values()], default=1)
+        height = max([rect.bottom for rect in regions.values()], default=1)
+        atlas = pygame.Surface((width, height), pygame.SRCALPHA)
+        for (name, size), rect in regions.items():
+            source = self._source(name)
+            if source.get_size() != size:
+                source = pygame.transform.scale(source, size)
+            atlas.blit(source, rect)
+        if pygame.display.get_surface() is not None:
+            atlas = atlas.convert_alpha()
+        self.atlas = atlas
+        self.regions = regions
+
+    def image(self, name: str, size: tuple[int, int] = None, scale: float = None) -> pygame.Surface:
+        """
+        Returns image from the atlas. It is added and the atlas is built again
+        if the image was not added before.
+
+        Parameters
+        ----------
+        name: str
+            Image name in config
+        size: tuple[int, int], optional
+            Image size (deafult None - image file size or scaled by `scale`)
+        scale: float, optional
+            Scaling factor used when size is not given (deafult None - no scaling)
+
+        Returns
+        -------
+        pygame.Surface
+            Atlas subsurface with the image
+        """
+
+        size = self._final_size(name, size, scale)
+        if (name, size) not in self.regions:
+            self.add_image(name, size)
+            self.build_atlas()
+        return self.atlas.subsurface(self.regions[(name, size)])
+
+    def save_bundle(self, bundle_path: str) -> None:
+        """
+        Saves built atlas (RGBA pixels), its regions, asset paths and every font file
+        from config to one bundle file. Header and JSON index are followed by aligned data.
+
+        Parameters
+        ----------
+        bundle_path: str
+            Path to the bundle file
+        """
+
+        atlas = self.atlas if self.atlas is not None else pygame.Surface((1, 1), pygame.SRCALPHA)
+        blocks = [pygame.image.tobytes(atlas, "RGBA")]
+        fonts = dict()
+        for path in self.paths.values():
+            if path.lower().endswith((".ttf", ".otf")):
+                with open(path, "rb") as font_file:
+                    blocks.append(font_file.read())
+                fonts[path] = len(blocks) - 1
+        offsets = []
+        offset = 0
+        for block in blocks:
+            offsets.append(offset)
+            offset += len(block) + -len(block) % BUNDLE_ALIGNMENT
+        index = {
+            "paths": self.paths,
+            "sizes": {name: list(self._source_size(name)) for name, _ in self.regions},
+            "atlas": [list(atlas.get_size()), offsets[0], len(blocks[0])],
+            "regions": [[name, list(size), list(rect)] for (name, size), rect in self.regions.items()],
+            "fonts": {path: [offsets[block], len(blocks[block])] for path, block in fonts.items()},
+        }
+        index_data = json.dumps(index).encode()
+        index_data += b" " * (-(BUNDLE_HEADER.size + len(index_data)) % BUNDLE_ALIGNMENT)
+        with open(bundle_path, "wb") as bundle_file:
+            bundle_file.write(BUNDLE_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(index_data)))
+            bundle_file.write(index_data)
+            for block in blocks:
+                bundle_file.write(block)
+                bundle_file.write(bytes(-len(block) % BUNDLE_ALIGNMENT))
+
+    def _load_bundle(self, bundle_path: str) -> None:
+        """
+        Memory maps bundle file. Atlas surface is made straight from mapped pixels
+        and fonts are registered in `font_cache` under their config paths.
+        """
+
+        with open(bundle_path, "rb") as bundle_file:
+            self._bundle = mmap.mmap(bundle_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._bundle) < BUNDLE_HEADER.size:
+            raise ValueError(f"{bundle_path} is not an assets bundle")
+        magic, version, index_length = BUNDLE_HEADER.unpack_from(self._bundle)
+        if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+            raise ValueError(f"{bundle_path} is not an assets bundle (version {BUNDLE_VERSION})")
+        data_start = BUNDLE_HEADER.size + index_length
+        index = json.loads(self._bundle[BUNDLE_HEADER.size:data_start])
+        data = memoryview(self._bundle)[data_start:]
+
+        self.paths = index["paths"]
+        self._source_sizes = {name: tuple(size) for name, size in index["sizes"].items()}
+        size, offset, length = index["atlas"]
+        self.atlas = pygame.image.frombuffer(data[offset:offset + length], size, "RGBA")
+        if pygame.display.get_surface() is not None:
+            self.atlas = self.atlas.convert_alpha()
+        for name, size, rect in index["regions"]:
+            self._requests[(name, tuple(size))] = None
+            self.regions[(name, tuple(size))] = pygame.Rect(rect)
+        for path, (offset, length) in index["fonts"].items():
+            font_cache.add_font_data(path, data[offset:offset + length])
+
+    def _source(self, name: str) -> pygame.Surface:
+        """
+        Returns image loaded from file, it is loaded on first use only.
+        """
+
+        if name not in self._sources:
+            self._sources[name] = pygame.image.load(self.paths[name])
+            self._source_sizes[name] = self._sources[name].get_size()
+        return self._sources[name]
+
+    def _source_size(self, name: str) -> tuple[int, int]:
+        """
+        Returns image file size (from bundle index if possible).
+        """
+
+        if name not in self._source_sizes:
+            self._source(name)
+        return self._source_sizes[name]
+
+    def _final_size(self, name: str, size: tuple[int, int], scale: float) -> tuple[int, int]:
+        """
+        Returns image size after scaling.
+        """
+
+        if size is not None:
+            return tuple(size)
+        width, height = self._source_size(name)
+        if scale is None:
+            return width, height
+        return round(width * scale), round(height * scale)
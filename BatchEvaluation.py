@@ -0,0 +1,365 @@
+import numpy as np
+from LineTables import LINE_TABLES, board_indexes_arrays
+from SearchPosition import NO_WINNER, ORDER_WON, CHAOS_WON
+
+BOARD_SIZE = 6
+CELLS_AMOUNT = BOARD_SIZE**2
+LINE_CELLS = 6
+SYMBOL_VALUES = {'circle': 1, 'cross': 2}
+NO_MOVE = -1
+
+
+def _index_matrix() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns lines cells indexes (lines x 6) built from `board_indexes_arrays()` - the arrays
+    `Bot._load_indexes_to_check()` loads, cells base-3 weights (0 for padding of shorter lines)
+    and line length of every line.
+    """
+
+    indexes_arrays = board_indexes_arrays(BOARD_SIZE)
+    indexes = np.zeros((len(indexes_arrays), LINE_CELLS), dtype=np.intp)
+    weights = np.zeros((len(indexes_arrays), LINE_CELLS), dtype=np.int32)
+    lengths = np.zeros(len(indexes_arrays), dtype=np.intp)
+    for line, array in enumerate(indexes_arrays):
+        indexes[line, :len(array)] = array
+        weights[line, :len(array)] = [3**position for position in range(len(array))]
+        lengths[line] = len(array)
+    return indexes, weights, lengths
+
+
+def _line_tables() -> dict[str, np.ndarray]:
+    """
+    Returns `LINE_TABLES` as arrays indexed by [line length, base-3 code].
+    """
+
+    codes = 3**LINE_CELLS
+    tables = {
+        'win': np.zeros((LINE_CELLS + 1, codes), dtype=bool),
+        'winnability': np.zeros((LINE_CELLS + 1, codes), dtype=bool),
+        'closest_symbol': np.zeros((LINE_CELLS + 1, codes), dtype=np.int8),
+        'closest_count': np.zeros((LINE_CELLS + 1, codes), dtype=np.int8),
+        'chaos_position': np.full((LINE_CELLS + 1, codes), NO_MOVE, dtype=np.int8),
+        'chaos_symbol': np.zeros((LINE_CELLS + 1, codes), dtype=np.int8),
+        'order_candidates': np.zeros((LINE_CELLS + 1, codes, LINE_CELLS), dtype=bool),
+    }
+    for length, table in LINE_TABLES.items():
+        for code in range(3**length):
+            tables['win'][length, code] = table.win[code]
+            tables['winnability'][length, code] = table.winnability[code]
+            symbol, count = table.closest[code]
+            tables['closest_symbol'][length, code] = SYMBOL_VALUES[symbol]
+            tables['closest_count'][length, code] = count
+            if table.chaos_reply[code] is not None:
+                position, chaos_symbol = table.chaos_reply[code]
+                tables['chaos_position'][length, code] = position
+                tables['chaos_symbol'][length, code] = SYMBOL_VALUES[chaos_symbol]
+            candidates = table.order_reply[code][0]
+            tables['order_candidates'][length, code, list(candidates)] = True
+    return tables
+
+
+# lines x 6 matrix of lines cells indexes, built once on import
+LINES_INDEXES, LINES_WEIGHTS, LINES_LENGTHS = _index_matrix()
+TABLES = _line_tables()
+
+
+def _check_boards(boards) -> np.ndarray:
+    """
+    Returns boards as (N, 36) uint8 array.
+
+    Raises
+    ------
+    ValueError
+        If boards shape is not (N, 36) or values are not 0, 1, 2
+    """
+
+    boards = np.asarray(boards, dtype=np.uint8)
+    if boards.ndim != 2 or boards.shape[1] != CELLS_AMOUNT:
+        raise ValueError(f"boards shape should be (N, {CELLS_AMOUNT}), not {boards.shape}")
+    if boards.size and boards.max() > 2:
+        raise ValueError("boards values should be 0, 1 or 2")
+    return boards
+
+
+def line_codes(boards) -> np.ndarray:
+    """
+    Returns base-3 code of every line of every board.
+
+    Parameters
+    ----------
+    boards: np.ndarray
+        Boards cells values, shape (N, 36)
+
+    Returns
+    -------
+    np.ndarray
+        Lines codes, shape (N, lines)
+    """
+
+    boards = _check_boards(boards)
+    return (boards[:, LINES_INDEXES] * LINES_WEIGHTS).sum(axis=2, dtype=np.int32)
+
+
+def evaluate_boards(boards) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns winners and numbers of still winnable lines of boards.
+    Winners are decided like `Bot.check_winning()` - order wins with a won line,
+    chaos wins when no line is winnable.
+
+    Parameters
+    ----------
+    boards: np.ndarray
+        Boards cells values, shape (N, 36)
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray)
+        > Winners - NO_WINNER, ORDER_WON or CHAOS_WON, shape (N,)
+        > Numbers of winnable lines, shape (N,)
+    """
+
+    return _evaluate_codes(line_codes(boards))
+
+
+def _evaluate_codes(codes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns winners and numbers of winnable lines of boards with given lines codes.
+    """
+
+    won = TABLES['win'][LINES_LENGTHS, codes].any(axis=1)
+    winnable_counts = TABLES['winnability'][LINES_LENGTHS, codes].sum(axis=1)
+    winners = np.full(len(codes), NO_WINNER, dtype=np.int8)
+    winners[winnable_counts == 0] = CHAOS_WON
+    winners[won] = ORDER_WON
+    return winners, winnable_counts
+
+
+def hard_moves(boards, order_to_move=None, rng: np.random.Generator = None) -> np.ndarray:
+    """
+    Returns "hard" difficulty moves for every board, the same `Bot` would make:
+    the first winnable line closest to win is picked, chaos blocks it with the precomputed reply,
+    order adds a symbol to its middle. Order moves on empty board are random.
+
+    Parameters
+    ----------
+    boards: np.ndarray
+        Boards cells values, shape (N, 36)
+    order_to_move: np.ndarray | bool, optional
+        True for boards with order to move (deafult None - order moves on even number of symbols)
+    rng: np.random.Generator, optional
+        Random generator for random choices (deafult None - new generator)
+
+    Returns
+    -------
+    np.ndarray
+        Moves - (cell index, symbol value), shape (N, 2),
+        (NO_MOVE, NO_MOVE) for boards with no winnable line
+    """
+
+    boards = _check_boards(boards)
+    return _hard_moves(boards, line_codes(boards), order_to_move, rng)
+
+
+def _hard_moves(boards: np.ndarray, codes: np.ndarray, order_to_move, rng: np.random.Generator) -> np.ndarray:
+    """
+    Returns "hard" moves for boards with given lines codes.
+    """
+
+    if rng is None:
+        rng = np.random.default_rng()
+    boards_amount = len(boards)
+    if order_to_move is None:
+        order_to_move = np.count_nonzero(boards, axis=1) % 2 == 0
+    order_to_move = np.broadcast_to(np.asarray(order_to_move, dtype=bool), (boards_amount,))
+
+    counts = np.where(TABLES['winnability'][LINES_LENGTHS, codes], TABLES['closest_count'][LINES_LENGTHS, codes], -1)
+    lines = counts.argmax(axis=1)  # first line with the highest count, like `Bot`
+    rows = np.arange(boards_amount)
+    lengths = LINES_LENGTHS[lines]
+    line_code = codes[rows, lines]
+    line_indexes = LINES_INDEXES[lines]
+    closest_symbol = TABLES['closest_symbol'][lengths, line_code]
+
+    # chaos - precomputed reply, random middle cell if every middle cell is as good
+    chaos_position = TABLES['chaos_position'][lengths, line_code].astype(np.intp)
+    chaos_symbol = TABLES['chaos_symbol'][lengths, line_code]
+    random_middle = chaos_position == NO_MOVE
+    chaos_position[random_middle] = rng.integers(1, 4, size=np.count_nonzero(random_middle))
+    chaos_symbol = np.where(random_middle, closest_symbol, chaos_symbol)
+
+    # order - random candidate position of the line
+    candidates = TABLES['order_candidates'][lengths, line_code]
+    order_position = (rng.random((boards_amount, LINE_CELLS)) * candidates).argmax(axis=1)
+
+    positions = np.where(order_to_move, order_position, chaos_position)
+    moves = np.empty((boards_amount, 2), dtype=np.int16)
+    moves[:, 0] = line_indexes[rows, positions]
+    moves[:, 1] = np.where(order_to_move, closest_symbol, chaos_symbol)
+
+    # order starting move is random, for more game diversity
+    empty_boards = order_to_move & ~boards.any(axis=1)
+    if empty_boards.any():
+        moves[empty_boards, 0] = rng.integers(0, CELLS_AMOUNT, size=np.count_nonzero(empty_boards))
+        moves[empty_boards, 1] = rng.integers(1, 3, size=np.count_nonzero(empty_boards))
+    moves[counts.max(axis=1, initial=-1) < 0] = NO_MOVE
+    return moves
+
+
+def evaluate_batch(boards, order_to_move=None, rng: np.random.Generator = None) \
+        -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Evaluates many games at once - winners, numbers of winnable lines and "hard" moves.
+
+    Raises
+    ------
+    ValueError
+        If boards shape is not (N, 36) or values are not 0, 1, 2
+
+    Parameters
+    ----------
+    boards: np.ndarray
+        Boards cells values, shape (N, 36), uint8
+    order_to_move: np.ndarray | bool, optional
+        True for boards with order to move (deafult None - order moves on even number of symbols)
+    rng: np.random.Generator, optional
+        Random generator for random choices (deafult None - new generator)
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray, np.ndarray)
+        > Winners - NO_WINNER, ORDER_WON or CHAOS_WON, shape (N,)
+        > Numbers of winnable lines, shape (N,)
+        > "hard" moves (see `hard_moves()`), (NO_MOVE, NO_MOVE) for finished games, shape (N, 2)
+    """
+
+    boards = _check_boards(boards)
+    codes = line_codes(boards)
+    winners, winnable_counts = _evaluate_codes(codes)
+    moves = _hard_moves(boards, codes, order_to_move, rng)
+    moves[winners != NO_WINNER] = NO_MOVE
+    return winners, winnable_counts, moves
+
+
+def _cell_weights() -> np.ndarray:
+    """
+    Returns base-3 weight of every cell in every line (0 if the cell is not in the line), shape (36, lines).
+    """
+
+    weights = np.zeros((CELLS_AMOUNT, len(LINES_INDEXES)), dtype=np.int32)
+    for line, (indexes, line_weights, length) in enumerate(zip(LINES_INDEXES, LINES_WEIGHTS, LINES_LENGTHS)):
+        weights[indexes[:length], line] = line_weights[:length]
+    return weights
+
+
+# 36 x lines matrix of cells weights in lines codes, a move adds symbol value times its row to lines codes
+CELLS_WEIGHTS = _cell_weights()
+# line state of [line length * 3**6 + code] - won, not winnable or still winnable, one lookup per line
+LINE_WON, LINE_DEAD, LINE_OPEN = 2, 1, 0
+LINES_STATES = np.where(TABLES['win'], LINE_WON, np.where(TABLES['winnability'], LINE_OPEN, LINE_DEAD)) \
+    .astype(np.uint8).ravel()
+LINES_OFFSETS = (LINES_LENGTHS * 3**LINE_CELLS).astype(np.int32)
+
+
+def random_playouts(boards, rng: np.random.Generator = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Plays random moves (random empty cell, random symbol) on every board in lockstep
+    until every game ends. Lines codes are updated by every move and won or dead lines
+    are checked in line tables, finished games are dropped from next steps.
+
+    Raises
+    ------
+    ValueError
+        If boards shape is not (N, 36) or values are not 0, 1, 2
+
+    Parameters
+    ----------
+    boards: np.ndarray
+        Boards cells values, shape (N, 36)
+    rng: np.random.Generator, optional
+        Random generator for random moves (deafult None - new generator)
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray)
+        > Winners - ORDER_WON or CHAOS_WON, shape (N,)
+        > Numbers of played moves, shape (N,)
+    """
+
+    boards = _check_boards(boards)
+    if rng is None:
+        rng = np.random.default_rng()
+    boards_amount = len(boards)
+    codes = line_codes(boards)
+    winners, _ = _evaluate_codes(codes)
+    plies = np.zeros(boards_amount, dtype=np.int16)
+
+    # every board plays its empty cells in random order, occupied cells are sorted last
+    keys = rng.random((boards_amount, CELLS_AMOUNT))
+    keys[boards != 0] = 2.0
+    cells_order = keys.argsort(axis=1)
+    symbols = rng.integers(1, 3, size=(boards_amount, CELLS_AMOUNT), dtype=np.int32)
+
+    active = np.flatnonzero(winners == NO_WINNER)
+    # codes are kept with line length offsets, so lines states are one flat lookup
+    codes = codes[active] + LINES_OFFSETS
+    step = 0
+    while len(active):
+        cells = cells_order[active, step]
+        codes += symbols[active, step, np.newaxis] * CELLS_WEIGHTS[cells]
+        step += 1
+        states = LINES_STATES.take(codes)
+        won = states.max(axis=1) == LINE_WON
+        dead = states.min(axis=1) == LINE_DEAD
+        finished = won | dead
+        if finished.any():
+            finished_boards = active[finished]
+            winners[finished_boards] = np.where(won[finished], ORDER_WON, CHAOS_WON)
+            plies[finished_boards] = step
+            active = active[~finished]
+            codes = codes[~finished]
+    return winners, plies
+
+
+def playout_statistics(values, playouts: int, rng: np.random.Generator = None,
+                       batch_size: int = 4096) -> dict:
+    """
+    Runs random playouts from one position and returns outcome statistics.
+
+    Parameters
+    ----------
+    values: list[int] | np.ndarray
+        Board cells values
+    playouts: int
+        Number of playouts
+    rng: np.random.Generator, optional
+        Random generator for random moves (deafult None - new generator)
+    batch_size: int, optional
+        Number of playouts played in lockstep (deafult 4096)
+
+    Returns
+    -------
+    dict
+        Statistics
+            > "playouts" - number of playouts
+            > "order_wins", "chaos_wins" - number of playouts won by each side
+            > "order_win_rate" - part of playouts won by order
+            > "average_plies" - average number of moves played
+    """
+
+    if rng is None:
+        rng = np.random.default_rng()
+    board = _check_boards(np.asarray(values).reshape(1, CELLS_AMOUNT))
+    order_wins = 0
+    total_plies = 0
+    for start in range(0, playouts, batch_size):
+        amount = min(batch_size, playouts - start)
+        winners, plies = random_playouts(np.repeat(board, amount, axis=0), rng)
+        order_wins += int(np.count_nonzero(winners == ORDER_WON))
+        total_plies += int(plies.sum())
+    return {
+        "playouts": playouts,
+        "order_wins": order_wins,
+        "chaos_wins": playouts - order_wins,
+        "order_win_rate": order_wins / playouts if playouts else 0.0,
+        "average_plies": total_plies / playouts if playouts else 0.0,
+        }
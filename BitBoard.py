@@ -0,0 +1,244 @@
+class BitBoard(list):
+    """
+    A class representing the board position as bitboards.
+    Behaves like the plain board list (list view of cell values), but every
+    cell change is mirrored to three integer bitmasks, bit `i` standing for cell `i`.
+
+    ...
+
+    Attributes
+    ----------
+    circles: int
+        Bitmask of cells containing circle
+    crosses: int
+        Bitmask of cells containing cross
+    occupied: int
+        Bitmask of cells that are not empty (circles | crosses)
+
+    Methods
+    -------
+    place(index: int, value: int)
+        Sets an empty cell to given symbol value.
+    remove(index: int)
+        Sets a cell back to empty.
+    reset(size: int)
+        Resets the board to given amount of empty cells.
+    is_empty(index: int)
+        Checks if cell is empty.
+    """
+
+    __slots__ = ('circles', 'crosses', 'occupied')
+
+    def __init__(self, values=()) -> None:
+        """
+        Parameters
+        ----------
+        values: Iterable[int], optional
+            Starting cell values (deafult empty board)
+        """
+
+        super().__init__(values)
+        self._recalculate()
+
+    def place(self, index: int, value: int) -> None:
+        """
+        Sets cell by given index to given symbol value.
+        Does not check if the cell is empty - caller's responsibility.
+
+        Parameters
+        ----------
+        index: int
+            Index of a cell
+        value: int
+            Symbol value
+                > 1 - circle
+                > 2 - cross
+        """
+
+        list.__setitem__(self, index, value)
+        bit = 1 << index
+        if value == 1:
+            self.circles |= bit
+        elif value == 2:
+            self.crosses |= bit
+        self.occupied = self.circles | self.crosses
+
+    def remove(self, index: int) -> None:
+        """
+        Sets cell by given index to empty (0).
+
+        Parameters
+        ----------
+        index: int
+            Index of a cell
+        """
+
+        list.__setitem__(self, index, 0)
+        bit = ~(1 << index)
+        self.circles &= bit
+        self.crosses &= bit
+        self.occupied &= bit
+
+    def reset(self, size: int) -> None:
+        """
+        Resets the board to given amount of empty cells.
+
+        Parameters
+        ----------
+        size: int
+            Number of board cells
+        """
+
+        list.clear(self)
+        list.extend(self, [0] * size)
+        self.circles = 0
+        self.crosses = 0
+        self.occupied = 0
+
+    def is_empty(self, index: int) -> bool:
+        """
+        Returns
+        -------
+        bool
+            True if cell by given index is empty, else False
+        """
+
+        return not self.occupied >> index & 1
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        if isinstance(index, slice):
+            self._recalculate()
+            return
+        index %= len(self)
+        self.remove(index)
+        if value != 0:
+            self.place(index, value)
+
+    def append(self, value: int) -> None:
+        super().append(value)
+        if value != 0:
+            self.place(len(self) - 1, value)
+
+    def extend(self, values) -> None:
+        super().extend(values)
+        self._recalculate()
+
+    def clear(self) -> None:
+        super().clear()
+        self._recalculate()
+
+    def _recalculate(self) -> None:
+        """
+        Rebuilds bitmasks from the list values.
+        """
+
+        self.circles = 0
+        self.crosses = 0
+        for index, value in enumerate(self):
+            if value == 1:
+                self.circles |= 1 << index
+            elif value == 2:
+                self.crosses |= 1 << index
+        self.occupied = self.circles | self.crosses
+
+
+def cells_mask(indexes: list[int]) -> int:
+    """
+    Returns bitmask of given cells indexes.
+
+    Parameters
+    ----------
+    indexes: list[int]
+        Board cells indexes
+
+    Returns
+    -------
+    int
+        Bitmask with bits of given cells set
+    """
+
+    mask = 0
+    for index in indexes:
+        mask |= 1 << index
+    return mask
+
+
+def line_windows(indexes: list[int]) -> tuple[tuple[int, int], ...]:
+    """
+    Returns five-cell windows of a line (row/column/diagonal) as bitmasks.
+    Each window is paired with the mask of line cells lying outside of it,
+    because a six in a row is not a win.
+
+    Parameters
+    ----------
+    indexes: list[int]
+        Line cells indexes
+
+    Returns
+    -------
+    tuple[tuple[int, int], ...]
+        Pairs (window mask, outside mask)
+    """
+
+    line = cells_mask(indexes)
+    windows = []
+    for start in range(len(indexes) - 4):
+        window = cells_mask(indexes[start:start+5])
+        windows.append((window, line & ~window))
+    return tuple(windows)
+
+
+def check_line_win(circles: int, crosses: int, windows: tuple[tuple[int, int], ...]) -> bool:
+    """
+    Checks if line is won - exactly five same symbols in a row.
+
+    Parameters
+    ----------
+    circles: int
+        Circles bitmask
+    crosses: int
+        Crosses bitmask
+    windows: tuple[tuple[int, int], ...]
+        Line windows from `line_windows()`
+
+    Returns
+    -------
+    bool
+        True if line is won, else False
+    """
+
+    for window, outside in windows:
+        if circles & window == window and not circles & outside:
+            return True
+        if crosses & window == window and not crosses & outside:
+            return True
+    return False
+
+
+def check_line_winnability(circles: int, crosses: int, windows: tuple[tuple[int, int], ...]) -> bool:
+    """
+    Checks if line is still winnable - some window can be filled
+    with one symbol without making six in a row.
+
+    Parameters
+    ----------
+    circles: int
+        Circles bitmask
+    crosses: int
+        Crosses bitmask
+    windows: tuple[tuple[int, int], ...]
+        Line windows from `line_windows()`
+
+    Returns
+    -------
+    bool
+        False if line is not winnable, else True
+    """
+
+    for window, outside in windows:
+        if not crosses & window and not circles & outside:
+            return True
+        if not circles & window and not crosses & outside:
+            return True
+    return False
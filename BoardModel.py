@@ -0,0 +1,309 @@
+from BitBoard import BitBoard
+
+
+class BoardModel:
+    """
+    A class representing the game board state and geometry, without rendering.
+    It does not import pygame, so game rules can be used by headless tools (bot tests, simulators).
+
+    ...
+
+    Attributes
+    ----------
+    BOARD_SIZE: int
+        The board size (constant = 6)
+    board: BitBoard
+        List storing the board info, mirrored to circles/crosses bitmasks:
+            > EMPTY = 0
+            > CIRCLE = 1
+            > CROSS = 2
+    moves: list[tuple[int, str]]
+        History of made moves (cell index, symbol), last move on top
+    undone_moves: list[tuple[int, str]]
+        Stack of undone moves that can be redone, next move to redo on top
+    CELL_SIZE: int
+        The board cell size
+    BOARD_RENDER_MARGIN: tuple[int, int]
+        The starting point of board rendering
+    CELL_SPACING: int
+        The gap between two board cells
+
+    Methods
+    -------
+    set_up_board()
+        Resets the board.
+    symbol_size()
+        Returns size symbols images are rendered in.
+    cell_box(cell_index: int)
+        Returns screen box of a cell.
+    board()
+        Returns the board list.
+    calculate_cell_index(mouse_position: tuple[int, int])
+        Calculates the board cell that contains mouse position.
+    update(cell_index: int, symbol: str)
+        Updates the board cell by given index to a given symbol.
+    undo_moves(moves: list[int])
+        Undoes the given moves.
+    undo_move()
+        Undoes the last move.
+    redo_move()
+        Redoes the last undone move.
+    go_to_move(move_number: int)
+        Undoes or redoes moves until given number of moves is made.
+    """
+
+    def __init__(self) -> None:
+        self._BOARD_SIZE = 6
+        self._board = BitBoard()
+        self._moves = []
+        self._undone_moves = []
+        self._CELL_SIZE = 96
+        self._BOARD_RENDER_MARGIN = (42, 42)
+        self._CELL_SPACING = 12
+
+    def set_up_board(self) -> None:
+        """
+        Resets the board - sets the list values to zeros.
+        """
+
+        self._board.reset(self._BOARD_SIZE**2)
+        self._moves.clear()
+        self._undone_moves.clear()
+        self._board_changed()
+
+    def symbol_size(self) -> tuple[int, int]:
+        """
+        Returns
+        -------
+        tuple[int, int]
+            Size symbols images are rendered in (board cell size)
+        """
+
+        return (self._CELL_SIZE, self._CELL_SIZE)
+
+    def cell_box(self, cell_index: int) -> tuple[int, int, int, int]:
+        """
+        Returns screen box of a cell.
+
+        Parameters
+        ----------
+        cell_index: int
+            Index of a cell
+
+        Returns
+        -------
+        tuple[int, int, int, int]
+            The cell box (x, y, width, height)
+        """
+
+        start_X = (cell_index % self._BOARD_SIZE) * (self._CELL_SIZE + self._CELL_SPACING) + self._BOARD_RENDER_MARGIN[0]
+        start_Y = (cell_index // self._BOARD_SIZE) * (self._CELL_SIZE + self._CELL_SPACING) + self._BOARD_RENDER_MARGIN[1]
+        return (start_X, start_Y, self._CELL_SIZE, self._CELL_SIZE)
+
+    def _cell_changed(self, cell_index: int) -> None:
+        """
+        Called after a cell changes, overridden by renderer.
+        """
+
+    def _board_changed(self) -> None:
+        """
+        Called after the whole board changes, overridden by renderer.
+        """
+
+    @property
+    def board(self) -> BitBoard:
+        """
+        Returns
+        -------
+        BitBoard
+            The board values (list view of the position bitboards).
+        """
+
+        return self._board
+
+    @property
+    def moves(self) -> list[tuple[int, str]]:
+        """
+        Returns
+        -------
+        list[tuple[int, str]]
+            History of made moves (cell index, symbol).
+        """
+
+        return self._moves
+
+    @property
+    def undone_moves(self) -> list[tuple[int, str]]:
+        """
+        Returns
+        -------
+        list[tuple[int, str]]
+            Undone moves that can be redone, next move to redo is the last one.
+        """
+
+        return self._undone_moves
+
+    def calculate_cell_index(self, mouse_position: tuple[int, int]) -> tuple[bool, int]:
+        """
+        Calculates the board cell that contains mouse position.
+
+        Parameters
+        ----------
+        mouse_position: tuple[int, int]
+            The mouse position
+
+        Returns
+        -------
+        (bool, int)
+            > True if one of board cell contains mouse position
+            > Index of calculated cell
+        """
+
+        mouse_x = mouse_position[0]
+        mouse_y = mouse_position[1]
+        index_x = (mouse_x - self._BOARD_RENDER_MARGIN[0])//(self._CELL_SIZE + self._CELL_SPACING)
+        if index_x < 0 or index_x > self._BOARD_SIZE - 1:
+            return False, 0
+        if mouse_x - self._BOARD_RENDER_MARGIN[0] > (index_x+1) * (self._CELL_SIZE + self._CELL_SPACING) - self._CELL_SPACING:
+            return False, 0
+
+        index_y = (mouse_y - self._BOARD_RENDER_MARGIN[1])//(self._CELL_SIZE + self._CELL_SPACING)
+        if index_y < 0 or index_y > self._BOARD_SIZE - 1:
+            return False, 0
+        if mouse_y - self._BOARD_RENDER_MARGIN[1] > (index_y+1) * (self._CELL_SIZE + self._CELL_SPACING) - self._CELL_SPACING:
+            return False, 0
+
+        cell_index = index_x + index_y * self._BOARD_SIZE
+
+        return True, cell_index
+
+    def update(self, cell_index: int, symbol: str) -> bool:
+        """
+        Updates the board cell by given index to a given symbol.
+        The move is added to moves history and undone moves can no longer be redone.
+
+        Parameters
+        ----------
+        cell_index: int
+            Index of a cell
+        symbol: str
+            Symbol that the cell will be set to
+        """
+
+        if cell_index < 0 or cell_index > self._BOARD_SIZE**2 - 1:  # index out of range
+            return False
+        if not self._board.is_empty(cell_index):  # cell is already cross or circle
+            return False
+
+        if symbol == "cross":
+            self._board.place(cell_index, 2)
+        elif symbol == "circle":
+            self._board.place(cell_index, 1)
+        else:
+            return False
+        self._moves.append((cell_index, symbol))
+        self._undone_moves.clear()
+        self._cell_changed(cell_index)
+        return True
+
+    def undo_moves(self, moves: list[int]) -> None:
+        """
+        Undoes the given moves.
+
+        Raises
+        ------
+        IndexError
+            If move index is incorrect
+        ValueError
+            If move was not done yet
+
+        Parameters
+        ----------
+        moves: list[int]
+            List of moves to undo
+        """
+
+        for move_index in moves:
+            if move_index < 0 or move_index >= self._BOARD_SIZE**2:
+                raise IndexError
+            if self._board.is_empty(move_index):
+                raise ValueError
+            self._board.remove(move_index)
+            self._cell_changed(move_index)
+            for history_index in range(len(self._moves) - 1, -1, -1):
+                if self._moves[history_index][0] == move_index:
+                    del self._moves[history_index]
+                    break
+
+    def undo_move(self) -> tuple[int, str]:
+        """
+        Undoes the last move and puts it on undone moves stack.
+
+        Raises
+        ------
+        IndexError
+            If there is no move to undo
+
+        Returns
+        -------
+        (int, str)
+            Undone move (cell index, symbol)
+        """
+
+        move = self._moves.pop()
+        self._board.remove(move[0])
+        self._cell_changed(move[0])
+        self._undone_moves.append(move)
+        return move
+
+    def redo_move(self) -> tuple[int, str]:
+        """
+        Redoes the last undone move.
+
+        Raises
+        ------
+        IndexError
+            If there is no move to redo
+
+        Returns
+        -------
+        (int, str)
+            Redone move (cell index, symbol)
+        """
+
+        move = self._undone_moves.pop()
+        self._board.place(move[0], 1 if move[1] == "circle" else 2)
+        self._cell_changed(move[0])
+        self._moves.append(move)
+        return move
+
+    def go_to_move(self, move_number: int) -> tuple[list[tuple[int, str]], list[tuple[int, str]]]:
+        """
+        Undoes or redoes moves until given number of moves is made (scrubs moves history).
+
+        Raises
+        ------
+        IndexError
+            If move number is negative or greater than number of made and undone moves
+
+        Parameters
+        ----------
+        move_number: int
+            Number of moves that should be made after the call
+
+        Returns
+        -------
+        (list[tuple[int, str]], list[tuple[int, str]])
+            > Undone moves in order of undoing
+            > Redone moves in order of redoing
+        """
+
+        if move_number < 0 or move_number > len(self._moves) + len(self._undone_moves):
+            raise IndexError
+        undone = []
+        redone = []
+        while len(self._moves) > move_number:
+            undone.append(self.undo_move())
+        while len(self._moves) < move_number:
+            redone.append(self.redo_move())
+        return undone, redone
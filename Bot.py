@@ -1,4 +1,14 @@
 import random
+import threading
+import time
+from BitBoard import BitBoard
+from AlphaBeta import AlphaBetaSearch
+from LazySmp import LazySmpSearch
+from MonteCarlo import MonteCarloTreeSearch
+from Pondering import Ponderer
+from Tablebase import Tablebase
+from ThreatSpace import ThreatSpaceSearch
+from LineTables import LINE_TABLES, CROSSES_KEY_SHIFT, encode_array, line_lookups, board_indexes_arrays, board_cells_arrays
 
 
 class NoEmptyCellsFoundException(Exception):
@@ -29,16 +39,62 @@ class Bot:
 
     Attributes
     ----------
-    board: list[int]
-        Reference to GameBoard board list with symbols
+    board: BitBoard
+        Reference to GameBoard board with symbols
     BOARD_SIZE: int, constant
         One of board's dimension size (board is always square)
     difficulty: str
         Bot difficulty
             > "easy"
             > "hard"
+            > "expert"
+            > "mcts"
+    search: AlphaBetaSearch | LazySmpSearch | None
+        Alpha-beta search used by "expert" difficulty, created when the difficulty is set
+    search_depth: int
+        Maximum depth (in plies) of "expert" iterative deepening search
+    search_time_budget: float | None
+        Deafult time (in seconds) "expert" search can take, None for no limit
+    table_size_megabytes: float
+        Memory size of "expert" search transposition table
+    search_threads: int
+        Number of "expert" search threads (more than one - Lazy SMP search)
+    cancel_event: threading.Event
+        Event that stops running "expert" search, cleared when the move ends
+    cancel_lock: threading.Lock
+        Lock of `cancel_event` and `moving` changes
+    moving: bool
+        True while `make_move()` runs, cancelling has no effect otherwise
+    ponderer: Ponderer | None
+        "expert" search of bot replies during opponent's turn, created on first pondering
+    monte_carlo: MonteCarloTreeSearch | None
+        Monte Carlo tree search used by "mcts" difficulty, created when the difficulty is set
+    last_search_stats: tuple[AlphaBetaSearch | LazySmpSearch | MonteCarloTreeSearch, dict] | None
+        Search that made the last "expert" or "mcts" move and its statistics taken when the move ended
+    monte_carlo_workers: int
+        Number of "mcts" worker processes (root parallelization)
+    monte_carlo_playouts: int
+        Playouts per worker of "mcts" move made without time budget
+    tablebase: Tablebase | None
+        Endgame tablebase with perfect moves of late game positions, used by every difficulty but "easy"
+    threat_search: ThreatSpaceSearch
+        Search of forcing order wins run by "expert" order before alpha-beta search
     indexes_arrays: list[list[int]]
         List that hold lists of indexes of board cells for winning checking
+    arrays_ids: list[int]
+        Ids of `indexes_arrays` arrays (their order in `load_indexes_to_check()`)
+    arrays_alive: list[bool]
+        True for every array id that is still in `indexes_arrays` (is winnable)
+    arrays_lookups: list[tuple[int, dict, LineTable]]
+        Lookups of every array id - (array bitmask, key->code lookup, line table)
+    arrays_codes: list[int]
+        Current base-3 code of every array id, updated incrementally on each move
+    cells_arrays: list[tuple[tuple[int, int], ...]]
+        Arrays going through each cell - (array id, weight of the cell in array code)
+    loaded_indexes_arrays: list[list[int]]
+        Every array loaded by `load_indexes_to_check()`, indexed by array id
+    moves_stack: list[tuple[int, int, tuple[int, ...]]]
+        Moves applied to arrays codes - (cell index, symbol value, ids of arrays made unwinnable)
     first_move: bool
         Variable needed for bot first move as `order` because the begining move is random
 
@@ -52,12 +108,38 @@ class Bot:
         Checks if game should end and return winner.
     make_move()
         Makes bot moves depending on given role and bot difficulty.
+    set_transposition_table_size()
+        Sets memory size of "expert" search transposition table.
+    set_search_limits()
+        Sets maximum depth and deafult time budget of "expert" search.
+    set_search_threads()
+        Sets number of "expert" search threads.
+    set_monte_carlo_workers()
+        Sets number of "mcts" worker processes.
+    set_monte_carlo_playouts()
+        Sets playouts of "mcts" move made without time budget.
+    set_tablebase()
+        Sets endgame tablebase.
+    search_stats()
+        Returns statistics of the last "expert" or "mcts" search.
+    clear_search_cache()
+        Clears "expert" search results kept between games.
+    cancel_move()
+        Stops running bot move search.
+    start_pondering()
+        Starts searching bot replies during opponent's turn.
+    stop_pondering()
+        Stops searching during opponent's turn.
     undo_moves()
         Resets bot indexes_array after undoing moves.
+    undo_move()
+        Unmakes the last move from moves stack.
     get_board_values_array()
         Gets board values from array of indexes.
     load_indexes_to_check()
         Loads arrays of indexes that needs to be check for game win.
+    load_arrays_codes()
+        Calculates base-3 codes of every array from board.
     find_arrays_closest_to_win()
         Returns arrays of indexes closest to winning.
     pick_optimal_cell_chaos()
@@ -66,6 +148,14 @@ class Bot:
         Returns optimal order move.
     pick_random_cell()
         Return random move.
+    pick_expert_cell()
+        Returns threat-space or alpha-beta search move.
+    create_search()
+        Returns new "expert" search.
+    close_search()
+        Shuts "expert" search and pondering threads down.
+    pick_monte_carlo_cell()
+        Returns Monte Carlo tree search move.
     amount_of_each_symbol_in_array()
         Returns number of each symbol in given array.
     split_array_into_subarrays()
@@ -76,28 +166,60 @@ class Bot:
         Checks if array is still winnable.
     update_arrays()
         Updates indexes_arrays based on their winnability. Returns True if one of arrays is a winning one.
+    update_arrays_with_move()
+        Updates arrays going through moved cell. Returns True if one of them is a winning one.
+    load_alive_arrays()
+        Loads indexes_arrays from arrays that are still alive.
     """
 
     def __init__(self) -> None:
-        self._board = []
+        self._board = BitBoard()
         self._BOARD_SIZE = 6
         self._dificulty = "hard"
+        self._search = None
+        self._search_depth = 6
+        self._search_time_budget = 1.0
+        self._table_size_megabytes = 16
+        self._search_threads = 1
+        self._cancel_event = threading.Event()
+        self._cancel_lock = threading.Lock()
+        self._moving = False
+        self._ponderer = None
+        self._monte_carlo = None
+        self._monte_carlo_workers = 1
+        self._monte_carlo_playouts = 2000
+        self._last_search_stats = None
+        self._tablebase = None
+        self._threat_search = ThreatSpaceSearch()
         self._indexes_arrays = []
+        self._arrays_ids = []
+        self._arrays_alive = []
+        self._arrays_lookups = []
+        self._arrays_codes = []
+        self._cells_arrays = []
+        self._loaded_indexes_arrays = []
+        self._moves_stack = []
         self._first_move = True
 
-    def load_board(self, board: list[int]) -> None:
+    def load_board(self, board: BitBoard) -> None:
         """
         Loads GameBoard board reference for bot moves and winning checking.
+        Plain list is copied into a new BitBoard (it is no longer a reference then).
 
         Parameters
         ----------
-        board: list[int]
+        board: BitBoard
             GameBoard board reference
         """
 
+        self.stop_pondering()
+        if not isinstance(board, BitBoard):
+            board = BitBoard(board)
         self._board = board
         self._load_indexes_to_check()
         self._first_move = True
+        if self._search is not None:
+            self._search.new_game()
 
     def set_difficulty(self, difficulty: str) -> None:
         """
@@ -106,7 +228,7 @@ class Bot:
         Raises
         ------
         ValueError
-            If given difficulty is not "easy" or "hard"
+            If given difficulty is not "easy", "hard", "expert" or "mcts"
 
         Parameters
         ----------
@@ -114,15 +236,198 @@ class Bot:
             Bot difficulty
                 > "easy"
                 > "hard"
+                > "expert"
+                > "mcts"
         """
 
-        if difficulty not in ("easy", "hard"):
+        if difficulty not in ("easy", "hard", "expert", "mcts"):
             raise ValueError
         self._dificulty = difficulty
+        if difficulty == "expert" and self._search is None:
+            self._search = self._create_search()
+        if difficulty == "mcts" and self._monte_carlo is None:
+            self._monte_carlo = MonteCarloTreeSearch(self._monte_carlo_workers)
+            self._monte_carlo.stop_event = self._cancel_event
 
-    def check_winning(self) -> str:
+    def set_transposition_table_size(self, size_megabytes: float) -> None:
+        """
+        Sets memory size of "expert" search transposition table.
+        Already created table is replaced by an empty one.
+
+        Parameters
+        ----------
+        size_megabytes: float
+            Table memory size
+        """
+
+        self._table_size_megabytes = size_megabytes
+        if self._search is not None:
+            self._close_search()
+            self._search = self._create_search()
+
+    def set_search_limits(self, depth: int, time_budget: float = None) -> None:
+        """
+        Sets maximum depth and deafult time budget of "expert" search.
+
+        Parameters
+        ----------
+        depth: int
+            Maximum search depth in plies
+        time_budget: float, optional
+            Time (in seconds) search can take, None for no limit (deafult None)
+        """
+
+        self._search_depth = depth
+        self._search_time_budget = time_budget
+
+    def set_search_threads(self, threads: int) -> None:
+        """
+        Sets number of "expert" search threads.
+        More than one thread runs Lazy SMP search sharing one transposition table.
+        Already created search is replaced by a new one.
+
+        Parameters
+        ----------
+        threads: int
+            Number of searching threads
+        """
+
+        self._search_threads = threads
+        if self._search is not None:
+            self._close_search()
+            self._search = self._create_search()
+
+    def set_monte_carlo_workers(self, workers: int) -> None:
+        """
+        Sets number of "mcts" worker processes.
+        Already running workers are shut down.
+
+        Parameters
+        ----------
+        workers: int
+            Number of worker processes (1 - search in bot process)
+        """
+
+        self._monte_carlo_workers = workers
+        if self._monte_carlo is not None:
+            self._monte_carlo.close()
+            self._monte_carlo = MonteCarloTreeSearch(workers)
+            self._monte_carlo.stop_event = self._cancel_event
+
+    def set_monte_carlo_playouts(self, playouts: int) -> None:
+        """
+        Sets playouts per worker of "mcts" move made without time budget.
+
+        Parameters
+        ----------
+        playouts: int
+            Number of playouts
+        """
+
+        self._monte_carlo_playouts = playouts
+
+    def set_tablebase(self, tablebase: Tablebase | None) -> None:
+        """
+        Sets endgame tablebase. Moves of positions found in it are played
+        without searching, by every difficulty but "easy".
+
+        Parameters
+        ----------
+        tablebase: Tablebase | None
+            Endgame tablebase, None to stop using it
+        """
+
+        self._tablebase = tablebase
+
+    def clear_search_cache(self) -> None:
+        """
+        Clears results of finished "expert" searches, which are kept between games
+        (see `AlphaBetaSearch.root_cache`). Bot moves of a game no longer depend on earlier games then.
+        """
+
+        if self._search is None:
+            return
+        search = self._search.main_search if isinstance(self._search, LazySmpSearch) else self._search
+        search.root_cache.clear()  # cleared in place, pondering search shares it
+
+    def search_stats(self) -> dict:
+        """
+        Returns statistics of the last search of current difficulty. Statistics of a move
+        are taken when it ends, so pondering that shares the table does not change them.
+
+        Returns
+        -------
+        dict
+            Search statistics (see `AlphaBetaSearch.stats()` and `MonteCarloTreeSearch.stats()`),
+            empty if bot never searched. After an "expert" move also:
+                > "engine" - "threat_space" if threat-space search found the move
+                  (statistics are `ThreatSpaceSearch.stats()` then), else "alpha_beta"
+                > "threat_nodes", "threat_time" - threat-space search run before alpha-beta
+        """
+
+        search = self._search
+        if self._dificulty == "mcts" and self._monte_carlo is not None:
+            search = self._monte_carlo
+        if search is None:
+            return {}
+        if self._last_search_stats is not None and self._last_search_stats[0] is search:
+            return dict(self._last_search_stats[1])
+        return search.stats()
+
+    def cancel_move(self) -> None:
+        """
+        Stops running `make_move()` call - "expert" and "mcts" searches return at once
+        with a move of lower quality, other difficulties do not search long anyway.
+        Meant for moves made in another thread, the result should be discarded.
+        Does nothing if no move is running (the next move is not affected) - requested
+        moves that have not started yet are cancelled by `make_move()` cancel token.
+        """
+
+        with self._cancel_lock:
+            if self._moving:
+                self._cancel_event.set()
+
+    def start_pondering(self, role: str) -> None:
+        """
+        Starts searching bot replies in background during opponent's turn ("expert" only).
+        Found moves and transposition table entries are reused by `make_move()` after
+        opponent's move. Pondering is stopped by `make_move()`, `load_board()` and undoing moves.
+
+        Parameters
+        ----------
+        role: str
+            Bot role
+        """
+
+        if self._dificulty != "expert" or self._search is None:
+            return
+        search = self._search.main_search if isinstance(self._search, LazySmpSearch) else self._search
+        if self._ponderer is None or self._ponderer.search.table is not search.table:
+            self.stop_pondering()
+            self._ponderer = Ponderer(search, self._search_depth)
+        self._ponderer.max_depth = self._search_depth
+        self._ponderer.start(self._board, role == "order")
+
+    def stop_pondering(self) -> None:
+        """
+        Stops searching during opponent's turn, returns once pondering thread has ended.
+        """
+
+        if self._ponderer is not None:
+            self._ponderer.stop()
+
+    def check_winning(self, last_move: tuple[int, str] = None) -> str:
         """
         Checks if game should end and return winner.
+        If last move is given, only arrays going through its cell are updated and checked,
+        otherwise every array is rescanned.
+
+        Parameters
+        ----------
+        last_move: (int, str), optional
+            Last move made on the board (already applied to GameBoard board)
+                > Index of GameBoard board cell
+                > Move symbol
 
         Returns
         -------
@@ -133,20 +438,33 @@ class Bot:
                 > "" - if no winner
         """
 
-        if self._update_arrays():
+        if last_move is None:
+            won = self._update_arrays()
+        else:
+            won = self._update_arrays_with_move(last_move[0], symbol_dict[last_move[1]])
+        if won:
             return "order"
         if len(self._indexes_arrays) == 0:
             return "chaos"
         return ""  # no winner yet
 
-    def make_move(self, role: str) -> tuple[int, str]:
+    def make_move(self, role: str, time_budget: float = None,
+                  cancel_token: threading.Event = None) -> tuple[int, str]:
         """
         Makes bot moves depending on given role and bot difficulty.
+        "expert" and "mcts" searches end within the time budget and return
+        the best move found so far, other difficulties do not search.
+        Positions found in the endgame tablebase are played perfectly without searching.
 
         Parameters
         ----------
         role: str
             Bot role
+        time_budget: float, optional
+            Time (in seconds) the move can take (deafult None - `search_time_budget` is used)
+        cancel_token: threading.Event, optional
+            Event of the move request set when it is cancelled - a move cancelled
+            before it started stops at once (deafult None)
 
         Returns
         -------
@@ -157,23 +475,76 @@ class Bot:
                 > "cross"
         """
 
-        if self._dificulty == "easy":
-            return self._pick_random_cell()
-        elif self._dificulty == "hard":
-            if role == "chaos":
-                return self._pick_optimal_cell_chaos()
-            elif role == "order":
-                return self._pick_optimal_cell_order()
+        self.stop_pondering()
+        with self._cancel_lock:
+            self._moving = True
+            if cancel_token is not None and cancel_token.is_set():  # cancelled before it started
+                self._cancel_event.set()
+        try:
+            if self._dificulty == "easy":
+                return self._pick_random_cell()
+            if self._tablebase is not None:
+                move = self._tablebase.best_move(self._board, role == "order")
+                if move is not None:
+                    return (move[0], symbol_dict[move[1]])
+            if self._dificulty == "hard":
+                if role == "chaos":
+                    return self._pick_optimal_cell_chaos()
+                elif role == "order":
+                    return self._pick_optimal_cell_order()
+            elif self._dificulty == "expert":
+                if time_budget is None:
+                    time_budget = self._search_time_budget
+                return self._pick_expert_cell(role, time_budget)
+            elif self._dificulty == "mcts":
+                if time_budget is None:
+                    time_budget = self._search_time_budget
+                return self._pick_monte_carlo_cell(role, time_budget)
+        finally:
+            with self._cancel_lock:
+                self._moving = False
+                self._cancel_event.clear()
 
     def undo_moves(self):
         """
         Resets bot indexes_array to deafult.
         Updates indexes_array to current GameBoard state.
+        Moves stack is cleared - use `undo_move()` to keep it.
         """
 
+        self.stop_pondering()
         self._load_indexes_to_check()
         self._update_arrays()
 
+    def undo_move(self) -> tuple[int, str]:
+        """
+        Unmakes the last move passed to `check_winning()`.
+        Restores arrays codes and brings back arrays the move made unwinnable.
+        GameBoard board is not read, so it can be called before or after undoing the move there.
+
+        Raises
+        ------
+        IndexError
+            If there is no move to undo on moves stack
+
+        Returns
+        -------
+        (int, str)
+            Undone move
+                > Index of GameBoard board cell
+                > Move symbol
+        """
+
+        self.stop_pondering()
+        cell_index, value, dead_arrays_ids = self._moves_stack.pop()
+        for array_id, weight in self._cells_arrays[cell_index]:
+            self._arrays_codes[array_id] -= value * weight
+        if dead_arrays_ids:
+            for array_id in dead_arrays_ids:
+                self._arrays_alive[array_id] = True
+            self._load_alive_arrays()
+        return (cell_index, symbol_dict[value])
+
     def _get_board_values_array(self, indexes_array: list[list[int]]) -> list[list[int]]:
         """
         Gets GameBoard board cells values based on indexes from array of indexes.
@@ -198,34 +569,26 @@ class Bot:
         Arrays are lists of columns/rows/diagonal GameBoard cells indexes.
         """
 
-        self._indexes_arrays.clear()
-        # checking columns:
-        for y in range(self._BOARD_SIZE):
-            array = []
-            for x in range(self._BOARD_SIZE):
-                array.append(y * self._BOARD_SIZE + x)
-            self._indexes_arrays.append(array)
-
-        # checking rows:
-        for x in range(self._BOARD_SIZE):
-            array = []
-            for y in range(self._BOARD_SIZE):
-                array.append(y * self._BOARD_SIZE + x)
-            self._indexes_arrays.append(array)
-
-        # checking diagonals:
-        array = [i for i in range(0, 36, 7)]
-        self._indexes_arrays.append(array)
-        array = [i for i in range(1, 30, 7)]
-        self._indexes_arrays.append(array)
-        array = [i for i in range(6, 35, 7)]
-        self._indexes_arrays.append(array)
-        array = [i for i in range(4, 25, 5)]
-        self._indexes_arrays.append(array)
-        array = [i for i in range(5, 31, 5)]
-        self._indexes_arrays.append(array)
-        array = [i for i in range(11, 32, 5)]
-        self._indexes_arrays.append(array)
+        self._indexes_arrays = board_indexes_arrays(self._BOARD_SIZE)
+        self._loaded_indexes_arrays = list(self._indexes_arrays)
+        self._moves_stack = []
+        self._arrays_ids = list(range(len(self._indexes_arrays)))
+        self._arrays_alive = [True] * len(self._indexes_arrays)
+        self._arrays_lookups = [line_lookups(tuple(array)) for array in self._indexes_arrays]
+        self._cells_arrays = board_cells_arrays(self._indexes_arrays, self._BOARD_SIZE**2)
+        self._load_arrays_codes()
+
+    def _load_arrays_codes(self) -> None:
+        """
+        Calculates base-3 codes of every array from GameBoard board bitmasks.
+        """
+
+        circles = self._board.circles
+        crosses = self._board.crosses
+        self._arrays_codes = [
+            lookup[(circles & array_mask) | (crosses & array_mask) << CROSSES_KEY_SHIFT]
+            for array_mask, lookup, _ in self._arrays_lookups
+            ]
 
     def _find_arrays_closest_to_win(self) -> list[dict]:
         """
@@ -238,21 +601,18 @@ class Bot:
                 > "symbol"
                 > "symbol_count"
                 > "indexes_array"
+                > "code"
+                > "table"
         """
 
-        def create_array_info(symbol: str, symbol_count: int, indexes_array: list) -> dict:
-            return {'symbol': symbol, 'symbol_count': symbol_count, 'indexes_array': indexes_array}
-
         arrays_closest_to_win = []
 
-        for indexes_array in self._indexes_arrays:
-            board_values_array = self._get_board_values_array(indexes_array)
-            symbol_count = self._amount_of_each_symbol_in_array(board_values_array)
-
-            if symbol_count['cross'] >= symbol_count['circle']:
-                array_info = create_array_info('cross', symbol_count['cross'], indexes_array)
-            else:
-                array_info = create_array_info('circle', symbol_count['circle'], indexes_array)
+        for indexes_array, array_id in zip(self._indexes_arrays, self._arrays_ids):
+            code = self._arrays_codes[array_id]
+            table = self._arrays_lookups[array_id][2]
+            symbol, symbol_count = table.closest[code]
+            array_info = {'symbol': symbol, 'symbol_count': symbol_count, 'indexes_array': indexes_array,
+                          'code': code, 'table': table}
 
             if arrays_closest_to_win:
                 current_max_symbol_count = arrays_closest_to_win[0]['symbol_count']
@@ -282,45 +642,24 @@ class Bot:
                 > "cross"
         """
 
-        def _return_oposite_symbol(symbol: str) -> str:
-            if symbol == "cross":
-                return "circle"
-            return "cross"
-
         arrays_closest_to_win = self._find_arrays_closest_to_win()
 
         if len(arrays_closest_to_win) == 0:
             raise NoArraysFoundException
 
-        for array_info in arrays_closest_to_win:
-            str_picked_symbol = _return_oposite_symbol(array_info['symbol'])
-            int_picked_symbol = symbol_dict[str_picked_symbol]
-            indexes_array = array_info['indexes_array']
-            board_values_array = self._get_board_values_array(indexes_array)
-            available_indexes = [index for index, cell_value in enumerate(board_values_array) if cell_value == 0]
-            for index in available_indexes:
-                board_values_array[index] = int_picked_symbol
-                if not self._check_array_winnability(board_values_array):
-                    return (indexes_array[index], str_picked_symbol)
-                board_values_array[index] = 0  # set cell value back to 0
-            str_picked_symbol = array_info['symbol']
-            int_picked_symbol = symbol_dict[str_picked_symbol]
-            if board_values_array[0] == 0:  # special case, when array winnability depends on first and last square
-                index = 0
-            elif board_values_array[-1] == 0:
-                index = -1
-            else:
-                # special case: only first and last squares arent 0 and they are not the same (1, 2)
-                # so making any move between <1, 4> index doesn't make an array unwinnable
-                # thus resulting in executing this lines of code
-                # bot can make a random move in this array -> player will make his move
-                # -> bot makes the array unwinnable
-                index = random.randrange(1, 4)
-                return (indexes_array[index], str_picked_symbol)
-            board_values_array[index] = int_picked_symbol
-            if self._check_array_win(board_values_array):
-                str_picked_symbol = _return_oposite_symbol(str_picked_symbol)
-            return (indexes_array[index], str_picked_symbol)
+        # first array is picked, chaos reply for its state is precomputed in line table
+        array_info = arrays_closest_to_win[0]
+        indexes_array = array_info['indexes_array']
+        chaos_reply = array_info['table'].chaos_reply[array_info['code']]
+        if chaos_reply is None:
+            # special case: only first and last squares arent 0 and they are not the same (1, 2)
+            # so making any move between <1, 4> index doesn't make an array unwinnable
+            # thus resulting in executing this lines of code
+            # bot can make a random move in this array -> player will make his move
+            # -> bot makes the array unwinnable
+            index = random.randrange(1, 4)
+            return (indexes_array[index], array_info['symbol'])
+        return (indexes_array[chaos_reply[0]], chaos_reply[1])
 
     def _pick_optimal_cell_order(self) -> tuple[int, str]:
         """
@@ -348,21 +687,118 @@ class Bot:
         if len(arrays_closest_to_win) == 0:
             raise NoArraysFoundException
         # always try to fill 'mid' squares first, then the 'outsiders'
-        for array_info in arrays_closest_to_win:
-            indexes_array = array_info['indexes_array']
-            picked_symbol = array_info['symbol']
-            board_values_array = self._get_board_values_array(indexes_array)
-            available_indexes = [index for index, cell in enumerate(board_values_array) if cell == 0]
-            available_middle_indexes = []
-            for index in available_indexes:
-                if index >= 1 and index <= 4:
-                    available_middle_indexes.append(index)
-            if available_middle_indexes:
-                index = available_middle_indexes[random.randrange(0, len(available_middle_indexes))]
-                return (indexes_array[index], picked_symbol)
-
-            index = available_indexes[random.randint(-1, 0)]
-            return (indexes_array[index], picked_symbol)
+        # candidates for each array state are precomputed in line table
+        array_info = arrays_closest_to_win[0]
+        indexes_array = array_info['indexes_array']
+        candidates, picked_symbol = array_info['table'].order_reply[array_info['code']]
+        index = candidates[random.randrange(0, len(candidates))]
+        return (indexes_array[index], picked_symbol)
+
+    def _pick_expert_cell(self, role: str, time_budget: float = None) -> tuple[int, str]:
+        """
+        Returns move found by alpha-beta search. Order first plays a forcing win
+        found by threat-space search, if there is one.
+
+        Raises
+        ------
+        NoEmptyCellsFoundException
+            If there is no empty cells in board to choose from.
+
+        Parameters
+        ----------
+        role: str
+            Bot role
+        time_budget: float, optional
+            Time (in seconds) the search can take (deafult None - no limit)
+
+        Returns
+        -------
+        (int, str)
+            > Index of GameBoard board cell
+            > Bot move symbol
+                > "circle"
+                > "cross"
+        """
+
+        deadline = None
+        if time_budget is not None:
+            deadline = time.perf_counter() + time_budget
+        if not ~self._board.occupied & ((1 << len(self._board)) - 1):
+            raise NoEmptyCellsFoundException
+        threat_nodes = 0
+        threat_time = 0.0
+        if role == "order":
+            line = self._threat_search.search(self._board, deadline)
+            if line is not None:
+                stats = self._threat_search.stats()
+                stats['engine'] = "threat_space"
+                self._last_search_stats = (self._search, stats)
+                cell_index, value = line[0]
+                return (cell_index, symbol_dict[value])
+            threat_nodes = self._threat_search.nodes
+            threat_time = self._threat_search.search_time
+        cell_index, value = self._search.search(self._board, role == "order", self._search_depth, deadline)
+        stats = self._search.stats()
+        stats['engine'] = "alpha_beta"
+        stats['threat_nodes'] = threat_nodes
+        stats['threat_time'] = threat_time
+        self._last_search_stats = (self._search, stats)
+        return (cell_index, symbol_dict[value])
+
+    def _create_search(self) -> AlphaBetaSearch | LazySmpSearch:
+        """
+        Returns new "expert" search for current threads number and table size.
+        """
+
+        if self._search_threads > 1:
+            search = LazySmpSearch(self._search_threads, self._table_size_megabytes)
+            search.main_search.stop_event = self._cancel_event
+        else:
+            search = AlphaBetaSearch(self._table_size_megabytes)
+            search.stop_event = self._cancel_event
+        return search
+
+    def _close_search(self) -> None:
+        """
+        Shuts pondering and helper threads of Lazy SMP search down.
+        """
+
+        self.stop_pondering()
+        self._ponderer = None
+        if isinstance(self._search, LazySmpSearch):
+            self._search.close()
+
+    def _pick_monte_carlo_cell(self, role: str, time_budget: float = None) -> tuple[int, str]:
+        """
+        Returns the most visited move of Monte Carlo tree search.
+
+        Raises
+        ------
+        NoEmptyCellsFoundException
+            If there is no empty cells in board to choose from.
+
+        Parameters
+        ----------
+        role: str
+            Bot role
+        time_budget: float, optional
+            Time (in seconds) the search can take (deafult None - `monte_carlo_playouts` playouts are run)
+
+        Returns
+        -------
+        (int, str)
+            > Index of GameBoard board cell
+            > Bot move symbol
+                > "circle"
+                > "cross"
+        """
+
+        if not ~self._board.occupied & ((1 << len(self._board)) - 1):
+            raise NoEmptyCellsFoundException
+        playouts = self._monte_carlo_playouts if time_budget is None else None
+        cell_index, value = self._monte_carlo.search(self._board, role == "order", playouts, time_budget)
+        self._last_search_stats = (self._monte_carlo, self._monte_carlo.stats())
+        return (cell_index, symbol_dict[value])
 
     def _pick_random_cell(self) -> tuple[int, str]:
         """
@@ -382,7 +818,8 @@ class Bot:
                 > "cross"
         """
 
-        available_cells = [index for index, cell in enumerate(self._board) if cell == 0]
+        occupied = self._board.occupied
+        available_cells = [index for index in range(len(self._board)) if not occupied >> index & 1]
         if len(available_cells) == 0:
             raise NoEmptyCellsFoundException
         symbol = 'cross'
@@ -479,6 +916,8 @@ class Bot:
             True if array is won, else False
         """
 
+        if len(array) in LINE_TABLES:
+            return LINE_TABLES[len(array)].win[encode_array(array)]
         array_of_subarrays = self._split_array_into_subarrays(array)
         for subarray in array_of_subarrays:
             if len(subarray) == 5 and subarray[0] != 0:
@@ -500,21 +939,16 @@ class Bot:
             False if array is not winnable, else True
         """
 
-        if len(array) == 6:
-            if array[0] == array[-1] and array[0] != 0:  # first and last square is the same
-                return False
-            symbol_count = self._amount_of_each_symbol_in_array(array[1:5])
-            if symbol_count['circle'] >= 1 and symbol_count['cross'] >= 1:
-                return False
-        elif len(array) == 5:  # one of four small (only 5 squares) diagonal arrays - special cases for winnablity
-            symbol_count = self._amount_of_each_symbol_in_array(array)
-            if symbol_count['circle'] >= 1 and symbol_count['cross'] >= 1:
-                return False
+        # rows/columns/long diagonals (6 squares) and small diagonals (5 squares) are precomputed
+        if len(array) in LINE_TABLES:
+            return LINE_TABLES[len(array)].winnability[encode_array(array)]
         return True
 
     def _update_arrays(self) -> bool:
         """
         Updates indexes_arrays based on their winnability.
+        Recalculates every array code from GameBoard board.
+        Clears moves stack - current board becomes the base for `undo_move()`.
         Returns True if one of arrays is a winning one.
 
         Returns
@@ -523,13 +957,66 @@ class Bot:
             True if one of arrays is a winning one, else False
         """
 
+        self._load_arrays_codes()
+        self._moves_stack.clear()
         temporary_indexes_arrays = []
-        for indexes_array in self._indexes_arrays:
-            board_values_array = self._get_board_values_array(indexes_array)
-            if self._check_array_win(board_values_array):
+        temporary_arrays_ids = []
+        for indexes_array, array_id in zip(self._indexes_arrays, self._arrays_ids):
+            code = self._arrays_codes[array_id]
+            table = self._arrays_lookups[array_id][2]
+            if table.win[code]:
                 # if array is a winning one, no need for further check - end of the game
                 return True
-            if self._check_array_winnability(board_values_array):
+            if table.winnability[code]:
                 temporary_indexes_arrays.append(indexes_array)
+                temporary_arrays_ids.append(array_id)
+            else:
+                self._arrays_alive[array_id] = False
         self._indexes_arrays = temporary_indexes_arrays
+        self._arrays_ids = temporary_arrays_ids
         return False
+
+    def _update_arrays_with_move(self, cell_index: int, value: int) -> bool:
+        """
+        Updates codes of arrays going through given cell after a move
+        and removes the ones that stopped being winnable.
+        Returns True if one of those arrays is a winning one.
+
+        Parameters
+        ----------
+        cell_index: int
+            Index of GameBoard board cell the move was made on
+        value: int
+            Move symbol value
+
+        Returns
+        -------
+        bool
+            True if one of arrays is a winning one, else False
+        """
+
+        won = False
+        dead_arrays_ids = []
+        for array_id, weight in self._cells_arrays[cell_index]:
+            code = self._arrays_codes[array_id] + value * weight
+            self._arrays_codes[array_id] = code
+            if not self._arrays_alive[array_id]:
+                continue
+            table = self._arrays_lookups[array_id][2]
+            if table.win[code]:
+                won = True
+            elif not table.winnability[code]:
+                self._arrays_alive[array_id] = False
+                dead_arrays_ids.append(array_id)
+        self._moves_stack.append((cell_index, value, tuple(dead_arrays_ids)))
+        if dead_arrays_ids:
+            self._load_alive_arrays()
+        return won
+
+    def _load_alive_arrays(self) -> None:
+        """
+        Loads indexes_arrays (and their ids) from arrays that are still alive.
+        """
+
+        self._arrays_ids = [array_id for array_id, alive in enumerate(self._arrays_alive) if alive]
+        self._indexes_arrays = [self._loaded_indexes_arrays[array_id] for array_id in self._arrays_ids]
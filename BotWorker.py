@@ -0,0 +1,118 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, CancelledError
+from Bot import Bot
+
+
+class BotWorker:
+    """
+    A class representing bot thinking in a worker thread.
+    Game loop requests a move, polls it every frame and keeps rendering and handling input
+    in the meantime. When game state changes, the move is cancelled and its result discarded.
+
+    ...
+
+    Attributes
+    ----------
+    bot: Bot
+        Bot making the moves
+    executor: ThreadPoolExecutor
+        Single worker thread
+    future: concurrent.futures.Future | None
+        Requested move, None if no move was requested or it was already taken
+    cancel_token: threading.Event | None
+        Cancel token of the requested move (see `Bot.make_move()`)
+
+    Methods
+    -------
+    request_move(role: str, time_budget=None)
+        Starts making bot move in the worker thread.
+    is_thinking()
+        Returns True if a move was requested and not taken yet.
+    poll()
+        Returns requested move if it is ready.
+    cancel()
+        Stops requested move and discards it.
+    close()
+        Cancels requested move and shuts worker thread down.
+    """
+
+    def __init__(self, bot: Bot) -> None:
+        """
+        Parameters
+        ----------
+        bot: Bot
+            Bot making the moves
+        """
+
+        self.bot = bot
+        self.executor = ThreadPoolExecutor(1)
+        self.future = None
+        self.cancel_token = None
+
+    def request_move(self, role: str, time_budget: float = None) -> None:
+        """
+        Starts making bot move in the worker thread. Previous request is cancelled.
+
+        Parameters
+        ----------
+        role: str
+            Bot role
+        time_budget: float, optional
+            Time (in seconds) the move can take (deafult None - bot deafult)
+        """
+
+        self.cancel()
+        self.cancel_token = threading.Event()
+        self.future = self.executor.submit(self.bot.make_move, role, time_budget, self.cancel_token)
+
+    def is_thinking(self) -> bool:
+        """
+        Returns
+        -------
+        bool
+            True if a move was requested and not taken by `poll()` yet
+        """
+
+        return self.future is not None
+
+    def poll(self) -> tuple[int, str] | None:
+        """
+        Returns requested move if it is ready. Exception raised by the bot is raised here.
+
+        Returns
+        -------
+        (int, str) | None
+            Bot move (see `Bot.make_move()`), None if there is no ready move
+        """
+
+        if self.future is None or not self.future.done():
+            return None
+        future = self.future
+        self.future = None
+        return future.result()
+
+    def cancel(self) -> None:
+        """
+        Stops requested move and discards it. Returns when the worker is idle,
+        so bot and board can be changed right after.
+        """
+
+        if self.future is None:
+            return
+        self.cancel_token.set()  # move that has not started its search yet stops at once
+        if not self.future.cancel():  # already running or finished
+            if not self.future.done():
+                self.bot.cancel_move()
+            try:
+                self.future.result()
+            except (CancelledError, Exception):
+                pass  # result of a stale move is not needed
+        self.future = None
+
+    def close(self) -> None:
+        """
+        Cancels requested move and shuts worker thread down.
+        """
+
+        self.cancel()
+        self.executor.shutdown()
@@ -0,0 +1,83 @@
+import pygame
+
+
+class Compositor:
+    """
+    A class representing cache of pre-rendered screen layers.
+    Every layer is a surface drawn once by its draw function and kept together with
+    the inputs it was drawn from. It is drawn again only when the inputs change.
+
+    ...
+
+    Attributes
+    ----------
+    layers: dict
+        Cached layers - name: (inputs, surface)
+    builds: int
+        Number of layers drawn (cache misses)
+    reuses: int
+        Number of layers returned from cache
+
+    Methods
+    -------
+    layer(name: str, inputs: tuple, size: tuple[int, int], draw, alpha=False)
+        Returns layer surface, draws it if inputs changed.
+    invalidate(name=None)
+        Removes a layer or every layer from cache.
+    """
+
+    def __init__(self) -> None:
+        self.layers = {}
+        self.builds = 0
+        self.reuses = 0
+
+    def layer(self, name: str, inputs: tuple, size: tuple[int, int], draw, alpha: bool = False) -> pygame.Surface:
+        """
+        Returns layer surface. It is drawn again if there is no such layer
+        or it was drawn from different inputs.
+
+        Parameters
+        ----------
+        name: str
+            Layer name
+        inputs: tuple
+            Values the layer look depends on (must be comparable)
+        size: tuple[int, int]
+            Layer surface size
+        draw: Callable[[pygame.Surface], None]
+            Function drawing the layer to given surface
+        alpha: bool, optional
+            True if the layer has per pixel transparency (deafult False)
+
+        Returns
+        -------
+        pygame.Surface
+            Layer surface
+        """
+
+        cached = self.layers.get(name)
+        if cached is not None and cached[0] == inputs:
+            self.reuses += 1
+            return cached[1]
+        surface = pygame.Surface(size, pygame.SRCALPHA if alpha else 0)
+        if pygame.display.get_surface() is not None:  # matching display format makes blitting faster
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        draw(surface)
+        self.layers[name] = (inputs, surface)
+        self.builds += 1
+        return surface
+
+    def invalidate(self, name: str = None) -> None:
+        """
+        Removes a layer from cache, so it is drawn on next use.
+
+        Parameters
+        ----------
+        name: str, optional
+            Layer name (deafult None - every layer)
+        """
+
+        if name is None:
+            self.layers.clear()
+        else:
+            self.layers.pop(name, None)
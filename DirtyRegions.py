@@ -0,0 +1,103 @@
+import pygame
+
+
+class DirtyRegions:
+    """
+    A class representing screen regions that changed since the last render.
+    Objects mark rectangles they change, the engine redraws and updates only those.
+    Overlapping rectangles are merged.
+
+    ...
+
+    Attributes
+    ----------
+    screen_rect: pygame.Rect
+        The whole screen rectangle, marked rectangles are clipped to it
+    full: bool
+        True if the whole screen has to be redrawn
+
+    Methods
+    -------
+    mark(rect: pygame.Rect)
+        Marks a rectangle as changed.
+    mark_all()
+        Marks the whole screen as changed.
+    is_dirty()
+        Checks if anything has to be redrawn.
+    rects()
+        Returns rectangles to redraw.
+    clear()
+        Removes every mark.
+    """
+
+    def __init__(self, screen_size: tuple[int, int]) -> None:
+        """
+        Parameters
+        ----------
+        screen_size: tuple[int, int]
+            The screen size
+        """
+
+        self.screen_rect = pygame.Rect((0, 0), screen_size)
+        self.full = False
+        self._rects = []
+
+    def mark(self, rect: pygame.Rect) -> None:
+        """
+        Marks a rectangle as changed.
+
+        Parameters
+        ----------
+        rect: pygame.Rect
+            Changed rectangle (any rect-like value)
+        """
+
+        if self.full:
+            return
+        rect = pygame.Rect(rect).clip(self.screen_rect)
+        if not rect.width or not rect.height:
+            return
+        # merged rectangle may overlap rectangles it did not before
+        index = rect.collidelist(self._rects)
+        while index != -1:
+            rect.union_ip(self._rects.pop(index))
+            index = rect.collidelist(self._rects)
+        self._rects.append(rect)
+
+    def mark_all(self) -> None:
+        """
+        Marks the whole screen as changed.
+        """
+
+        self.full = True
+        self._rects.clear()
+
+    def is_dirty(self) -> bool:
+        """
+        Returns
+        -------
+        bool
+            True if anything has to be redrawn
+        """
+
+        return self.full or bool(self._rects)
+
+    def rects(self) -> list[pygame.Rect]:
+        """
+        Returns
+        -------
+        list[pygame.Rect]
+            Rectangles to redraw (the screen rectangle if whole screen is marked)
+        """
+
+        if self.full:
+            return [self.screen_rect.copy()]
+        return [rect.copy() for rect in self._rects]
+
+    def clear(self) -> None:
+        """
+        Removes every mark (called after render).
+        """
+
+        self.full = False
+        self._rects.clear()
@@ -0,0 +1,155 @@
+from collections import OrderedDict
+import io
+import threading
+import pygame
+
+DEAFULT_FONT = 'timesnewroman'
+TEXT_CACHE_SIZE = 256
+
+
+class FontCache:
+    """
+    A class representing process-wide font registry and rendered text cache.
+    Fonts are loaded once for every (font, size) pair. Rendered text surfaces are kept
+    in least recently used order, the oldest is dropped when the cache is full.
+    The cache can be used from many threads (e.g. asset loading at start).
+
+    ...
+
+    Attributes
+    ----------
+    max_size: int
+        Maximal number of rendered text surfaces kept
+    fonts: dict
+        Loaded fonts - (font, size): pygame.font.Font
+    hits: int
+        Number of text renders returned from cache
+    misses: int
+        Number of text renders drawn by font
+
+    Methods
+    -------
+    add_font_data(font: str, data)
+        Registers font file content to be used instead of reading the file.
+    font(font: str | None, size: int)
+        Returns font loaded from file or system font for given size.
+    render(font: str | None, size: int, text: str, color)
+        Returns surface with rendered text.
+    clear()
+        Removes every font and rendered text.
+    """
+
+    def __init__(self, max_size: int = TEXT_CACHE_SIZE) -> None:
+        """
+        Parameters
+        ----------
+        max_size: int, optional
+            Maximal number of rendered text surfaces kept (deafult TEXT_CACHE_SIZE)
+        """
+
+        self.max_size = max_size
+        self.fonts = {}
+        self.hits = 0
+        self.misses = 0
+        self._texts = OrderedDict()
+        self._font_data = dict()
+        self._lock = threading.RLock()
+
+    def add_font_data(self, font: str, data) -> None:
+        """
+        Registers font file content (e.g. from assets bundle), fonts with given path
+        are loaded from it instead of reading the file.
+
+        Parameters
+        ----------
+        font: str
+            Font file path
+        data: bytes-like
+            Font file content
+        """
+
+        with self._lock:
+            self._font_data[font] = data
+            for key in [key for key in self.fonts if key[0] == font]:
+                del self.fonts[key]
+
+    def font(self, font: str | None, size: int) -> pygame.font.Font:
+        """
+        Returns font for given size, it is loaded on first use only.
+
+        Parameters
+        ----------
+        font: str | None
+            Font file path, None for the deafult system font
+        size: int
+            Font size
+
+        Returns
+        -------
+        pygame.font.Font
+            Loaded font
+        """
+
+        key = (font, size)
+        with self._lock:
+            loaded = self.fonts.get(key)
+            if loaded is None:
+                if font is None:
+                    loaded = pygame.font.SysFont(DEAFULT_FONT, size)
+                elif font in self._font_data:
+                    # every font reads its own stream
+                    loaded = pygame.font.Font(io.BytesIO(self._font_data[font]), size)
+                else:
+                    loaded = pygame.font.Font(font, size)
+                self.fonts[key] = loaded
+            return loaded
+
+    def render(self, font: str | None, size: int, text: str, color='black') -> pygame.Surface:
+        """
+        Returns antialiased text surface. Returned surface is shared and must not be modified.
+
+        Parameters
+        ----------
+        font: str | None
+            Font file path, None for the deafult system font
+        size: int
+            Font size
+        text: str
+            Rendered text
+        color: optional
+            Text color, any pygame color value (deafult 'black')
+
+        Returns
+        -------
+        pygame.Surface
+            Surface with rendered text
+        """
+
+        key = (font, size, text, tuple(pygame.Color(color)))
+        with self._lock:
+            surface = self._texts.get(key)
+            if surface is not None:
+                self._texts.move_to_end(key)
+                self.hits += 1
+                return surface
+            surface = self.font(font, size).render(text, True, color)
+            self._texts[key] = surface
+            if len(self._texts) > self.max_size:
+                self._texts.popitem(last=False)
+            self.misses += 1
+            return surface
+
+    def clear(self) -> None:
+        """
+        Removes every font and rendered text (e.g. after pygame.font.quit()).
+        """
+
+        with self._lock:
+            self.fonts.clear()
+            self._texts.clear()
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+
+font_cache = FontCache()
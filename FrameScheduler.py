@@ -0,0 +1,136 @@
+import time
+
+
+class FrameScheduler:
+    """
+    A class representing game loop frame scheduler.
+    Game logic is updated in fixed time steps (the same for every frame rate),
+    rendering is capped to a maximal number of frames per second.
+
+    ...
+
+    Attributes
+    ----------
+    update_step: float
+        Time (in seconds) of one logic update
+    fps_cap: float | None
+        Maximal rendered frames per second, None for no limit
+    max_updates: int
+        Maximal number of updates run in one frame, older time is dropped
+    clock: Callable[[], float]
+        Time source (in seconds)
+
+    Methods
+    -------
+    set_fps_cap(fps_cap: float | None)
+        Sets maximal rendered frames per second.
+    reset()
+        Drops time elapsed since the last frame, one update is due after it.
+    advance()
+        Returns number of updates due.
+    should_render()
+        Returns True if a frame should be rendered.
+    time_to_next_frame()
+        Returns time until the next update or render is due.
+    """
+
+    def __init__(self, fps_cap: float = 60, update_rate: float = 60, max_updates: int = 5,
+                 clock=time.perf_counter) -> None:
+        """
+        Parameters
+        ----------
+        fps_cap: float | None, optional
+            Maximal rendered frames per second, None or 0 for no limit (deafult 60)
+        update_rate: float, optional
+            Logic updates per second (deafult 60)
+        max_updates: int, optional
+            Maximal number of updates run in one frame (deafult 5)
+        clock: Callable[[], float], optional
+            Time source (in seconds) (deafult time.perf_counter)
+        """
+
+        self.update_step = 1 / update_rate
+        self.fps_cap = None
+        self.max_updates = max_updates
+        self.clock = clock
+        self._frame_time = 0.0
+        self._accumulator = 0.0
+        self._last_time = clock()
+        self._next_render_time = self._last_time
+        self.set_fps_cap(fps_cap)
+
+    def set_fps_cap(self, fps_cap: float | None) -> None:
+        """
+        Sets maximal rendered frames per second.
+
+        Parameters
+        ----------
+        fps_cap: float | None
+            Frames per second, None or 0 for no limit
+        """
+
+        self.fps_cap = fps_cap if fps_cap else None
+        self._frame_time = 1 / fps_cap if fps_cap else 0.0
+
+    def reset(self) -> None:
+        """
+        Drops time elapsed since the last frame (e.g. after waiting idle for an event),
+        so it is not caught up by updates. Exactly one update is due after the reset.
+        """
+
+        self._last_time = self.clock()
+        self._accumulator = self.update_step
+        self._next_render_time = self._last_time
+
+    def advance(self) -> int:
+        """
+        Adds time elapsed since the last call and returns number of updates due.
+        If more than `max_updates` are due, the rest of the time is dropped.
+
+        Returns
+        -------
+        int
+            Number of `update_step` updates to run
+        """
+
+        now = self.clock()
+        self._accumulator += now - self._last_time
+        self._last_time = now
+        updates = int(self._accumulator / self.update_step)
+        if updates > self.max_updates:
+            updates = self.max_updates
+            self._accumulator = 0.0
+        else:
+            self._accumulator -= updates * self.update_step
+        return updates
+
+    def should_render(self) -> bool:
+        """
+        Returns True if a frame should be rendered now (frame rate cap is not exceeded)
+        and schedules the next one.
+
+        Returns
+        -------
+        bool
+            True if a frame should be rendered
+        """
+
+        now = self.clock()
+        if now < self._next_render_time:
+            return False
+        self._next_render_time += self._frame_time
+        if self._next_render_time < now:  # frames are not caught up after a long one
+            self._next_render_time = now + self._frame_time
+        return True
+
+    def time_to_next_frame(self) -> float:
+        """
+        Returns
+        -------
+        float
+            Time (in seconds) until the next update or render is due, 0 if one is due now
+        """
+
+        now = self.clock()
+        next_update = self._last_time + self.update_step - self._accumulator
+        return max(min(next_update, self._next_render_time) - now, 0.0)
@@ -1,4 +1,6 @@
 import pygame
+from DirtyRegions import DirtyRegions
+from FontCache import font_cache
 
 
 class Button:
@@ -27,11 +29,19 @@ class Button:
         Time that takes button to reset it's pressing (in seconds)
     pressing_clock: float
         Button internal clock for pressing reset
+    dirty_regions: DirtyRegions | None
+        Screen regions tracker the button marks its rectangle in when it changes
 
     Methods
     -------
+    set_dirty_regions(dirty_regions: DirtyRegions)
+        Sets screen regions tracker.
+    rect()
+        Returns the button screen rectangle.
     load_image(path: str)
         Loads image.
+    set_image(image: pygame.Surface)
+        Sets already loaded image.
     update_position(position: tuple[int, int])
         Updates the button position to a given position.
     update_size(size: tuple[int, int])
@@ -46,6 +56,8 @@ class Button:
         The button method when clicked.
     reset_pressing(delta_time: float, instant_reset=False)
         Resets the button pressing.
+    is_pressed()
+        Checks if the button shows pressing.
     render(screen: pygame.surface)
         Rendering the button to a surface.
     """
@@ -77,6 +89,41 @@ class Button:
         self._image = None
         self._pressing_reset_time = pressing_reset_time  # 0.5 meaning 0.5s
         self._pressing_clock = self._pressing_reset_time
+        self._dirty_regions = None
+
+    def set_dirty_regions(self, dirty_regions: DirtyRegions) -> None:
+        """
+        Sets screen regions tracker the button marks its rectangle in when it changes.
+
+        Parameters
+        ----------
+        dirty_regions: DirtyRegions
+            Screen regions tracker
+        """
+
+        self._dirty_regions = dirty_regions
+        self._mark_dirty()
+
+    def rect(self) -> pygame.Rect:
+        """
+        Returns
+        -------
+        pygame.Rect
+            The button screen rectangle (image included)
+        """
+
+        button_rect = pygame.Rect(self._position, self._size)
+        if self._image is not None:
+            button_rect.union_ip(self._image.get_rect(topleft=self._position))
+        return button_rect
+
+    def _mark_dirty(self) -> None:
+        """
+        Marks the button rectangle in screen regions tracker.
+        """
+
+        if self._dirty_regions is not None:
+            self._dirty_regions.mark(self.rect())
 
     def load_image(self, path: str) -> None:
         """
@@ -94,7 +141,21 @@ class Button:
             Path to the image
         """
 
-        self._image = pygame.image.load(path)
+        self.set_image(pygame.image.load(path))
+
+    def set_image(self, image: pygame.Surface) -> None:
+        """
+        Sets already loaded (e.g. converted and scaled by `AssetManager`) image for button.
+
+        Parameters
+        ----------
+        image: pygame.Surface
+            The button image
+        """
+
+        self._mark_dirty()
+        self._image = image
+        self._mark_dirty()
 
     def update_position(self, position: tuple[int, int]) -> None:
         """
@@ -106,7 +167,9 @@ class Button:
             New button position
         """
 
+        self._mark_dirty()
         self._position = position
+        self._mark_dirty()
 
     def update_size(self, size: tuple[int, int]) -> None:
         """
@@ -118,7 +181,9 @@ class Button:
             New button size
         """
 
+        self._mark_dirty()
         self._size = size
+        self._mark_dirty()
 
     def update_colors(self, colors: tuple[str, str]) -> None:
         """
@@ -131,10 +196,13 @@ class Button:
             New button colors [fill_color, border_color]
         """
 
+        old_colors = (self._fill_color, self._border_color)
         if colors[0]:
             self._fill_color = colors[0]
         if colors[1]:
             self._border_color = colors[1]
+        if (self._fill_color, self._border_color) != old_colors:
+            self._mark_dirty()
 
     def change_image_scaling(self, factor: float) -> None:
         """
@@ -147,7 +215,9 @@ class Button:
             Image scaling factor
         """
         if self._image is not None:
+            self._mark_dirty()
             self._image = pygame.transform.scale_by(self._image, factor)
+            self._mark_dirty()
 
     def check_if_clicked(self, mouse_position: tuple[int, int]) -> bool:
         """
@@ -201,6 +271,18 @@ class Button:
         self.update_colors((self._base_fill_color, self._base_border_color))
         self._pressing_clock = self._pressing_reset_time
 
+    def is_pressed(self) -> bool:
+        """
+        Checks if the button shows pressing (its colors differ from the base ones).
+
+        Returns
+        -------
+        bool
+            True if the button is pressed
+        """
+
+        return self._fill_color != self._base_fill_color or self._border_color != self._base_border_color
+
     def render(self, screen: pygame.Surface) -> None:
         """
         Renders the button to given surface.
@@ -266,13 +348,16 @@ class ChangeSymbolButton(Button):
 class Text:
     """
     A class used to represent a GUI text.
+    Fonts and rendered texts are shared by every text through `font_cache`.
 
     ...
 
     Attributes
     ----------
-    font: pygame.Font
-        The text's font
+    font: str | None
+        The text's font file path (None for deafult font)
+    size: int
+        The text's font size
     text: pygame.Surface
         A surface that holds the text
     text_rect: pygame.Rect
@@ -290,6 +375,8 @@ class Text:
         Updates the text's position to given position.
     set_text_center_position(position: tuple[int, int])
         Updates the text's center position to given position.
+    rect()
+        Returns the text screen rectangle.
     render(screen: pygame.Surface)
         Rendering the text to a surface.
     """
@@ -302,8 +389,9 @@ class Text:
             The size of the text (deafult 30)
         """
 
-        self._font = pygame.font.SysFont('timesnewroman',  size)
-        self._text = self._font.render("blank_text", True, 'black')
+        self._font = None
+        self._size = size
+        self._text = font_cache.render(self._font, self._size, "blank_text", 'black')
         self._text_rect = self._text.get_rect()
 
     def set_text(self, text: str, text_color='black') -> None:
@@ -318,7 +406,7 @@ class Text:
             The displayed text color (deafult 'black')
         """
 
-        self._text = self._font.render(text, True, text_color)
+        self._text = font_cache.render(self._font, self._size, text, text_color)
         self._text_rect = self._text.get_rect()
 
     def set_font(self, font: str, size=30) -> None:
@@ -334,7 +422,9 @@ class Text:
             The size of the text (deafult 30)
         """
 
-        self._font = pygame.font.Font(font, size)
+        font_cache.font(font, size)  # fails here for wrong font file
+        self._font = font
+        self._size = size
 
     def set_deafult_font(self, size=30) -> None:
         """
@@ -347,7 +437,8 @@ class Text:
             The size of the text (deafult 30)
         """
 
-        self._font = pygame.font.SysFont('timesnewroman',  size)
+        self._font = None
+        self._size = size
 
     def set_text_position(self, position: tuple[int, int]) -> None:
         """
@@ -376,6 +467,16 @@ class Text:
 
         self._text_rect.center = position
 
+    def rect(self) -> pygame.Rect:
+        """
+        Returns
+        -------
+        pygame.Rect
+            The text screen rectangle
+        """
+
+        return self._text_rect.copy()
+
     def render(self, screen: pygame.Surface) -> None:
         """
         Renders the text to given surface.
@@ -1,58 +1,54 @@
-import pygame
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from BoardModel import BoardModel
 
+if TYPE_CHECKING:
+    import pygame
+    from DirtyRegions import DirtyRegions
 
-class GameBoard:
+
+class GameBoard(BoardModel):
     """
-    A class representing the game board.
+    A class representing the game board with rendering.
+    Inherits board state and geometry from `BoardModel`.
+    Pygame is imported by rendering methods only, so creating the board does not load it.
 
     ...
 
     Attributes
     ----------
-    BOARD_SIZE: int
-        The board size (constant = 6)
-    board: list
-        List storing the board info:
-            > EMPTY = 0
-            > CIRCLE = 1
-            > CROSS = 2
-    CELL_SIZE: int
-        The board cell size
-    BOARD_RENDER_MARGIN: tuple[int, int]
-        The starting point of board rendering
-    CELL_SPACING: int
-        The gap between two board cells
     cross_img: pygame.Surface
         The cross symbol image for rendering
     circle_img: pygame.Surface
         The circle symbol image for rendering
+    dirty_regions: DirtyRegions | None
+        Screen regions tracker the board marks changed cells in
 
     Methods
     -------
     load_symbols_texture(cross_path: str, circle_path: str)
         Loads images for cross and cicle symbols.
-    set_up_board()
-        Resets the board.
-    board()
-        Returns the board list.
-    calculate_cell_index(mouse_position: tuple[int, int])
-        Calculates the board cell that contains mouse position.
-    update(cell_index: int, symbol: str)
-        Updates the board cell by given index to a given symbol.
-    undo_moves(moves: list[int])
-        Undoes the given moves.
-    render(screen: pygame.Surface)
+    set_symbols_texture(cross_img: pygame.Surface, circle_img: pygame.Surface)
+        Sets already loaded images for cross and cicle symbols.
+    set_dirty_regions(dirty_regions: DirtyRegions)
+        Sets screen regions tracker.
+    cell_rect(cell_index: int)
+        Returns screen rectangle of a cell.
+    board_rect()
+        Returns screen rectangle of the whole board.
+    render(screen: pygame.Surface, area=None)
         Rendering the board to a surface.
+    render_cells(screen: pygame.Surface, area=None)
+        Rendering empty board cells to a surface.
+    render_symbols(screen: pygame.Surface, area=None)
+        Rendering board symbols to a surface.
     """
 
     def __init__(self) -> None:
-        self._BOARD_SIZE = 6
-        self._board = []
-        self._CELL_SIZE = 96
-        self._BOARD_RENDER_MARGIN = (42, 42)
-        self._CELL_SPACING = 12
+        super().__init__()
         self._cross_img = None
         self._circle_img = None
+        self._dirty_regions = None
 
     def load_symbols_texture(self, cross_path: str, circle_path: str) -> None:
         """
@@ -73,6 +69,8 @@ class GameBoard:
             Path to the circle image
         """
 
+        import pygame
+
         self._cross_img = pygame.image.load(cross_path)
         self._circle_img = pygame.image.load(circle_path)
         cross_img_factor = self._CELL_SIZE / self._cross_img.get_size()[0]
@@ -80,128 +78,138 @@ class GameBoard:
         self._cross_img = pygame.transform.scale_by(self._cross_img, cross_img_factor)
         self._circle_img = pygame.transform.scale_by(self._circle_img, circle_img_factor)
 
-    def set_up_board(self) -> None:
+    def set_symbols_texture(self, cross_img: pygame.Surface, circle_img: pygame.Surface) -> None:
         """
-        Resets the board - sets the list values to zeros.
+        Sets already loaded images for cross and cicle symbols.
+        Images are not scaled, they should have `symbol_size()` size.
+
+        Parameters
+        ----------
+        cross_img: pygame.Surface
+            The cross image
+        circle_img: pygame.Surface
+            The circle image
         """
 
-        self._board.clear()
-        for _ in range(self._BOARD_SIZE**2):
-            self._board.append(0)
+        self._cross_img = cross_img
+        self._circle_img = circle_img
 
-    @property
-    def board(self) -> list[int]:
+    def set_dirty_regions(self, dirty_regions: DirtyRegions) -> None:
         """
-        Returns
-        -------
-        List[int]
-            The board values.
+        Sets screen regions tracker the board marks changed cells in.
+
+        Parameters
+        ----------
+        dirty_regions: DirtyRegions
+            Screen regions tracker
         """
 
-        return self._board
+        self._dirty_regions = dirty_regions
+        dirty_regions.mark(self.board_rect())
 
-    def calculate_cell_index(self, mouse_position: tuple[int, int]) -> tuple[bool, int]:
+    def cell_rect(self, cell_index: int) -> pygame.Rect:
         """
-        Calculates the board cell that contains mouse position.
+        Returns screen rectangle of a cell.
 
         Parameters
         ----------
-        mouse_position: tuple[int, int]
-            The mouse position
+        cell_index: int
+            Index of a cell
 
         Returns
         -------
-        (bool, int)
-            > True if one of board cell contains mouse position
-            > Index of calculated cell
+        pygame.Rect
+            The cell rectangle
         """
 
-        mouse_x = mouse_position[0]
-        mouse_y = mouse_position[1]
-        index_x = (mouse_x - self._BOARD_RENDER_MARGIN[0])//(self._CELL_SIZE + self._CELL_SPACING)
-        if index_x < 0 or index_x > self._BOARD_SIZE - 1:
-            return False, 0
-        if mouse_x - self._BOARD_RENDER_MARGIN[0] > (index_x+1) * (self._CELL_SIZE + self._CELL_SPACING) - self._CELL_SPACING:
-            return False, 0
+        import pygame
 
-        index_y = (mouse_y - self._BOARD_RENDER_MARGIN[1])//(self._CELL_SIZE + self._CELL_SPACING)
-        if index_y < 0 or index_y > self._BOARD_SIZE - 1:
-            return False, 0
-        if mouse_y - self._BOARD_RENDER_MARGIN[1] > (index_y+1) * (self._CELL_SIZE + self._CELL_SPACING) - self._CELL_SPACING:
-            return False, 0
+        return pygame.Rect(self.cell_box(cell_index))
 
-        cell_index = index_x + index_y * self._BOARD_SIZE
+    def board_rect(self) -> pygame.Rect:
+        """
+        Returns
+        -------
+        pygame.Rect
+            Screen rectangle of the whole board
+        """
 
-        return True, cell_index
+        return self.cell_rect(0).union(self.cell_rect(self._BOARD_SIZE**2 - 1))
 
-    def update(self, cell_index: int, symbol: str) -> bool:
+    def _cell_changed(self, cell_index: int) -> None:
+        """
+        Marks cell rectangle in screen regions tracker.
         """
-        Updates the board cell by given index to a given symbol.
 
-        Parameters
-        ----------
-        cell_index: int
-            Index of a cell
-        symbol: str
-            Symbol that the cell will be set to
+        if self._dirty_regions is not None:
+            self._dirty_regions.mark(self.cell_rect(cell_index))
+
+    def _board_changed(self) -> None:
+        """
+        Marks board rectangle in screen regions tracker.
         """
 
-        if cell_index < 0 or cell_index > self._BOARD_SIZE**2 - 1:  # index out of range
-            return False
-        if self._board[cell_index] != 0:  # cell is already cross or circle
-            return False
+        if self._dirty_regions is not None:
+            self._dirty_regions.mark(self.board_rect())
 
-        if symbol == "cross":
-            self._board[cell_index] = 2
-        elif symbol == "circle":
-            self._board[cell_index] = 1
-        else:
-            return False
-        return True
+    def render(self, screen: pygame.Surface, area: pygame.Rect = None) -> None:
+        """
+        Renders the board to given surface.
 
-    def undo_moves(self, moves: list[int]) -> None:
+        Parameters
+        ----------
+        screen: pygame.Surface
+            Surface that the board will be rendered to
+        area: pygame.Rect, optional
+            Only cells overlapping the area are rendered (deafult None - every cell)
         """
-        Undoes the given moves.
 
-        Raises
-        ------
-        IndexError
-            If move index is incorrect
-        ValueError
-            If move was not done yet
+        self.render_cells(screen, area)
+        self.render_symbols(screen, area)
+
+    def render_cells(self, screen: pygame.Surface, area: pygame.Rect = None) -> None:
+        """
+        Renders empty board cells (without symbols) to given surface.
+        Cells do not change during the game, so they can be rendered once to a background.
 
         Parameters
         ----------
-        moves: list[int]
-            List of moves to undo
+        screen: pygame.Surface
+            Surface that the cells will be rendered to
+        area: pygame.Rect, optional
+            Only cells overlapping the area are rendered (deafult None - every cell)
         """
 
-        for move_index in moves:
-            if move_index < 0 or move_index >= self._BOARD_SIZE**2:
-                raise IndexError
-            if self._board[move_index] == 0:
-                raise ValueError
-            self._board[move_index] = 0
+        import pygame
+
+        background_color = pygame.Color(204, 255, 255)
+        border_color = pygame.Color(26, 26, 26)
+        for index in range(self._BOARD_SIZE**2):
+            cell_Rect = self.cell_rect(index)
+            if area is not None and not cell_Rect.colliderect(area):
+                continue
+            pygame.draw.rect(screen, background_color, cell_Rect, 0, 10)
+            pygame.draw.rect(screen, border_color, cell_Rect, 3, 10)
 
-    def render(self, screen: pygame.Surface) -> None:
+    def render_symbols(self, screen: pygame.Surface, area: pygame.Rect = None) -> None:
         """
-        Renders the board to given surface.
+        Renders board symbols to given surface.
 
         Parameters
         ----------
         screen: pygame.Surface
-            Surface that the board will be rendered to
+            Surface that the symbols will be rendered to
+        area: pygame.Rect, optional
+            Only cells overlapping the area are rendered (deafult None - every cell)
         """
 
         for index, cell in enumerate(self._board):
-            start_X = (index % self._BOARD_SIZE) * (self._CELL_SIZE + 12) + self._BOARD_RENDER_MARGIN[0]
-            start_Y = (index // self._BOARD_SIZE) * (self._CELL_SIZE + 12) + self._BOARD_RENDER_MARGIN[0]
-            cell_Rect = pygame.Rect(start_X, start_Y, self._CELL_SIZE, self._CELL_SIZE)
-
-            background_color = pygame.Color(204, 255, 255)
-            pygame.draw.rect(screen, background_color, cell_Rect, 0, 10)
-            pygame.draw.rect(screen, pygame.Color(26, 26, 26), cell_Rect, 3, 10)
+            if cell == 0:
+                continue
+            cell_Rect = self.cell_rect(index)
+            if area is not None and not cell_Rect.colliderect(area):
+                continue
             if cell == 1:
-                screen.blit(self._circle_img, (start_X, start_Y))
+                screen.blit(self._circle_img, cell_Rect.topleft)
             elif cell == 2:
-                screen.blit(self._cross_img, (start_X, start_Y))
+                screen.blit(self._cross_img, cell_Rect.topleft)
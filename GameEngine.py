@@ -1,9 +1,23 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 import pygame
-import json
 from GameBoard import GameBoard
 from MouseStructure import Mouse
 import GUI
 from Bot import Bot
+from Tablebase import Tablebase, TABLEBASE_PATH
+from BotWorker import BotWorker
+from FrameScheduler import FrameScheduler
+from DirtyRegions import DirtyRegions
+from Compositor import Compositor
+from AssetManager import AssetManager
+from FontCache import font_cache
+
+# assets are found next to the game files, wherever the game is started from
+GAME_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+ASSETS_CONFIG_PATH = os.path.join(GAME_DIRECTORY, "config.json")
+ASSETS_BUNDLE_PATH = os.path.join(GAME_DIRECTORY, "assets.bundle")
 
 
 class GameEngine:
@@ -16,28 +30,44 @@ class GameEngine:
 
     Attributes
     ----------
-    assets: dict
-        A dictionary that hold assets paths loaded from config.json file
+    assets: AssetManager | None
+        Menu assets loaded from config.json file or bundle, None until loaded
+    game_assets: AssetManager | None
+        Game screen assets (the same as `assets` if loaded from bundle), None until loaded
+    asset_loader: ThreadPoolExecutor
+        Threads loading menu and game assets in the background at start
+    menu_assets_future: concurrent.futures.Future | None
+        Menu assets being loaded, None after they are applied
+    game_assets_future: concurrent.futures.Future | None
+        Game assets being loaded, None after they are applied
+    startup_times: dict
+        Seconds from engine creation to "first_frame" (splash shown), "menu" (menu interactive)
+        and "game" (game assets applied)
+    start_time: float
+        Time (`time.perf_counter()`) of engine creation
     delta_time: float
-        A time between two frames
+        A time between two updates (fixed update step)
     screen: pygame.Surface
         Main game window
-    transparent_surface: pygame.Surface
-        Surface used for rendering semi-trasparent content to main window
+    compositor: Compositor
+        Cache of static layers - menu and game backgrounds, winner overlay
+    dirty_regions: DirtyRegions
+        Screen regions changed since the last render, only they are redrawn and updated
     running: bool
         Variable responsible for keeping the game window alive (True if window is open)
-    clock: pygame.Clock
-        Game clock used for calculating delta time and locking framerate
+    scheduler: FrameScheduler
+        Frame scheduler - fixed-timestep updates and capped render rate
     board: GameBoard
         Main game board object
     mouse: Mouse
         Main game mouse object
-    maked_moves: list[tuple[int, str]]
-        List containing already maked moves
     bot: Bot
         Main game bot object
+    bot_worker: BotWorker
+        Worker thread making bot moves, so the game loop keeps running while bot thinks
     game_state: str
         Variable holding current game state
+            > "loading"
             > "menu"
             > "game"
     BUTTONS: GUI.ChangeSymbolButton
@@ -51,7 +81,7 @@ class GameEngine:
         > chaos_button
             GAME: `Chaos` turn indicator
         > undo_button
-            GAME: Undo two last moves
+            GAME: Undo two last moves (left click), redo two undone moves (right click)
         > restart_button
             GAME: Restart game
         > menu_button
@@ -64,6 +94,8 @@ class GameEngine:
             MENU: Change difficulty to `easy`
         > hard_menu_button
             MENU: Change difficulty to `hard`
+        > expert_menu_button
+            MENU: Change difficulty to `expert`
         > start_button
             MENU: Start game, change game state to `game`
     TEXTS: GUI.Text
@@ -76,56 +108,105 @@ class GameEngine:
 
     Methods
     -------
-    load_assets()
-        Loads assets paths to dictionary from config.json.
+    load_menu_assets()
+        Loads assets needed by menu (run on asset loader thread).
+    load_game_assets()
+        Loads assets needed by game screen (run on asset loader thread).
+    apply_menu_assets(assets: AssetManager)
+        Sets loaded menu assets to menu objects.
+    apply_game_assets(assets: AssetManager)
+        Sets loaded game assets to game objects.
+    wait_for_game_assets()
+        Waits until game assets are loaded and applies them.
+    add_menu_images(assets: AssetManager)
+        Adds every image used by menu to assets atlas.
+    add_game_images(assets: AssetManager)
+        Adds every image used by game screen to assets atlas.
     start_game()
         Sets needed variables for `game` to start.
+    set_fps_cap()
+        Sets maximal rendered frames per second.
     run()
         Main game loop.
+    is_idle()
+        Checks if nothing changes until user input.
     process_events()
         Process user input.
+    loading_update()
+        Applies loaded assets. Called when `game_state` == `loading`.
+    loading_render()
+        Renders splash screen. Called when `game_state` == `loading`.
     menu_update()
         Updates menu objects. Called when `game_state` == `menu`.
     menu_render()
         Renders menu objects. Called when `game_state` == `menu`.
+    draw_menu_background(surface: pygame.Surface)
+        Draws static part of the menu.
     game_update()
         Updates game objects. Called when `game_state` == `game`.
     game_render()
         Renders game objects. Called when `game_state` == `game`.
+    draw_game_background(surface: pygame.Surface)
+        Draws static part of the game screen.
+    draw_winner_overlay(surface: pygame.Surface)
+        Draws winner overlay.
+    go_to_move()
+        Undoes or redoes moves on board and bot until given number of moves is made.
     """
 
-    def __init__(self) -> None:
-        self._assets = dict()
-        self._load_assets()
-        self._delta_time = 0
+    def __init__(self, fps_cap: float = 60) -> None:
+        """
+        Parameters
+        ----------
+        fps_cap: float | None, optional
+            Maximal rendered frames per second, None or 0 for no limit (deafult 60)
+        """
+
+        start_time = time.perf_counter()
+        self._startup_times = dict()
+        self._scheduler = FrameScheduler(fps_cap)
+        self._delta_time = self._scheduler.update_step
         self._screen = pygame.display.set_mode((960, 720))
-        self._transparent_surface = pygame.Surface((960, 720), pygame.SRCALPHA)
+        self._compositor = Compositor()
+        self._dirty_regions = DirtyRegions((960, 720))
+        self._dirty_regions.mark_all()
         pygame.display.set_caption("ORDER AND CHAOS")
         self._running = True
-        self._clock = pygame.time.Clock()
+        pygame.event.set_blocked(pygame.MOUSEMOTION)  # nothing reacts to hovering, idle loop sleeps through it
+        self._game_state = "loading"
+        self._loading_render()
+        self._startup_times["first_frame"] = time.perf_counter() - start_time
+        self._start_time = start_time
+
+        # after display mode is set, images are converted to its format
+        self._assets = None
+        self._game_assets = None
+        self._asset_loader = ThreadPoolExecutor(2, thread_name_prefix="assets")
+        self._menu_assets_future = self._asset_loader.submit(self._load_menu_assets)
+        if os.path.exists(ASSETS_BUNDLE_PATH):  # bundle holds every asset
+            self._game_assets_future = self._menu_assets_future
+        else:
+            self._game_assets_future = self._asset_loader.submit(self._load_game_assets)
+
         self._board = GameBoard()
-        self._board.load_symbols_texture(self._assets['cross_img'], self._assets['circle_img'])
         self._mouse = Mouse()
 
-        self._maked_moves = list()
-
         self._bot = Bot()
+        if os.path.exists(TABLEBASE_PATH):  # built by build_tablebase.py
+            self._bot.set_tablebase(Tablebase(TABLEBASE_PATH))
+        self._bot_worker = BotWorker(self._bot)
         self._bot_difficulty = "hard"
         self._bot_role = "order"
 
-        self._game_state = "menu"
-
         self._cross_button = GUI.ChangeSymbolButton("cross")
         self._cross_button.update_position((740, 316))
         self._cross_button.update_size((64, 64))
         self._cross_button.update_colors(("grey", "black"))
-        self._cross_button.load_image(self._assets['cross_img'])
 
         self._circle_button = GUI.ChangeSymbolButton("circle")
         self._circle_button.update_position((740+96, 316))
         self._circle_button.update_size((64, 64))
         self._circle_button.update_colors(("grey", "black"))
-        self._circle_button.load_image(self._assets['circle_img'])
 
         self._order_menu_button = GUI.Button((96, 96), (291, 145+47), "light blue", "black")
         self._chaos_menu_button = GUI.Button((96, 96), (574, 145+47), "light blue", "black")
@@ -133,51 +214,162 @@ class GameEngine:
 
         self._easy_menu_button = GUI.Button((96, 96), (291, 145+190+35+47), "light blue", "black")
         self._hard_menu_button = GUI.Button((96, 96), (574, 145+190+35+47), "light blue", "black")
+        self._expert_menu_button = GUI.Button((96, 96), (432, 145+190+35+47), "light blue", "black")
         self._hard_menu_button.on_click()  # by deafult difficulty is hard
 
         self._order_button = GUI.Button((64, 64), (740, 120), "light blue", "black")
-        self._order_button.load_image(self._assets['order_img'])
-        self._order_button.change_image_scaling(2/3)
-
         self._chaos_button = GUI.Button((64, 64), (740+96, 120), "light blue", "black")
-        self._chaos_button.load_image(self._assets['chaos_img'])
-        self._chaos_button.change_image_scaling(2/3)
-
         self._undo_button = GUI.Button((164, 50), (740, 430), "light blue", "black")
-        self._undo_button.load_image(self._assets['undo_img'])
-
         self._restart_button = GUI.Button((164, 50), (740, 430+80), "light blue", "black")
-        self._restart_button.load_image(self._assets['restart_img'])
-
         self._menu_button = GUI.Button((164, 50), (740, 430+160), "light blue", "black")
-        self._menu_button.load_image(self._assets['menu_img'])
-
         self._start_button = GUI.Button((164, 50), (398, 600), "light blue", "black")
-        self._start_button.load_image(self._assets['start_img'])
 
         self._game_logo_text = GUI.Text()
-        self._game_logo_text.set_font(self._assets['font_path'], 64)
+        self._your_role_text = GUI.Text()
+
+        self._winner_text = GUI.Text(66)
+
+        self._board.set_dirty_regions(self._dirty_regions)
+        for button in (self._cross_button, self._circle_button, self._order_menu_button, self._chaos_menu_button,
+                       self._easy_menu_button, self._hard_menu_button, self._expert_menu_button, self._order_button,
+                       self._chaos_button, self._undo_button, self._restart_button, self._menu_button,
+                       self._start_button):
+            button.set_dirty_regions(self._dirty_regions)
+
+    def _load_menu_assets(self) -> AssetManager:
+        """
+        Loads assets needed by menu - from the bundle built by `build_assets.py` if it exists,
+        otherwise from config.json. Run on asset loader thread.
+
+        Raises
+        ------
+        FileNotFoundError
+            If `config.json` file or an asset is missing
+
+        Returns
+        -------
+        AssetManager
+            Loaded menu assets (every asset if loaded from bundle)
+        """
+
+        if os.path.exists(ASSETS_BUNDLE_PATH):
+            return AssetManager(bundle_path=ASSETS_BUNDLE_PATH)
+        assets = AssetManager(ASSETS_CONFIG_PATH)
+        self.add_menu_images(assets)
+        assets.build_atlas()
+        font_cache.render(assets.path('font_path'), 64, "Order And Chaos")
+        return assets
+
+    def _load_game_assets(self) -> AssetManager:
+        """
+        Loads assets needed by game screen from config.json, in parallel with menu assets.
+        Run on asset loader thread.
+
+        Raises
+        ------
+        FileNotFoundError
+            If `config.json` file or an asset is missing
+
+        Returns
+        -------
+        AssetManager
+            Loaded game assets
+        """
+
+        assets = AssetManager(ASSETS_CONFIG_PATH)
+        self.add_game_images(assets)
+        assets.build_atlas()
+        font_cache.render(assets.path('font_path'), 20, "(YOU)")
+        return assets
+
+    def _apply_menu_assets(self, assets: AssetManager) -> None:
+        """
+        Sets loaded menu assets to menu objects.
+
+        Parameters
+        ----------
+        assets: AssetManager
+            Loaded menu assets
+        """
+
+        self._assets = assets
+        self._start_button.set_image(assets.image('start_img'))
+        self._game_logo_text.set_font(assets.path('font_path'), 64)
         self._game_logo_text.set_text("Order And Chaos")
         self._game_logo_text.set_text_position((198, 35))
 
-        self._your_role_text = GUI.Text()
-        self._your_role_text.set_font(self._assets['font_path'], 20)
-        self._your_role_text.set_text("(YOU)")
+    def _apply_game_assets(self, assets: AssetManager) -> None:
+        """
+        Sets loaded game assets to game objects.
 
-        self._winner_text = GUI.Text(66)
+        Parameters
+        ----------
+        assets: AssetManager
+            Loaded game assets
+        """
+
+        self._game_assets = assets
+        self._board.set_symbols_texture(assets.image('cross_img', self._board.symbol_size()),
+                                        assets.image('circle_img', self._board.symbol_size()))
+        self._cross_button.set_image(assets.image('cross_img'))
+        self._circle_button.set_image(assets.image('circle_img'))
+        self._order_button.set_image(assets.image('order_img', scale=2/3))
+        self._chaos_button.set_image(assets.image('chaos_img', scale=2/3))
+        self._undo_button.set_image(assets.image('undo_img'))
+        self._restart_button.set_image(assets.image('restart_img'))
+        self._menu_button.set_image(assets.image('menu_img'))
+        self._your_role_text.set_font(assets.path('font_path'), 20)
+        self._your_role_text.set_text("(YOU)")
 
-    def _load_assets(self) -> None:
+    def _wait_for_game_assets(self) -> None:
         """
-        Loads assets paths to dictionary `assets` from config.json.
+        Waits until game assets are loaded (if they are not yet) and applies them.
 
         Raises
         ------
         FileNotFoundError
-            If `config.json` file is missing
+            If `config.json` file or an asset is missing
+        """
+
+        if self._game_assets_future is None:
+            return
+        self._apply_game_assets(self._game_assets_future.result())
+        self._game_assets_future = None
+        self._asset_loader.shutdown(wait=False)
+        self._startup_times["game"] = time.perf_counter() - self._start_time
+
+    @staticmethod
+    def add_menu_images(assets: AssetManager) -> None:
+        """
+        Adds every image used by menu to assets atlas.
+
+        Parameters
+        ----------
+        assets: AssetManager
+            Assets the images are added to
+        """
+
+        assets.add_image('start_img')
+
+    @staticmethod
+    def add_game_images(assets: AssetManager) -> None:
+        """
+        Adds every image used by game screen, in every size it is rendered in, to assets atlas.
+
+        Parameters
+        ----------
+        assets: AssetManager
+            Assets the images are added to
         """
 
-        with open("config.json") as json_file:
-            self._assets = json.load(json_file)
+        symbol_size = GameBoard().symbol_size()
+        for name in ('cross_img', 'circle_img'):
+            assets.add_image(name)
+            assets.add_image(name, symbol_size)
+        for name in ('order_img', 'chaos_img'):
+            assets.add_image(name, scale=2/3)
+        for name in ('undo_img', 'restart_img', 'menu_img'):
+            assets.add_image(name)
 
     def _start_game(self):
         """
@@ -185,14 +377,17 @@ class GameEngine:
         Called on game start and restart.
         """
 
+        self._bot_worker.cancel()
+        self._wait_for_game_assets()
+
         self._current_role = "order"
         self._selected_symbol = self._circle_button.on_click()
         self._cross_button.update_colors(("", "black"))
         self._winner = ""
 
         self._game_state = "game"
+        self._dirty_regions.mark_all()
 
-        self._maked_moves.clear()
         self._mouse.reset_mouse_pressing()
 
         self._board.set_up_board()
@@ -205,30 +400,83 @@ class GameEngine:
         self._bot.load_board(self._board.board)
         self._bot.set_difficulty(self._bot_difficulty)
         self._bot_time_delay = 1.5  # 1.5s
+        self._bot_time_budget = 0.5  # 0.5s - upper bound of bot thinking
         self._bot_clock = self._bot_time_delay
+        if self._bot_role == "chaos":  # player starts
+            self._bot.start_pondering(self._bot_role)
+
+    def set_fps_cap(self, fps_cap: float | None) -> None:
+        """
+        Sets maximal rendered frames per second.
+
+        Parameters
+        ----------
+        fps_cap: float | None
+            Frames per second, None or 0 for no limit
+        """
+
+        self._scheduler.set_fps_cap(fps_cap)
 
     def run(self) -> None:
         """
         Main game loop.
         Method that needs to be called for application to start.
+        Game is updated in fixed time steps and rendered at most `fps_cap` times per second.
+        When nothing changes until user input, the loop sleeps waiting for an event.
         """
 
-        self._delta_time = self._clock.tick(60) / 1000
+        self._scheduler.reset()
         while (self._running):
             self._process_events()
-            if self._game_state == "menu":
-                self._menu_update()
-                self._menu_render()
-            elif self._game_state == "game":
-                self._game_update()
-                self._game_render()
+            for _ in range(self._scheduler.advance()):
+                if self._game_state == "loading":
+                    self._loading_update()
+                elif self._game_state == "menu":
+                    self._menu_update()
+                elif self._game_state == "game":
+                    self._game_update()
+                self._mouse.reset_mouse_pressing()  # clicks are handled by one update
+            if self._scheduler.should_render():
+                if self._game_state == "loading":
+                    self._loading_render()
+                elif self._game_state == "menu":
+                    self._menu_render()
+                elif self._game_state == "game":
+                    self._game_render()
+                if self._running and self._is_idle():
+                    pygame.event.post(pygame.event.wait())
+                    self._scheduler.reset()
+                    continue
+            pygame.time.wait(int(self._scheduler.time_to_next_frame() * 1000))
+        self._asset_loader.shutdown(wait=True, cancel_futures=True)
+        self._bot_worker.close()
+        self._bot.stop_pondering()
+
+    def _is_idle(self) -> bool:
+        """
+        Checks if nothing changes until user input - no button is showing pressing
+        and bot is not going to move.
+
+        Returns
+        -------
+        bool
+            True if game loop can wait for an event
+        """
+
+        if self._game_state == "loading":
+            return False
+        if self._game_state == "menu":
+            return True
+        if self._undo_button.is_pressed() or self._restart_button.is_pressed() or self._menu_button.is_pressed():
+            return False
+        return bool(self._winner) or (self._current_role != self._bot_role and not self._bot_worker.is_thinking())
 
     def _process_events(self) -> None:
         """
         Process user input.
+        Mouse pressing is kept until an update handles it.
         """
 
-        self._mouse.reset_mouse_pressing()
         for event in pygame.event.get():
             self._mouse.update_mouse_position(pygame.mouse.get_pos())
             if event.type == pygame.QUIT:
@@ -238,11 +486,46 @@ class GameEngine:
             elif event.type == pygame.MOUSEBUTTONDOWN and event.dict['button'] == 3:
                 self._mouse._right_button = True
 
+    def _loading_update(self) -> None:
+        """
+        Applies assets loaded in the background. Called when `game_state` == `loading`.
+        Menu starts as soon as its assets are ready, game assets are applied when they finish loading.
+        """
+
+        if self._menu_assets_future is not None and self._menu_assets_future.done():
+            self._apply_menu_assets(self._menu_assets_future.result())
+            self._menu_assets_future = None
+            self._game_state = "menu"
+            self._dirty_regions.mark_all()
+            self._startup_times["menu"] = time.perf_counter() - self._start_time
+        if self._game_assets_future is not None and self._game_assets_future.done():
+            self._wait_for_game_assets()
+
+    def _loading_render(self) -> None:
+        """
+        Renders splash screen. Called when `game_state` == `loading`.
+        Drawn once, it does not change until assets are loaded.
+        """
+
+        if not self._dirty_regions.is_dirty():
+            return
+        self._screen.fill(pygame.Color(0, 255, 153))
+        pygame.draw.polygon(self._screen, (255, 255, 82), ((0, 0), (960, 720), (0, 720)))
+        loading_text = GUI.Text(40)
+        loading_text.set_text("LOADING...")
+        loading_text.set_text_center_position((480, 360))
+        loading_text.render(self._screen)
+        pygame.display.flip()
+        self._dirty_regions.clear()
+
     def _menu_update(self) -> None:
         """
         Updates menu objects. Called when `game_state` == `menu`.
+        Game assets loaded in the background are applied when ready.
         """
 
+        if self._game_assets_future is not None and self._game_assets_future.done():
+            self._wait_for_game_assets()
         if self._mouse.left_button_pressing:
             if self._order_menu_button.check_if_clicked(self._mouse.position):
                 self._bot_role = "chaos"
@@ -254,15 +537,18 @@ class GameEngine:
                 self._chaos_menu_button.on_click()
                 self._order_menu_button.reset_pressing(0, True)
 
-            if self._easy_menu_button.check_if_clicked(self._mouse.position):
-                self._bot_difficulty = "easy"
-                self._easy_menu_button.on_click()
-                self._hard_menu_button.reset_pressing(0, True)
-
-            if self._hard_menu_button.check_if_clicked(self._mouse.position):
-                self._bot_difficulty = "hard"
-                self._hard_menu_button.on_click()
-                self._easy_menu_button.reset_pressing(0, True)
+            difficulty_buttons = {
+                "easy": self._easy_menu_button,
+                "hard": self._hard_menu_button,
+                "expert": self._expert_menu_button,
+                }
+            for difficulty, button in difficulty_buttons.items():
+                if button.check_if_clicked(self._mouse.position):
+                    self._bot_difficulty = difficulty
+                    button.on_click()
+                    for other_button in difficulty_buttons.values():
+                        if other_button is not button:
+                            other_button.reset_pressing(0, True)
 
             if self._start_button.check_if_clicked(self._mouse.position):
                 self._start_game()
@@ -271,59 +557,85 @@ class GameEngine:
     def _menu_render(self) -> None:
         """
         Renders menu objects. Called when `game_state` == `menu`.
+        Only changed screen regions are redrawn - from cached background and buttons.
         """
 
-        self._screen.fill(pygame.Color(0, 255, 153))
-        pygame.draw.polygon(self._screen, (255, 255, 82), ((0, 0), (960, 720), (0, 720)))
+        if not self._dirty_regions.is_dirty():
+            return
+        background = self._compositor.layer("menu_background", (), (960, 720), self._draw_menu_background)
+        dirty_rects = self._dirty_regions.rects()
+        buttons = (self._order_menu_button, self._chaos_menu_button, self._easy_menu_button,
+                   self._hard_menu_button, self._expert_menu_button, self._start_button)
+        for dirty_rect in dirty_rects:
+            self._screen.set_clip(dirty_rect)
+            self._screen.blit(background, dirty_rect, dirty_rect)
+            for button in buttons:
+                if button.rect().colliderect(dirty_rect):
+                    button.render(self._screen)
+        self._screen.set_clip(None)
+        pygame.display.update(dirty_rects)
+        self._dirty_regions.clear()
+
+    def _draw_menu_background(self, surface: pygame.Surface) -> None:
+        """
+        Draws static part of the menu (everything except buttons).
+
+        Parameters
+        ----------
+        surface: pygame.Surface
+            Surface the background is drawn to
+        """
+
+        surface.fill(pygame.Color(0, 255, 153))
+        pygame.draw.polygon(surface, (255, 255, 82), ((0, 0), (960, 720), (0, 720)))
 
         buttons_space_rect = pygame.Rect(116, 145, 729, 190)
-        pygame.draw.rect(self._screen, pygame.Color(0, 181, 108), buttons_space_rect, 0, 10)
+        pygame.draw.rect(surface, pygame.Color(0, 181, 108), buttons_space_rect, 0, 10)
         buttons_space_rect.y = 145+190+35
-        pygame.draw.rect(self._screen, pygame.Color(0, 181, 108), buttons_space_rect, 0, 10)
+        pygame.draw.rect(surface, pygame.Color(0, 181, 108), buttons_space_rect, 0, 10)
 
         text_space_rect = pygame.Rect(116+35, 145+63, 140, 64)
-        pygame.draw.rect(self._screen, pygame.Color(0, 217, 130), text_space_rect)
+        pygame.draw.rect(surface, pygame.Color(0, 217, 130), text_space_rect)
         text_space_rect.x = 670
-        pygame.draw.rect(self._screen, pygame.Color(0, 217, 130), text_space_rect)
+        pygame.draw.rect(surface, pygame.Color(0, 217, 130), text_space_rect)
         text_space_rect.y = 370+63
-        pygame.draw.rect(self._screen, pygame.Color(0, 217, 130), text_space_rect)
+        pygame.draw.rect(surface, pygame.Color(0, 217, 130), text_space_rect)
         text_space_rect.x = 116+35
-        pygame.draw.rect(self._screen, pygame.Color(0, 217, 130), text_space_rect)
+        pygame.draw.rect(surface, pygame.Color(0, 217, 130), text_space_rect)
+        expert_text_space_rect = pygame.Rect(410, 519, 140, 36)
+        pygame.draw.rect(surface, pygame.Color(0, 217, 130), expert_text_space_rect)
 
         menu_buttons_text = GUI.Text(30)
         menu_buttons_text.set_text("ORDER")
         menu_buttons_text.set_text_center_position((220, 240))
-        menu_buttons_text.render(self._screen)
+        menu_buttons_text.render(surface)
 
         menu_buttons_text.set_text("CHAOS")
         menu_buttons_text.set_text_center_position((740, 240))
-        menu_buttons_text.render(self._screen)
+        menu_buttons_text.render(surface)
 
         menu_buttons_text.set_text("EASY")
         menu_buttons_text.set_text_center_position((220, 464))
-        menu_buttons_text.render(self._screen)
+        menu_buttons_text.render(surface)
 
         menu_buttons_text.set_text("HARD")
         menu_buttons_text.set_text_center_position((740, 464))
-        menu_buttons_text.render(self._screen)
+        menu_buttons_text.render(surface)
+
+        menu_buttons_text.set_text("EXPERT")
+        menu_buttons_text.set_text_center_position((480, 537))
+        menu_buttons_text.render(surface)
 
         menu_buttons_placeholder_text = GUI.Text(40)
 
         menu_buttons_placeholder_text.set_text("YOUR ROLE")
         menu_buttons_placeholder_text.set_text_center_position((480, 240))
-        menu_buttons_placeholder_text.render(self._screen)
+        menu_buttons_placeholder_text.render(surface)
 
         menu_buttons_placeholder_text.set_text("DIFFICULTY")
-        menu_buttons_placeholder_text.set_text_center_position((480, 464))
-        menu_buttons_placeholder_text.render(self._screen)
-        # pygame.draw.rect(screen, pygame.Color(26, 26, 26), cell_Rect, 3, 10)
-        self._order_menu_button.render(self._screen)
-        self._chaos_menu_button.render(self._screen)
-        self._easy_menu_button.render(self._screen)
-        self._hard_menu_button.render(self._screen)
-        self._start_button.render(self._screen)
-        self._game_logo_text.render(self._screen)
-        pygame.display.flip()
+        menu_buttons_placeholder_text.set_text_center_position((480, 396))
+        menu_buttons_placeholder_text.render(surface)
+        self._game_logo_text.render(surface)
 
     def _game_update(self) -> None:
         """
@@ -344,7 +656,7 @@ class GameEngine:
 
         # printing of already maked moves
         # if self._mouse._right_button:
-        #     print(self._maked_moves)
+        #     print(self._board.moves)
 
         self._undo_button.reset_pressing(self._delta_time)
         self._restart_button.reset_pressing(self._delta_time)
@@ -352,7 +664,10 @@ class GameEngine:
 
         if self._mouse.left_button_pressing:
             if self._menu_button.check_if_clicked(self._mouse.position):
+                self._bot_worker.cancel()
+                self._bot.stop_pondering()
                 self._game_state = "menu"
+                self._dirty_regions.mark_all()
                 return
             if self._restart_button.check_if_clicked(self._mouse.position):
                 self._restart_button.on_click()
@@ -360,29 +675,35 @@ class GameEngine:
                 return
             if self._undo_button.check_if_clicked(self._mouse.position):
                 self._undo_button.on_click()
-                if self._current_role != self._bot_role and (len(self._maked_moves) > 1) and not self._winner:
-                    last_two_moves = list()
-                    if len(self._maked_moves) > 0:
-                        last_two_moves.append(self._maked_moves.pop()[0])
-                        last_two_moves.append(self._maked_moves.pop()[0])
-                        self._board.undo_moves(last_two_moves)
-                        self._bot.undo_moves()
+                if self._current_role != self._bot_role and len(self._board.moves) > 1 and not self._winner:
+                    self._go_to_move(len(self._board.moves) - 2)
+
+        if self._mouse.right_button_pressing:
+            if self._undo_button.check_if_clicked(self._mouse.position):
+                self._undo_button.on_click()
+                if self._current_role != self._bot_role and len(self._board.undone_moves) > 1 and not self._winner:
+                    self._go_to_move(len(self._board.moves) + 2)
 
         if self._winner:  # game has ended
             return
 
         if self._current_role == self._bot_role:
+            # bot thinks in a worker thread during the delay, its move is shown when both are done
+            if not self._bot_worker.is_thinking():
+                self._bot_worker.request_move(self._bot_role, self._bot_time_budget)
             self._bot_clock -= self._delta_time
-            if self._bot_clock <= 0:
-                bot_move = self._bot.make_move(self._bot_role)
+            bot_move = self._bot_worker.poll() if self._bot_clock <= 0 else None
+            if bot_move is not None:
                 if self._board.update(bot_move[0], bot_move[1]):
-                    self._maked_moves.append(bot_move)
-                    self._winner = self._bot.check_winning()
+                    self._winner = self._bot.check_winning(bot_move)
                     if self._winner:
                         self._winner_text.set_text(f'{self._winner} won! GG!')
                         self._winner_text.set_text_center_position((360, 360))
+                        self._dirty_regions.mark_all()  # winner overlay
                     self._current_role = _return_oposite_role(self._current_role)
                     self._bot_clock = self._bot_time_delay
+                    if not self._winner:
+                        self._bot.start_pondering(self._bot_role)
                     # self._bot_role = _return_oposite_role(self._bot_role)  # bot vs bot
                     # this feature is not fully supported therefore it is not included in menu or anywhere else
                     # In order to turn on, uncomment the line. Recommended to change difficulty to hard.
@@ -402,33 +723,98 @@ class GameEngine:
                 if not cell_index[0]:  # calculated index is not correct (mouse was outside the game board)
                     return
                 if self._board.update(cell_index[1], self._selected_symbol):
-                    self._maked_moves.append((cell_index[1], f'p_{self._selected_symbol}'))
-                    self._winner = self._bot.check_winning()
+                    self._winner = self._bot.check_winning((cell_index[1], self._selected_symbol))
                     if self._winner:
                         self._winner_text.set_text(f'{self._winner} won! GG!')
                         self._winner_text.set_text_center_position((360, 360))
+                        self._dirty_regions.mark_all()  # winner overlay
                     self._current_role = _return_oposite_role(self._current_role)
                     return
 
+    def _go_to_move(self, move_number: int) -> None:
+        """
+        Undoes or redoes moves on board and bot until given number of moves is made.
+        Sets current role and winner to match the reached position.
+
+        Parameters
+        ----------
+        move_number: int
+            Number of moves that should be made after the call
+        """
+
+        self._bot_worker.cancel()
+        if self._winner:  # winner overlay is removed
+            self._dirty_regions.mark_all()
+        undone_moves, redone_moves = self._board.go_to_move(move_number)
+        for _ in undone_moves:
+            self._bot.undo_move()
+        self._winner = ""
+        for move in redone_moves:
+            self._winner = self._bot.check_winning(move)
+        if self._winner:
+            self._winner_text.set_text(f'{self._winner} won! GG!')
+            self._winner_text.set_text_center_position((360, 360))
+            self._dirty_regions.mark_all()
+        self._current_role = "order" if move_number % 2 == 0 else "chaos"
+        self._bot_clock = self._bot_time_delay
+        if not self._winner and self._current_role != self._bot_role:
+            self._bot.start_pondering(self._bot_role)
+
     def _game_render(self) -> None:
         """
         Renders game objects. Called when `game_state` == `game`.
+        Only changed screen regions are redrawn - from cached background and winner overlay,
+        board symbols and buttons.
         """
 
-        self._screen.fill(pygame.Color(0, 255, 153))
-
-        self._board.render(self._screen)
-        self._cross_button.render(self._screen)
-        self._circle_button.render(self._screen)
-        self._order_button.render(self._screen)
-        self._chaos_button.render(self._screen)
-        self._undo_button.render(self._screen)
-        self._restart_button.render(self._screen)
-        self._menu_button.render(self._screen)
-        self._your_role_text.render(self._screen)
+        if not self._dirty_regions.is_dirty():
+            return
+        background = self._compositor.layer("game_background", (self._bot_role,), (960, 720),
+                                            self._draw_game_background)
+        winner_overlay = None
         if self._winner:
-            winner_space_rect = pygame.Rect(42, 42, 636, 636)
-            pygame.draw.rect(self._transparent_surface, pygame.Color(200, 217, 130, 180), winner_space_rect)
-            self._screen.blit(self._transparent_surface, (0, 0))
-            self._winner_text.render(self._screen)
-        pygame.display.flip()
+            winner_overlay = self._compositor.layer("winner_overlay", (self._winner,), (960, 720),
+                                                    self._draw_winner_overlay, True)
+        dirty_rects = self._dirty_regions.rects()
+        buttons = (self._cross_button, self._circle_button, self._order_button, self._chaos_button,
+                   self._undo_button, self._restart_button, self._menu_button)
+        for dirty_rect in dirty_rects:
+            self._screen.set_clip(dirty_rect)
+            self._screen.blit(background, dirty_rect, dirty_rect)
+            self._board.render_symbols(self._screen, dirty_rect)
+            for button in buttons:
+                if button.rect().colliderect(dirty_rect):
+                    button.render(self._screen)
+            if winner_overlay is not None:
+                self._screen.blit(winner_overlay, dirty_rect, dirty_rect)
+        self._screen.set_clip(None)
+        pygame.display.update(dirty_rects)
+        self._dirty_regions.clear()
+
+    def _draw_game_background(self, surface: pygame.Surface) -> None:
+        """
+        Draws static part of the game screen - background, empty board cells and player's role text.
+
+        Parameters
+        ----------
+        surface: pygame.Surface
+            Surface the background is drawn to
+        """
+
+        surface.fill(pygame.Color(0, 255, 153))
+        self._board.render_cells(surface)
+        self._your_role_text.render(surface)
+
+    def _draw_winner_overlay(self, surface: pygame.Surface) -> None:
+        """
+        Draws semi-transparent winner overlay with winner text.
+
+        Parameters
+        ----------
+        surface: pygame.Surface
+            Transparent surface the overlay is drawn to
+        """
+
+        winner_space_rect = pygame.Rect(42, 42, 636, 636)
+        pygame.draw.rect(surface, pygame.Color(200, 217, 130, 180), winner_space_rect)
+        self._winner_text.render(surface)
@@ -0,0 +1,193 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from AlphaBeta import AlphaBetaSearch
+from TranspositionTable import TranspositionTable
+
+
+class LazySmpSearch:
+    """
+    A class representing Lazy SMP search - the main alpha-beta search and helper threads
+    search the same position at once and share one transposition table.
+    Helpers vary move ordering and every second one starts one ply deeper, entries they
+    store let the main search cut the tree earlier. The table is array-backed and stores
+    keys XOR-ed with data, so threads write it without locks.
+    Has the same interface as `AlphaBetaSearch` and can replace it.
+
+    ...
+
+    Attributes
+    ----------
+    threads: int
+        Number of searching threads (main search included)
+    table: TranspositionTable
+        Transposition table shared by every thread
+    main_search: AlphaBetaSearch
+        Search run in the calling thread, its move is returned
+    helpers: list[AlphaBetaSearch]
+        Searches run in helper threads
+    executor: ThreadPoolExecutor | None
+        Helper threads pool (None for one thread)
+    nodes: int
+        Number of nodes visited by the last search (all threads)
+    search_time: float
+        Duration of the last search (in seconds)
+
+    Methods
+    -------
+    new_game()
+        Clears transposition table.
+    search(values: list[int], order_to_move: bool, depth: int, deadline=None)
+        Returns best move for the side to move.
+    stats()
+        Returns statistics of the last search.
+    close()
+        Shuts helper threads down.
+    """
+
+    def __init__(self, threads: int = 2, table_size_megabytes: float = 16) -> None:
+        """
+        Parameters
+        ----------
+        threads: int, optional
+            Number of searching threads (deafult 2)
+        table_size_megabytes: float, optional
+            Transposition table memory size (deafult 16)
+        """
+
+        self.threads = max(threads, 1)
+        self.table = TranspositionTable(table_size_megabytes)
+        self.main_search = AlphaBetaSearch(table=self.table)
+        self.helpers = [AlphaBetaSearch(table=self.table, helper_id=helper_id)
+                        for helper_id in range(1, self.threads)]
+        self.executor = ThreadPoolExecutor(len(self.helpers)) if self.helpers else None
+        self.nodes = 0
+        self.search_time = 0.0
+        self._stop_event = threading.Event()
+        for helper in self.helpers:
+            helper.stop_event = self._stop_event
+
+    @property
+    def best_value(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Value of the best move of the main search.
+        """
+
+        return self.main_search.best_value
+
+    @property
+    def completed_depth(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Depth of the last iteration completed by the main search.
+        """
+
+        return self.main_search.completed_depth
+
+    def new_game(self) -> None:
+        """
+        Clears transposition table - entries are only reused between moves of one game.
+        """
+
+        self.table.clear()
+
+    def search(self, values: list[int], order_to_move: bool, depth: int, deadline: float = None) -> tuple[int, int]:
+        """
+        Returns best move of the main search, helpers are stopped when it ends.
+        Root results are cached and reused like in `AlphaBetaSearch.search()`.
+
+        Raises
+        ------
+        ValueError
+            If there is no move to make (board is full)
+
+        Parameters
+        ----------
+        values: list[int]
+            Board cells values
+        order_to_move: bool
+            True if order is to move, False if chaos
+        depth: int
+            Maximum search depth in plies (at least 1)
+        deadline: float, optional
+            `time.perf_counter()` time the search has to end by (deafult None - no deadline)
+
+        Returns
+        -------
+        (int, int)
+            > Index of board cell
+            > Symbol value
+        """
+
+        start_time = time.perf_counter()
+        values = list(values)
+        self.table.new_search()
+        self.table.probes = 0
+        self.table.hits = 0
+        self.nodes = 0
+        move = self.main_search.cached_search(values, order_to_move, depth, deadline, self._parallel_deepening)
+        self.search_time = time.perf_counter() - start_time
+        return move
+
+    def _parallel_deepening(self, values: list[int], order_to_move: bool, depth: int, deadline: float,
+                            first_depth: int) -> tuple[int, int]:
+        """
+        Runs iterative deepening of the main search with helpers searching alongside,
+        arguments and result are the same as in `AlphaBetaSearch.iterative_deepening()`.
+        """
+
+        self._stop_event.clear()
+        futures = [
+            self.executor.submit(helper.iterative_deepening, values, order_to_move, depth, deadline,
+                                 first_depth + helper.helper_id % 2)
+            for helper in self.helpers
+            ]
+        try:
+            move = self.main_search.iterative_deepening(values, order_to_move, depth, deadline, first_depth)
+        finally:
+            self._stop_event.set()
+            for future in futures:
+                future.exception()  # waits for the helper, its result is not used
+        self.nodes = self.main_search.nodes + sum(helper.nodes for helper in self.helpers)
+        return move
+
+    def stats(self) -> dict:
+        """
+        Returns statistics of the last search.
+
+        Returns
+        -------
+        dict
+            > "nodes" - all threads
+            > "depth" - last depth completed by the main search
+            > "time" - seconds
+            > "nodes_per_second"
+            > "table_hit_rate"
+            > "table_size_megabytes"
+            > "threads"
+        """
+
+        nodes_per_second = self.nodes / self.search_time if self.search_time > 0 else 0.0
+        return {
+            'nodes': self.nodes,
+            'depth': self.main_search.completed_depth,
+            'time': self.search_time,
+            'nodes_per_second': nodes_per_second,
+            'table_hit_rate': self.table.hit_rate(),
+            'table_size_megabytes': self.table.size_megabytes(),
+            'threads': self.threads
+            }
+
+    def close(self) -> None:
+        """
+        Shuts helper threads down.
+        """
+
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
@@ -0,0 +1,324 @@
+from functools import lru_cache
+from BitBoard import BitBoard, cells_mask, line_windows, check_line_win, check_line_winnability
+
+
+# line lengths that appear on the board: rows, columns, long diagonals (6) and short diagonals (5)
+LINE_LENGTHS = (5, 6)
+# crosses part of a line key is shifted by this amount (board has at most 64 cells)
+CROSSES_KEY_SHIFT = 64
+
+
+def encode_array(array: list[int]) -> int:
+    """
+    Encodes line cells values as base-3 code.
+    Cell on position `i` has weight 3**i.
+
+    Parameters
+    ----------
+    array: list[int]
+        Line cells values (0, 1, 2)
+
+    Returns
+    -------
+    int
+        Base-3 code of the line
+    """
+
+    code = 0
+    for value in reversed(array):
+        code = code * 3 + value
+    return code
+
+
+def decode_code(code: int, length: int) -> list[int]:
+    """
+    Decodes base-3 code to line cells values.
+
+    Parameters
+    ----------
+    code: int
+        Base-3 code of the line
+    length: int
+        Line length
+
+    Returns
+    -------
+    list[int]
+        Line cells values
+    """
+
+    array = []
+    for _ in range(length):
+        code, value = divmod(code, 3)
+        array.append(value)
+    return array
+
+
+def line_key(circles: int, crosses: int, array_mask: int) -> int:
+    """
+    Returns key of a line state built from board bitmasks.
+    Used to index lookups from `codes_lookup()`.
+
+    Parameters
+    ----------
+    circles: int
+        Circles bitmask
+    crosses: int
+        Crosses bitmask
+    array_mask: int
+        Bitmask of the line cells
+
+    Returns
+    -------
+    int
+        Line key
+    """
+
+    return (circles & array_mask) | (crosses & array_mask) << CROSSES_KEY_SHIFT
+
+
+def codes_lookup(indexes_array: list[int]) -> dict[int, int]:
+    """
+    Returns dictionary translating every `line_key()` of given line to its base-3 code.
+
+    Parameters
+    ----------
+    indexes_array: list[int]
+        Line cells indexes
+
+    Returns
+    -------
+    dict[int, int]
+        Line key -> base-3 code
+    """
+
+    lookup = {}
+    for code in range(3**len(indexes_array)):
+        key = 0
+        for position, value in enumerate(decode_code(code, len(indexes_array))):
+            if value == 1:
+                key |= 1 << indexes_array[position]
+            elif value == 2:
+                key |= 1 << (indexes_array[position] + CROSSES_KEY_SHIFT)
+        lookup[key] = code
+    return lookup
+
+
+class LineTable:
+    """
+    A class representing precomputed line information for every base-3 code of a line.
+
+    ...
+
+    Attributes
+    ----------
+    length: int
+        Line length (5 or 6)
+    win: list[bool]
+        True if line is won (exactly five same symbols in a row)
+    winnability: list[bool]
+        True if line is still winnable
+    closest: list[tuple[str, int]]
+        Symbol closest to win in the line ("cross" on tie) and its count
+    chaos_reply: list[tuple[int, str] | None]
+        Best chaos move in the line - (position, symbol),
+        None if any middle cell is as good as other (random pick)
+    order_reply: list[tuple[tuple[int, ...], str]]
+        Best order moves in the line - (candidate positions, symbol)
+    potential: list[int]
+        Highest number of one symbol in a five-cell window that can still be won (0 if not winnable)
+    score: list[int]
+        Line value for order used by searches - 4**potential, 0 if line is not winnable
+    """
+
+    def __init__(self, length: int) -> None:
+        """
+        Parameters
+        ----------
+        length: int
+            Line length
+        """
+
+        self.length = length
+        self.win = []
+        self.winnability = []
+        self.closest = []
+        self.chaos_reply = []
+        self.order_reply = []
+        self.potential = []
+        self.score = []
+        windows = line_windows(list(range(length)))
+        for code in range(3**length):
+            array = decode_code(code, length)
+            board = BitBoard(array)
+            self.win.append(check_line_win(board.circles, board.crosses, windows))
+            self.winnability.append(check_line_winnability(board.circles, board.crosses, windows))
+            circle_count = array.count(1)
+            cross_count = array.count(2)
+            if cross_count >= circle_count:
+                closest = ('cross', cross_count)
+            else:
+                closest = ('circle', circle_count)
+            self.closest.append(closest)
+            self.chaos_reply.append(_chaos_reply(board, windows, closest[0]))
+            self.order_reply.append((_order_candidates(array), closest[0]))
+            potential = _potential(board, windows)
+            self.potential.append(potential)
+            self.score.append(4**potential if self.winnability[-1] else 0)
+
+
+def _potential(board: BitBoard, windows: tuple) -> int:
+    """
+    Returns highest number of one symbol in a five-cell window that can still be won.
+    """
+
+    potential = 0
+    for window, outside in windows:
+        if not board.crosses & window and not board.circles & outside:
+            potential = max(potential, (board.circles & window).bit_count())
+        if not board.circles & window and not board.crosses & outside:
+            potential = max(potential, (board.crosses & window).bit_count())
+    return potential
+
+
+def _chaos_reply(board: BitBoard, windows: tuple, closest_symbol: str) -> tuple[int, str] | None:
+    """
+    Returns best chaos move in a line.
+    First tries to make the line unwinnable with symbol opposite to the closest one,
+    otherwise puts closest symbol on the line end (or opposite if it would win).
+    """
+
+    oposite_symbol = 'circle' if closest_symbol == 'cross' else 'cross'
+    available_positions = [position for position in range(len(board)) if board.is_empty(position)]
+    for position in available_positions:
+        bit = 1 << position
+        if oposite_symbol == 'circle':
+            winnable = check_line_winnability(board.circles | bit, board.crosses, windows)
+        else:
+            winnable = check_line_winnability(board.circles, board.crosses | bit, windows)
+        if not winnable:
+            return (position, oposite_symbol)
+    if board.is_empty(0):  # special case, when array winnability depends on first and last square
+        position = 0
+    elif board.is_empty(len(board) - 1):
+        position = len(board) - 1
+    else:
+        return None
+    bit = 1 << position
+    if closest_symbol == 'circle':
+        winning = check_line_win(board.circles | bit, board.crosses, windows)
+    else:
+        winning = check_line_win(board.circles, board.crosses | bit, windows)
+    if winning:
+        return (position, oposite_symbol)
+    return (position, closest_symbol)
+
+
+def _order_candidates(array: list[int]) -> tuple[int, ...]:
+    """
+    Returns positions order should pick from - empty 'middle' cells first,
+    otherwise first or last empty cell.
+    """
+
+    available_positions = [position for position, value in enumerate(array) if value == 0]
+    available_middle_positions = tuple(position for position in available_positions if 1 <= position <= 4)
+    if available_middle_positions:
+        return available_middle_positions
+    if available_positions:
+        return (available_positions[0], available_positions[-1])
+    return ()
+
+
+# tables for every line length on the board, built once on import
+LINE_TABLES = {length: LineTable(length) for length in LINE_LENGTHS}
+
+
+@lru_cache(maxsize=None)
+def line_lookups(indexes_array: tuple[int, ...]) -> tuple[int, dict[int, int], LineTable]:
+    """
+    Returns everything needed for one-index line checks:
+    line bitmask, key->code lookup and the line table.
+    Results are cached, so lookups are built once per line.
+
+    Parameters
+    ----------
+    indexes_array: tuple[int, ...]
+        Line cells indexes
+
+    Returns
+    -------
+    (int, dict[int, int], LineTable)
+    """
+
+    return (cells_mask(indexes_array), codes_lookup(indexes_array), LINE_TABLES[len(indexes_array)])
+
+
+def board_indexes_arrays(board_size: int = 6) -> list[list[int]]:
+    """
+    Returns arrays of indexes that needs to be check for game win.
+    Arrays are lists of columns/rows/diagonal board cells indexes.
+
+    Parameters
+    ----------
+    board_size: int, optional
+        One of board's dimension size (deafult 6)
+
+    Returns
+    -------
+    list[list[int]]
+        Lists of board cells indexes
+    """
+
+    indexes_arrays = []
+    # checking columns:
+    for y in range(board_size):
+        array = []
+        for x in range(board_size):
+            array.append(y * board_size + x)
+        indexes_arrays.append(array)
+
+    # checking rows:
+    for x in range(board_size):
+        array = []
+        for y in range(board_size):
+            array.append(y * board_size + x)
+        indexes_arrays.append(array)
+
+    # checking diagonals:
+    array = [i for i in range(0, 36, 7)]
+    indexes_arrays.append(array)
+    array = [i for i in range(1, 30, 7)]
+    indexes_arrays.append(array)
+    array = [i for i in range(6, 35, 7)]
+    indexes_arrays.append(array)
+    array = [i for i in range(4, 25, 5)]
+    indexes_arrays.append(array)
+    array = [i for i in range(5, 31, 5)]
+    indexes_arrays.append(array)
+    array = [i for i in range(11, 32, 5)]
+    indexes_arrays.append(array)
+    return indexes_arrays
+
+
+def board_cells_arrays(indexes_arrays: list[list[int]], cells_amount: int) -> list[tuple[tuple[int, int], ...]]:
+    """
+    Returns arrays going through each board cell.
+
+    Parameters
+    ----------
+    indexes_arrays: list[list[int]]
+        Arrays of board cells indexes, array id is its position in the list
+    cells_amount: int
+        Number of board cells
+
+    Returns
+    -------
+    list[tuple[tuple[int, int], ...]]
+        For each cell - pairs (array id, weight of the cell in array base-3 code)
+    """
+
+    cells_arrays = [[] for _ in range(cells_amount)]
+    for array_id, array in enumerate(indexes_arrays):
+        for position, cell in enumerate(array):
+            cells_arrays[cell].append((array_id, 3**position))
+    return [tuple(cell_arrays) for cell_arrays in cells_arrays]
@@ -0,0 +1,373 @@
+import math
+import multiprocessing
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from SearchPosition import SearchPosition, NO_WINNER, ORDER_WON
+from Symmetry import unique_moves
+
+
+# UCT exploration constant
+EXPLORATION = 1.4
+# deadline and stop event are checked every (TIME_CHECK_PLAYOUTS + 1) playouts
+TIME_CHECK_PLAYOUTS = 15
+# time (in seconds) between stop event checks while waiting for worker processes
+STOP_CHECK_INTERVAL = 0.01
+
+# stop event of the worker process, set by the pool initializer
+_worker_stop_event = None
+
+
+class _Node:
+    """
+    A class representing Monte Carlo search tree node.
+
+    ...
+
+    Attributes
+    ----------
+    move: tuple[int, int] | None
+        Move leading to the node (None for root)
+    parent: _Node | None
+        Parent node
+    order_to_move: bool
+        True if order is to move in the node
+    result: int
+        Game result if the node is terminal or side to move has a winning move, else NO_WINNER
+    children: list[_Node]
+        Expanded child nodes
+    untried_moves: list[tuple[int, int]] | None
+        Moves not expanded yet (None before first visit)
+    visits: int
+        Number of playouts through the node
+    wins: float
+        Number of playouts won by the side that made the node move
+    """
+
+    __slots__ = ('move', 'parent', 'order_to_move', 'result', 'children', 'untried_moves', 'visits', 'wins')
+
+    def __init__(self, move, parent, order_to_move: bool, result: int = NO_WINNER) -> None:
+        self.move = move
+        self.parent = parent
+        self.order_to_move = order_to_move
+        self.result = result
+        self.children = []
+        self.untried_moves = None
+        self.visits = 0
+        self.wins = 0.0
+
+    def select_child(self):
+        """
+        Returns child with the highest UCT value.
+        """
+
+        log_visits = math.log(self.visits)
+        best_child = None
+        best_value = -1.0
+        for child in self.children:
+            value = child.wins / child.visits + EXPLORATION * math.sqrt(log_visits / child.visits)
+            if value > best_value:
+                best_value = value
+                best_child = child
+        return best_child
+
+
+def _set_worker_stop_event(stop_event) -> None:
+    """
+    Sets stop event of the worker process (process pool initializer).
+    """
+
+    global _worker_stop_event
+    _worker_stop_event = stop_event
+
+
+def _run_worker_playouts(values: list[int], order_to_move: bool, playouts: int, deadline: float,
+                         seed: int) -> tuple[dict, int]:
+    """
+    Runs playouts in the worker process until its stop event is set (see `run_playouts()`).
+    """
+
+    return run_playouts(values, order_to_move, playouts, deadline, seed, _worker_stop_event)
+
+
+def run_playouts(values: list[int], order_to_move: bool, playouts: int = None, deadline: float = None,
+                 seed: int = None, stop_event=None) -> tuple[dict, int]:
+    """
+    Builds UCT tree from given position and returns root moves statistics.
+    Module level function, so it can be sent to worker processes.
+
+    Parameters
+    ----------
+    values: list[int]
+        Board cells values
+    order_to_move: bool
+        True if order is to move
+    playouts: int, optional
+        Number of playouts to run (deafult None - until time budget ends)
+    deadline: float, optional
+        `time.perf_counter()` time to run playouts until (deafult None - until playouts are done).
+        The clock is system-wide, so a deadline set by the parent process holds in workers
+    seed: int, optional
+        Random generator seed
+    stop_event: threading.Event | multiprocessing.Event, optional
+        Event that stops playouts when set (deafult None)
+
+    Returns
+    -------
+    (dict, int)
+        > Root moves statistics - move: (visits, wins)
+        > Number of playouts run
+    """
+
+    rng = random.Random(seed)
+    position = SearchPosition(values)
+    root = _Node(None, None, order_to_move)
+    root.untried_moves = unique_moves(position.cells, _expansion_moves(position, order_to_move, rng))
+    if not root.untried_moves:
+        return {}, 0
+    done = 0
+    while playouts is None or done < playouts:
+        # at least one playout is run, so a move is found even if the deadline passed in worker start
+        if done and not (done - 1) & TIME_CHECK_PLAYOUTS:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            if stop_event is not None and stop_event.is_set():
+                break
+        _run_iteration(root, position, rng)
+        done += 1
+    return {child.move: (child.visits, child.wins) for child in root.children}, done
+
+
+def _run_iteration(root: _Node, position: SearchPosition, rng: random.Random) -> None:
+    """
+    Runs one selection - expansion - playout - backpropagation iteration.
+    """
+
+    node = root
+    played = 0
+    # selection
+    while node.result == NO_WINNER and node.untried_moves is not None and not node.untried_moves:
+        node = node.select_child()
+        position.play(node.move[0], node.move[1])
+        played += 1
+    # expansion
+    if node.result == NO_WINNER:
+        if node.untried_moves is None:
+            node.untried_moves = _expansion_moves(position, node.order_to_move, rng)
+        move = node.untried_moves.pop()
+        result = position.play(move[0], move[1])
+        played += 1
+        child = _Node(move, node, not node.order_to_move, result)
+        node.children.append(child)
+        if result != NO_WINNER and node.parent is not None and node.order_to_move == (result == ORDER_WON):
+            # side to move has a winning move - node is won, it won't be expanded anymore
+            node.result = result
+        node = child
+    # playout
+    result = node.result
+    if result == NO_WINNER:
+        result = random_playout(position, rng)
+    for _ in range(played):
+        position.undo()
+    # backpropagation - node wins count for the side that moved into it
+    while node is not None:
+        node.visits += 1
+        if node.parent is not None and node.parent.order_to_move == (result == ORDER_WON):
+            node.wins += 1
+        node = node.parent
+
+
+def _expansion_moves(position: SearchPosition, order_to_move: bool, rng: random.Random) -> list[tuple[int, int]]:
+    """
+    Returns moves in expansion order - the most promising move (by evaluation change) is last,
+    so it is expanded first. Equal moves are shuffled.
+    """
+
+    moves = position.generate_moves()
+    rng.shuffle(moves)
+    if order_to_move:
+        moves.sort(key=lambda move: position.move_score_change(move[0], move[1]))
+    else:
+        moves.sort(key=lambda move: -position.move_score_change(move[0], move[1]))
+    return moves
+
+
+def random_playout(position: SearchPosition, rng: random.Random) -> int:
+    """
+    Plays random moves until the game ends and restores the position.
+
+    Parameters
+    ----------
+    position: SearchPosition
+        Position to play from (not finished)
+    rng: random.Random
+        Random generator
+
+    Returns
+    -------
+    int
+        ORDER_WON or CHAOS_WON
+    """
+
+    empty_cells = [cell_index for cell_index, value in enumerate(position.cells) if value == 0]
+    result = NO_WINNER
+    played = 0
+    while result == NO_WINNER:
+        index = rng.randrange(len(empty_cells))
+        cell_index = empty_cells[index]
+        empty_cells[index] = empty_cells[-1]
+        empty_cells.pop()
+        result = position.play(cell_index, rng.getrandbits(1) + 1)
+        played += 1
+    for _ in range(played):
+        position.undo()
+    return result
+
+
+class MonteCarloTreeSearch:
+    """
+    A class representing Monte Carlo tree search with UCT selection and random playouts.
+    With more than one worker, root parallelization is used - every worker process builds
+    its own tree and visit counts of root moves are merged.
+
+    ...
+
+    Attributes
+    ----------
+    workers: int
+        Number of worker processes (1 - search in current process)
+    executor: ProcessPoolExecutor | None
+        Worker processes pool, created on first parallel search
+    playouts: int
+        Number of playouts run by the last search (all workers)
+    search_time: float
+        Duration of the last search (in seconds)
+    root_stats: dict
+        Merged root moves statistics of the last search - move: (visits, wins)
+    stop_event: threading.Event | None
+        Event that stops running search when set (search returns the best move so far)
+    worker_stop_event: multiprocessing.Event | None
+        Event passed to worker processes, set when `stop_event` is
+
+    Methods
+    -------
+    search(values: list[int], order_to_move: bool, playouts=None, time_budget=None)
+        Returns move with the most visits.
+    stats()
+        Returns statistics of the last search.
+    close()
+        Shuts worker processes down.
+    """
+
+    def __init__(self, workers: int = 1) -> None:
+        """
+        Parameters
+        ----------
+        workers: int, optional
+            Number of worker processes (deafult 1)
+        """
+
+        self.workers = max(workers, 1)
+        self.executor = None
+        self.playouts = 0
+        self.search_time = 0.0
+        self.root_stats = {}
+        self.stop_event = None
+        self.worker_stop_event = None
+
+    def search(self, values: list[int], order_to_move: bool, playouts: int = None,
+               time_budget: float = None) -> tuple[int, int]:
+        """
+        Returns the most visited root move.
+
+        Raises
+        ------
+        ValueError
+            If neither playouts nor time budget is given, or there is no move to make
+
+        Parameters
+        ----------
+        values: list[int]
+            Board cells values
+        order_to_move: bool
+            True if order is to move
+        playouts: int, optional
+            Number of playouts per worker (deafult None - until time budget ends)
+        time_budget: float, optional
+            Time (in seconds) to search for, including worker processes start
+            (deafult None - until playouts are done)
+
+        Returns
+        -------
+        (int, int)
+            > Index of board cell
+            > Symbol value
+        """
+
+        if playouts is None and time_budget is None:
+            raise ValueError
+        start_time = time.perf_counter()
+        # deadline is set here, so pool start and sending the job count towards the budget
+        deadline = None if time_budget is None else start_time + time_budget
+        values = list(values)
+        if self.workers == 1:
+            results = [run_playouts(values, order_to_move, playouts, deadline, random.getrandbits(32),
+                                    self.stop_event)]
+        else:
+            if self.executor is None:
+                self.worker_stop_event = multiprocessing.Event()
+                self.executor = ProcessPoolExecutor(self.workers, initializer=_set_worker_stop_event,
+                                                    initargs=(self.worker_stop_event,))
+            self.worker_stop_event.clear()
+            futures = [
+                self.executor.submit(_run_worker_playouts, values, order_to_move, playouts, deadline,
+                                     random.getrandbits(32))
+                for _ in range(self.workers)
+                ]
+            pending = futures
+            while pending:
+                _, pending = wait(pending, STOP_CHECK_INTERVAL)
+                if self.stop_event is not None and self.stop_event.is_set():
+                    self.worker_stop_event.set()
+            results = [future.result() for future in futures]
+        self.root_stats = {}
+        self.playouts = 0
+        for moves_stats, done in results:
+            self.playouts += done
+            for move, (visits, wins) in moves_stats.items():
+                merged_visits, merged_wins = self.root_stats.get(move, (0, 0.0))
+                self.root_stats[move] = (merged_visits + visits, merged_wins + wins)
+        self.search_time = time.perf_counter() - start_time
+        if not self.root_stats:
+            raise ValueError
+        return max(self.root_stats, key=lambda move: self.root_stats[move][0])
+
+    def stats(self) -> dict:
+        """
+        Returns statistics of the last search.
+
+        Returns
+        -------
+        dict
+            > "playouts"
+            > "time" - seconds
+            > "playouts_per_second"
+            > "workers"
+        """
+
+        playouts_per_second = self.playouts / self.search_time if self.search_time > 0 else 0.0
+        return {
+            'playouts': self.playouts,
+            'time': self.search_time,
+            'playouts_per_second': playouts_per_second,
+            'workers': self.workers
+            }
+
+    def close(self) -> None:
+        """
+        Shuts worker processes down.
+        """
+
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
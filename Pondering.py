@@ -0,0 +1,125 @@
+import threading
+from AlphaBeta import AlphaBetaSearch
+from SearchPosition import SearchPosition, NO_WINNER
+from Symmetry import unique_moves
+
+
+class Ponderer:
+    """
+    A class representing pondering - searching bot replies during opponent's turn.
+    A background thread searches opponent replies, most likely first, with increasing depth -
+    all replies at depths 1 and 2, then half of them less at every next depth.
+    Results are put to the root cache of bot search and entries to its transposition table,
+    so bot search after the real reply finds them.
+
+    ...
+
+    Attributes
+    ----------
+    search: AlphaBetaSearch
+        Search run by the pondering thread, shares table and root cache with bot search
+    max_depth: int
+        Maximum depth searched for each reply
+    thread: threading.Thread | None
+        Pondering thread, None if pondering was not started
+    searched_replies: int
+        Number of reply searches finished by the last pondering
+    reached_depth: int
+        Last depth fully pondered by the last pondering
+
+    Methods
+    -------
+    start(values: list[int], bot_order: bool)
+        Starts pondering a position with opponent to move.
+    stop()
+        Stops pondering and waits for the thread to end.
+    is_running()
+        Returns True if pondering thread is running.
+    """
+
+    def __init__(self, bot_search: AlphaBetaSearch, max_depth: int = 6) -> None:
+        """
+        Parameters
+        ----------
+        bot_search: AlphaBetaSearch
+            Bot search the results are prepared for
+        max_depth: int, optional
+            Maximum depth searched for each reply (deafult 6)
+        """
+
+        self.search = AlphaBetaSearch(table=bot_search.table)
+        self.search.root_cache = bot_search.root_cache
+        self.search.stop_event = threading.Event()
+        self.max_depth = max_depth
+        self.thread = None
+        self.searched_replies = 0
+        self.reached_depth = 0
+
+    def start(self, values: list[int], bot_order: bool) -> None:
+        """
+        Starts pondering a position with opponent to move. Running pondering is stopped first.
+
+        Parameters
+        ----------
+        values: list[int]
+            Board cells values (copied)
+        bot_order: bool
+            True if bot plays order
+        """
+
+        self.stop()
+        self.search.stop_event.clear()
+        self.searched_replies = 0
+        self.reached_depth = 0
+        self.thread = threading.Thread(target=self._ponder, args=(list(values), bot_order), daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops pondering and waits for the thread to end (search checks the stop every few nodes).
+        """
+
+        if self.thread is not None:
+            self.search.stop_event.set()
+            self.thread.join()
+            self.thread = None
+
+    def is_running(self) -> bool:
+        """
+        Returns
+        -------
+        bool
+            True if pondering thread is running
+        """
+
+        return self.thread is not None and self.thread.is_alive()
+
+    def _ponder(self, values: list[int], bot_order: bool) -> None:
+        """
+        Searches positions after every opponent reply, depth by depth, until stopped.
+        """
+
+        position = SearchPosition(values)
+        replies = position.generate_moves()
+        # opponent's most promising replies first
+        if bot_order:
+            replies.sort(key=lambda move: position.move_score_change(move[0], move[1]))
+        else:
+            replies.sort(key=lambda move: -position.move_score_change(move[0], move[1]))
+        replies = unique_moves(values, replies)
+        stop_event = self.search.stop_event
+        # one table age for the whole pondering, entries of every reply stay equally fresh
+        self.search.table.new_search()
+        for depth in range(1, self.max_depth + 1):
+            # deeper iterations search fewer, more likely replies
+            width = max(len(replies) >> max(depth - 2, 0), 1)
+            for reply in replies[:width]:
+                if stop_event.is_set():
+                    return
+                if position.play(reply[0], reply[1]) == NO_WINNER:
+                    self.search.search(position.cells, bot_order, depth, new_search=False)
+                    if self.search.completed_depth < depth and stop_event.is_set():
+                        return
+                    self.searched_replies += 1
+                position.undo()
+            self.reached_depth = depth
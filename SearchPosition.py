@@ -0,0 +1,242 @@
+import random
+from LineTables import LINE_TABLES, encode_array, board_indexes_arrays, board_cells_arrays
+
+
+BOARD_SIZE = 6
+CELLS_AMOUNT = BOARD_SIZE**2
+INDEXES_ARRAYS = board_indexes_arrays(BOARD_SIZE)
+CELLS_ARRAYS = board_cells_arrays(INDEXES_ARRAYS, CELLS_AMOUNT)
+ARRAYS_TABLES = [LINE_TABLES[len(array)] for array in INDEXES_ARRAYS]
+
+# results of `SearchPosition.play()`
+NO_WINNER = 0
+ORDER_WON = 1
+CHAOS_WON = -1
+
+# Zobrist keys - ZOBRIST_KEYS[cell][value], value 0 (empty) has key 0
+_zobrist_random = random.Random(0x0DE4C4A05)
+ZOBRIST_KEYS = [(0, _zobrist_random.getrandbits(64), _zobrist_random.getrandbits(64)) for _ in range(CELLS_AMOUNT)]
+# XOR-ed into the hash when chaos is to move
+ZOBRIST_CHAOS_TO_MOVE = _zobrist_random.getrandbits(64)
+
+
+def zobrist_hash(values: list[int]) -> int:
+    """
+    Returns Zobrist hash of a board.
+
+    Parameters
+    ----------
+    values: list[int]
+        Board cells values
+
+    Returns
+    -------
+    int
+        64-bit position hash
+    """
+
+    position_hash = 0
+    for cell, value in enumerate(values):
+        position_hash ^= ZOBRIST_KEYS[cell][value]
+    return position_hash
+
+
+class SearchPosition:
+    """
+    A class representing a board position for tree searches.
+    Keeps base-3 codes of every array (row/column/diagonal), number of still winnable arrays,
+    order's evaluation score and Zobrist hash, all updated incrementally by `play()` and `undo()`.
+
+    ...
+
+    Attributes
+    ----------
+    cells: list[int]
+        Board cells values
+    codes: list[int]
+        Base-3 code of every array
+    winnable_arrays: int
+        Number of arrays that can still be won
+    empty_cells: int
+        Number of empty cells
+    score: int
+        Order's evaluation - sum of arrays scores from line tables
+    hash: int
+        Zobrist hash of the position
+    moves: list[tuple[int, int]]
+        Stack of played moves (cell index, symbol value)
+
+    Methods
+    -------
+    play(cell_index: int, value: int)
+        Plays a move and returns the game result.
+    undo()
+        Undoes the last played move.
+    generate_moves()
+        Returns moves worth searching.
+    winner()
+        Returns winner of the position.
+    move_score_change(cell_index: int, value: int)
+        Returns change of order's evaluation the move would make.
+    """
+
+    def __init__(self, values: list[int] = None) -> None:
+        """
+        Parameters
+        ----------
+        values: list[int], optional
+            Board cells values (deafult empty board)
+        """
+
+        if values is None:
+            values = [0] * CELLS_AMOUNT
+        self.cells = list(values)
+        self.codes = [encode_array([self.cells[cell] for cell in array]) for array in INDEXES_ARRAYS]
+        self.winnable_arrays = sum(table.winnability[code] for table, code in zip(ARRAYS_TABLES, self.codes))
+        self.empty_cells = self.cells.count(0)
+        self.score = sum(table.score[code] for table, code in zip(ARRAYS_TABLES, self.codes))
+        self.hash = zobrist_hash(self.cells)
+        self.moves = []
+
+    def play(self, cell_index: int, value: int) -> int:
+        """
+        Plays a move on an empty cell.
+
+        Parameters
+        ----------
+        cell_index: int
+            Index of board cell
+        value: int
+            Symbol value
+
+        Returns
+        -------
+        int
+            > ORDER_WON - move made five in a row
+            > CHAOS_WON - no array can be won anymore
+            > NO_WINNER
+        """
+
+        self.cells[cell_index] = value
+        self.hash ^= ZOBRIST_KEYS[cell_index][value]
+        self.empty_cells -= 1
+        self.moves.append((cell_index, value))
+        codes = self.codes
+        won = False
+        for array_id, weight in CELLS_ARRAYS[cell_index]:
+            table = ARRAYS_TABLES[array_id]
+            old_code = codes[array_id]
+            code = old_code + value * weight
+            codes[array_id] = code
+            self.score += table.score[code] - table.score[old_code]
+            if table.winnability[old_code] and not table.winnability[code]:
+                self.winnable_arrays -= 1
+            if table.win[code]:
+                won = True
+        if won:
+            return ORDER_WON
+        if self.winnable_arrays == 0 or self.empty_cells == 0:
+            return CHAOS_WON
+        return NO_WINNER
+
+    def undo(self) -> tuple[int, int]:
+        """
+        Undoes the last played move.
+
+        Raises
+        ------
+        IndexError
+            If there is no move to undo
+
+        Returns
+        -------
+        (int, int)
+            Undone move (cell index, symbol value)
+        """
+
+        cell_index, value = self.moves.pop()
+        self.cells[cell_index] = 0
+        self.hash ^= ZOBRIST_KEYS[cell_index][value]
+        self.empty_cells += 1
+        codes = self.codes
+        for array_id, weight in CELLS_ARRAYS[cell_index]:
+            table = ARRAYS_TABLES[array_id]
+            new_code = codes[array_id]
+            code = new_code - value * weight
+            codes[array_id] = code
+            self.score += table.score[code] - table.score[new_code]
+            if table.winnability[code] and not table.winnability[new_code]:
+                self.winnable_arrays += 1
+        return (cell_index, value)
+
+    def winner(self) -> int:
+        """
+        Returns winner of the position (checks every array).
+
+        Returns
+        -------
+        int
+            ORDER_WON, CHAOS_WON or NO_WINNER
+        """
+
+        for table, code in zip(ARRAYS_TABLES, self.codes):
+            if table.win[code]:
+                return ORDER_WON
+        if self.winnable_arrays == 0 or self.empty_cells == 0:
+            return CHAOS_WON
+        return NO_WINNER
+
+    def generate_moves(self) -> list[tuple[int, int]]:
+        """
+        Returns moves worth searching - both symbols on every empty cell that lies
+        on a still winnable array, and a single move on a cell that does not
+        (all such moves are equal - they only pass the turn).
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            Moves (cell index, symbol value)
+        """
+
+        moves = []
+        pass_move = None
+        codes = self.codes
+        for cell_index, value in enumerate(self.cells):
+            if value != 0:
+                continue
+            for array_id, _ in CELLS_ARRAYS[cell_index]:
+                if ARRAYS_TABLES[array_id].winnability[codes[array_id]]:
+                    moves.append((cell_index, 1))
+                    moves.append((cell_index, 2))
+                    break
+            else:
+                if pass_move is None:
+                    pass_move = (cell_index, 1)
+        if pass_move is not None:
+            moves.append(pass_move)
+        return moves
+
+    def move_score_change(self, cell_index: int, value: int) -> int:
+        """
+        Returns change of order's evaluation score the move would make, without playing it.
+
+        Parameters
+        ----------
+        cell_index: int
+            Index of board cell
+        value: int
+            Symbol value
+
+        Returns
+        -------
+        int
+            Score change
+        """
+
+        change = 0
+        codes = self.codes
+        for array_id, weight in CELLS_ARRAYS[cell_index]:
+            table = ARRAYS_TABLES[array_id]
+            code = codes[array_id]
+            change += table.score[code + value * weight] - table.score[code]
+        return change
@@ -0,0 +1,261 @@
+import argparse
+import itertools
+import json
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from BoardModel import BoardModel
+from Bot import Bot
+
+DIFFICULTIES = ("easy", "hard", "expert", "mcts")
+GAMES_PER_TASK = 32
+SIMULATION_TABLE_SIZE_MEGABYTES = 1
+
+
+class IllegalMoveException(Exception):
+    "Raised when the board rejects a move made by a simulated bot"
+    pass
+
+
+# bots of the worker process, reused by every game - (role, difficulty): Bot
+_worker_bots = {}
+_worker_settings = (2, 200)
+
+
+def _set_worker_settings(expert_depth: int, mcts_playouts: int) -> None:
+    """
+    Sets bots settings of the worker process (process pool initializer).
+    """
+
+    global _worker_settings
+    _worker_settings = (expert_depth, mcts_playouts)
+    _worker_bots.clear()
+
+
+def _worker_bot(role: str, difficulty: str) -> Bot:
+    """
+    Returns bot of the worker process playing given role with given difficulty.
+    Bots are created once, so "expert" tables and "mcts" settings are not made for every game
+    (`play_game()` clears what bots keep between games).
+    """
+
+    bot = _worker_bots.get((role, difficulty))
+    if bot is None:
+        expert_depth, mcts_playouts = _worker_settings
+        bot = Bot()
+        bot.set_transposition_table_size(SIMULATION_TABLE_SIZE_MEGABYTES)
+        bot.set_search_limits(expert_depth, None)
+        bot.set_monte_carlo_playouts(mcts_playouts)
+        bot.set_difficulty(difficulty)
+        _worker_bots[(role, difficulty)] = bot
+    return bot
+
+
+def play_game(order_difficulty: str, chaos_difficulty: str, seed: int) -> dict:
+    """
+    Plays one bot-vs-bot game without rendering and delays.
+    Game depends only on its arguments, not on games played before by the worker process bots.
+
+    Raises
+    ------
+    IllegalMoveException
+        If a bot makes a move the board rejects.
+
+    Parameters
+    ----------
+    order_difficulty: str
+        Difficulty of the bot playing order
+    chaos_difficulty: str
+        Difficulty of the bot playing chaos
+    seed: int
+        Seed of `random` used by bots
+
+    Returns
+    -------
+    dict
+        Game result
+            > "order", "chaos" - difficulties
+            > "seed" - game seed
+            > "winner" - "order" or "chaos"
+            > "plies" - number of made moves
+            > "move_time" - average time of one bot move (in seconds)
+            > "moves" - made moves (cell index, symbol value)
+    """
+
+    random.seed(seed)
+    board = BoardModel()
+    board.set_up_board()
+    bots = {
+        "order": _worker_bot("order", order_difficulty),
+        "chaos": _worker_bot("chaos", chaos_difficulty),
+        }
+    for bot in bots.values():
+        bot.load_board(board.board)
+        bot.clear_search_cache()
+
+    role = "order"
+    winner = ""
+    moves = []
+    move_time = 0.0
+    while not winner:
+        start_time = time.perf_counter()
+        move = bots[role].make_move(role)
+        move_time += time.perf_counter() - start_time
+        if not board.update(move[0], move[1]):
+            raise IllegalMoveException(f"{role} bot made illegal move {move}")
+        moves.append((move[0], 1 if move[1] == "circle" else 2))
+        for bot in bots.values():
+            winner = bot.check_winning(move) or winner
+        role = "chaos" if role == "order" else "order"
+    return {
+        "order": order_difficulty,
+        "chaos": chaos_difficulty,
+        "seed": seed,
+        "winner": winner,
+        "plies": len(moves),
+        "move_time": move_time / len(moves),
+        "moves": moves,
+        }
+
+
+def play_games(games: list[tuple[int, str, str, int]]) -> list[dict]:
+    """
+    Plays games in the worker process (one pool task).
+
+    Parameters
+    ----------
+    games: list[tuple[int, str, str, int]]
+        Games to play - (game number, order difficulty, chaos difficulty, seed)
+
+    Returns
+    -------
+    list[dict]
+        Games results (see `play_game()`) with "game" number
+    """
+
+    results = []
+    for number, order_difficulty, chaos_difficulty, seed in games:
+        result = play_game(order_difficulty, chaos_difficulty, seed)
+        result["game"] = number
+        results.append(result)
+    return results
+
+
+def simulation_games(games: int, difficulties=DIFFICULTIES, seed: int = 0) -> list[tuple[int, str, str, int]]:
+    """
+    Returns games of a simulation - every difficulty pair in turn, each game with its own seed.
+
+    Parameters
+    ----------
+    games: int
+        Number of games
+    difficulties: Iterable[str], optional
+        Bot difficulties, every (order, chaos) pair is played (deafult DIFFICULTIES)
+    seed: int, optional
+        Simulation seed games seeds are made from (deafult 0)
+
+    Returns
+    -------
+    list[tuple[int, str, str, int]]
+        Games - (game number, order difficulty, chaos difficulty, seed)
+    """
+
+    pairs = list(itertools.product(difficulties, repeat=2))
+    seeds = random.Random(seed)
+    return [(number, *pairs[number % len(pairs)], seeds.getrandbits(64)) for number in range(games)]
+
+
+def run_simulation(games: int, output, workers: int = 1, difficulties=DIFFICULTIES, seed: int = 0,
+                   expert_depth: int = 2, mcts_playouts: int = 200) -> dict:
+    """
+    Plays bot-vs-bot games over a process pool and streams results to output
+    as JSON lines, in order of finishing. Games are seeded by number, so results
+    do not depend on number of workers.
+
+    Parameters
+    ----------
+    games: int
+        Number of games
+    output: TextIO
+        File results are written to, one JSON object per line
+    workers: int, optional
+        Number of worker processes (deafult 1 - games are played in this process)
+    difficulties: Iterable[str], optional
+        Bot difficulties, every (order, chaos) pair is played (deafult DIFFICULTIES)
+    seed: int, optional
+        Simulation seed (deafult 0)
+    expert_depth: int, optional
+        Search depth of "expert" bots (deafult 2)
+    mcts_playouts: int, optional
+        Playouts per move of "mcts" bots (deafult 200)
+
+    Returns
+    -------
+    dict
+        Summary
+            > "games", "time", "games_per_hour"
+            > "wins" - {"order-chaos difficulties": {"order": wins, "chaos": wins}}
+    """
+
+    start_time = time.perf_counter()
+    planned = simulation_games(games, difficulties, seed)
+    tasks = [planned[start:start + GAMES_PER_TASK] for start in range(0, len(planned), GAMES_PER_TASK)]
+    wins = {}
+
+    def write(results: list[dict]) -> None:
+        for result in results:
+            output.write(json.dumps(result) + "\n")
+            pair_wins = wins.setdefault(f"{result['order']}-{result['chaos']}", {"order": 0, "chaos": 0})
+            pair_wins[result["winner"]] += 1
+        output.flush()
+
+    if workers == 1:
+        _set_worker_settings(expert_depth, mcts_playouts)
+        for task in tasks:
+            write(play_games(task))
+    else:
+        with ProcessPoolExecutor(workers, initializer=_set_worker_settings,
+                                 initargs=(expert_depth, mcts_playouts)) as executor:
+            for future in as_completed([executor.submit(play_games, task) for task in tasks]):
+                write(future.result())
+    elapsed = time.perf_counter() - start_time
+    return {
+        "games": games,
+        "time": elapsed,
+        "games_per_hour": games / elapsed * 3600 if elapsed else 0.0,
+        "wins": wins,
+        }
+
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Headless bot-vs-bot games simulation.")
+    parser.add_argument("--games", type=int, default=1600, help="number of games")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--difficulties", default=",".join(DIFFICULTIES),
+                        help="comma separated difficulties, every pair is played")
+    parser.add_argument("--seed", type=int, default=0, help="simulation seed")
+    parser.add_argument("--expert-depth", type=int, default=2, help="search depth of expert bots")
+    parser.add_argument("--mcts-playouts", type=int, default=200, help="playouts per move of mcts bots")
+    parser.add_argument("--output", default="simulation.jsonl", help="results file (- for stdout)")
+    args = parser.parse_args(argv)
+
+    difficulties = args.difficulties.split(",")
+    for difficulty in difficulties:
+        if difficulty not in DIFFICULTIES:
+            parser.error(f"unknown difficulty: {difficulty}")
+    output = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        summary = run_simulation(args.games, output, args.workers, difficulties, args.seed,
+                                 args.expert_depth, args.mcts_playouts)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    print(f"{summary['games']} games in {summary['time']:.2f} s ({summary['games_per_hour']:.0f} games/hour)",
+          file=sys.stderr)
+    for pair, pair_wins in sorted(summary["wins"].items()):
+        print(f"{pair:<14} order {pair_wins['order']:>6}  chaos {pair_wins['chaos']:>6}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
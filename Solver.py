@@ -0,0 +1,415 @@
+import time
+from LineTables import encode_array
+from SearchPosition import SearchPosition, NO_WINNER, ORDER_WON, CHAOS_WON, ZOBRIST_CHAOS_TO_MOVE, \
+    INDEXES_ARRAYS, ARRAYS_TABLES
+
+# proof and disproof numbers of proven nodes
+PN_INFINITY = 1 << 40
+# child thresholds are widened by this factor (1 + epsilon trick against re-expanding)
+THRESHOLD_EPSILON = 0.25
+# deadline is checked every (TIME_CHECK_NODES + 1) nodes
+TIME_CHECK_NODES = 255
+# table entries are pruned when there are more of them
+TABLE_SIZE = 1 << 20
+
+
+class SolverBudgetExceeded(Exception):
+    "Raised inside proof-number search when its node or time budget is used up"
+    pass
+
+
+class ProofNumberSearch:
+    """
+    A class representing depth-first proof-number (df-pn) search proving which side
+    wins a position with perfect play. Every node keeps (phi, delta) numbers from its
+    side to move point of view - phi is 0 when the side to move wins, delta is 0 when it loses.
+    Search goes down the most proving child while the numbers stay under thresholds,
+    so memory holds only the transposition table, which is pruned of the least searched
+    entries when full.
+    Terminal tests are the line tables rules `Bot` checks arrays with (win and winnability),
+    updated incrementally by `SearchPosition`.
+
+    ...
+
+    Attributes
+    ----------
+    table: dict
+        Transposition table - position key: [phi, delta, searched nodes]
+    table_size: int
+        Maximal number of table entries
+    nodes: int
+        Number of nodes expanded by the last search
+    search_time: float
+        Duration of the last search (in seconds)
+    max_nodes: int | None
+        Node budget of the running search
+    deadline: float | None
+        `time.perf_counter()` time the running search has to end by
+
+    Methods
+    -------
+    solve(values: list[int], order_to_move: bool, max_nodes=None, time_budget=None)
+        Proves the result of a position.
+    proof(values: list[int], order_to_move: bool)
+        Returns proof tree size and the main line of a proven position.
+    """
+
+    def __init__(self, table_size: int = TABLE_SIZE) -> None:
+        """
+        Parameters
+        ----------
+        table_size: int, optional
+            Maximal number of transposition table entries (deafult TABLE_SIZE)
+        """
+
+        self.table = {}
+        self.table_size = table_size
+        self.nodes = 0
+        self.search_time = 0.0
+        self.max_nodes = None
+        self.deadline = None
+        self._position = None
+
+    def solve(self, values: list[int], order_to_move: bool, max_nodes: int = None,
+              time_budget: float = None) -> int:
+        """
+        Proves the result of a position.
+
+        Parameters
+        ----------
+        values: list[int]
+            Board cells values
+        order_to_move: bool
+            True if order is to move
+        max_nodes: int, optional
+            Maximal number of expanded nodes (deafult None - no limit)
+        time_budget: float, optional
+            Time (in seconds) the search can take (deafult None - no limit)
+
+        Returns
+        -------
+        int
+            ORDER_WON or CHAOS_WON, NO_WINNER if the budget is used up first
+        """
+
+        start_time = time.perf_counter()
+        self.nodes = 0
+        self.max_nodes = max_nodes
+        self.deadline = None if time_budget is None else start_time + time_budget
+        self._position = SearchPosition(values)
+        try:
+            result = self._position.winner()
+            if result == NO_WINNER:
+                phi, delta = self._mid(order_to_move, PN_INFINITY, PN_INFINITY)
+                if phi == 0:
+                    result = ORDER_WON if order_to_move else CHAOS_WON
+                elif delta == 0:
+                    result = CHAOS_WON if order_to_move else ORDER_WON
+        except SolverBudgetExceeded:
+            result = NO_WINNER
+        finally:
+            self.search_time = time.perf_counter() - start_time
+        return result
+
+    def proof(self, values: list[int], order_to_move: bool) -> tuple[int, list[tuple[int, int]]]:
+        """
+        Returns proof tree of a position proven by `solve()` - number of positions in it
+        (transpositions counted once) and its main line: the winner's proving moves
+        answered by the loser's longest resisting moves.
+        Positions missing from the table are proven again within the budget of `solve()`.
+
+        Raises
+        ------
+        SolverBudgetExceeded
+            If the budget is used up while proving missing positions again
+
+        Parameters
+        ----------
+        values: list[int]
+            Board cells values
+        order_to_move: bool
+            True if order is to move
+
+        Returns
+        -------
+        (int, list[tuple[int, int]])
+            > Proof tree size
+            > Main line moves (cell index, symbol value)
+        """
+
+        self._position = SearchPosition(values)
+        if self._position.winner() != NO_WINNER:
+            return 1, []
+        subtrees = {}
+        winning_moves = {}
+        self._proof_size(order_to_move, subtrees, winning_moves)
+        position = self._position
+        line = []
+        while position.winner() == NO_WINNER:
+            move = winning_moves.get(self._key(order_to_move))
+            if move is None:  # loser - the longest resistance, then the largest proof subtree
+                best_subtree = None
+                for child_move in position.generate_moves():
+                    subtree = (0, 0)
+                    if position.play(child_move[0], child_move[1]) == NO_WINNER:
+                        subtree = subtrees[self._key(not order_to_move)][::-1]
+                    position.undo()
+                    if best_subtree is None or subtree > best_subtree:
+                        best_subtree = subtree
+                        move = child_move
+            line.append(move)
+            position.play(move[0], move[1])
+            order_to_move = not order_to_move
+        return len(subtrees), line
+
+    def _key(self, order_to_move: bool) -> int:
+        """
+        Returns table key of current position.
+        """
+
+        return self._position.hash if order_to_move else self._position.hash ^ ZOBRIST_CHAOS_TO_MOVE
+
+    def _child_numbers(self, result: int, order_to_move: bool) -> list[int]:
+        """
+        Returns table entry of a child position after a move with given result,
+        `order_to_move` is the side to move in the child.
+        """
+
+        if result == NO_WINNER:
+            entry = self.table.get(self._key(order_to_move))
+            return entry if entry is not None else [1, 1, 0]
+        if (result == ORDER_WON) == order_to_move:
+            return [0, PN_INFINITY, 0]
+        return [PN_INFINITY, 0, 0]
+
+    def _mid(self, order_to_move: bool, phi_threshold: int, delta_threshold: int) -> tuple[int, int]:
+        """
+        Expands the position until its phi or delta reaches the threshold (multiple iterative deepening).
+        Position is not finished.
+        """
+
+        self.nodes += 1
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            raise SolverBudgetExceeded
+        if self.deadline is not None and not self.nodes & TIME_CHECK_NODES \
+                and time.perf_counter() >= self.deadline:
+            raise SolverBudgetExceeded
+        position = self._position
+        key = self._key(order_to_move)
+        start_nodes = self.nodes
+        # children - [move, table key (None for finished game), numbers]
+        children = []
+        for move in position.generate_moves():
+            result = position.play(move[0], move[1])
+            child_key = self._key(not order_to_move) if result == NO_WINNER else None
+            children.append([move, child_key, self._child_numbers(result, not order_to_move)])
+            position.undo()
+        table = self.table
+        while True:
+            # children numbers are read again after every child search (transpositions),
+            # the last known ones are used for children dropped from the table
+            delta = 0
+            best = None
+            best_delta = PN_INFINITY
+            second_delta = PN_INFINITY
+            best_phi = 0
+            for child in children:
+                if child[1] is not None:
+                    entry = table.get(child[1])
+                    if entry is not None:
+                        child[2] = entry
+                child_phi, child_delta = child[2][0], child[2][1]
+                delta = min(delta + child_phi, PN_INFINITY)
+                if child_delta < best_delta:
+                    second_delta = best_delta
+                    best_delta = child_delta
+                    best_phi = child_phi
+                    best = child
+                elif child_delta < second_delta:
+                    second_delta = child_delta
+            phi = best_delta
+            if phi >= phi_threshold or delta >= delta_threshold or phi == 0 or delta == 0:
+                break
+            child_phi_threshold = min(delta_threshold - delta + best_phi, PN_INFINITY)
+            child_delta_threshold = min(phi_threshold, int(second_delta * (1 + THRESHOLD_EPSILON)) + 1)
+            move = best[0]
+            position.play(move[0], move[1])
+            try:
+                best[2] = self._mid(not order_to_move, child_phi_threshold, child_delta_threshold)
+            finally:
+                position.undo()
+        self._store(key, phi, delta, self.nodes - start_nodes + 1)
+        return phi, delta
+
+    def _store(self, key: int, phi: int, delta: int, searched: int) -> None:
+        """
+        Stores position numbers, table is pruned of the least searched half when full.
+        Proven positions are kept.
+        """
+
+        entry = self.table.get(key)
+        if entry is not None:
+            searched += entry[2]
+        self.table[key] = [phi, delta, searched]
+        if len(self.table) > self.table_size:
+            # pruned in place - running searches keep a reference to the table
+            limit = sorted(entry[2] for entry in self.table.values())[len(self.table) // 2]
+            for pruned_key in [pruned_key for pruned_key, entry in self.table.items()
+                               if entry[2] <= limit and entry[0] != 0 and entry[1] != 0]:
+                del self.table[pruned_key]
+
+    def _proven_numbers(self, order_to_move: bool) -> tuple[int, int]:
+        """
+        Returns numbers of proven position, it is proven again if it is missing from the table.
+        """
+
+        entry = self.table.get(self._key(order_to_move))
+        if entry is not None and (entry[0] == 0 or entry[1] == 0):
+            return entry[0], entry[1]
+        return self._mid(order_to_move, PN_INFINITY, PN_INFINITY)
+
+    def _winning_move(self, order_to_move: bool) -> tuple[tuple[int, int], int]:
+        """
+        Returns a proving move of position won by side to move and its result -
+        a finishing move if there is one, else a move to a proven lost position.
+        """
+
+        position = self._position
+        moves = position.generate_moves()
+        for move in moves:
+            result = position.play(move[0], move[1])
+            if result != NO_WINNER:
+                position.undo()
+                if (result == ORDER_WON) == order_to_move:
+                    return move, result
+                continue
+            entry = self.table.get(self._key(not order_to_move))
+            position.undo()
+            if entry is not None and entry[1] == 0:
+                return move, result
+        # proving child was dropped from the table
+        for move in moves:
+            result = position.play(move[0], move[1])
+            lost = result == NO_WINNER and self._proven_numbers(not order_to_move)[1] == 0
+            position.undo()
+            if lost:
+                return move, result
+        raise ValueError("position is not proven")
+
+    def _proof_size(self, order_to_move: bool, subtrees: dict, winning_moves: dict) -> tuple[int, int]:
+        """
+        Collects proof tree of current position - subtrees (key: (number of positions,
+        plies to the game end)) and winner's proving moves (key: move).
+        """
+
+        key = self._key(order_to_move)
+        if key in subtrees:
+            return subtrees[key]
+        position = self._position
+        size = 1
+        plies = 1
+        if self._proven_numbers(order_to_move)[0] == 0:
+            move, result = self._winning_move(order_to_move)
+            winning_moves[key] = move
+            if result == NO_WINNER:
+                position.play(move[0], move[1])
+                child_size, child_plies = self._proof_size(not order_to_move, subtrees, winning_moves)
+                position.undo()
+                size += child_size
+                plies += child_plies
+        else:
+            for move in position.generate_moves():
+                if position.play(move[0], move[1]) == NO_WINNER:
+                    child_size, child_plies = self._proof_size(not order_to_move, subtrees, winning_moves)
+                    size += child_size
+                    plies = max(plies, child_plies + 1)
+                position.undo()
+        subtrees[key] = (size, plies)
+        return size, plies
+
+
+def winning_cells(values: list[int]) -> list[int]:
+    """
+    Returns cells of five same symbols in a row, empty list if there are none.
+
+    Parameters
+    ----------
+    values: list[int]
+        Board cells values
+
+    Returns
+    -------
+    list[int]
+        Indexes of the five cells
+    """
+
+    for indexes_array, table in zip(INDEXES_ARRAYS, ARRAYS_TABLES):
+        array = [values[cell] for cell in indexes_array]
+        if not table.win[encode_array(array)]:
+            continue
+        for start in range(len(array) - 4):
+            if array[start] != 0 and array[start:start + 5].count(array[start]) == 5:
+                return list(indexes_array[start:start + 5])
+    return []
+
+
+def solve(board: list[int], side_to_move: str, max_nodes: int = 1000000, time_budget: float = None,
+          table_size: int = TABLE_SIZE) -> dict:
+    """
+    Proves whether order can force five in a row from a position, by df-pn search.
+
+    Raises
+    ------
+    ValueError
+        If side to move is not "order" or "chaos"
+
+    Parameters
+    ----------
+    board: list[int]
+        Board cells values (list or BitBoard)
+    side_to_move: str
+        "order" or "chaos"
+    max_nodes: int, optional
+        Maximal number of expanded nodes (deafult 1000000)
+    time_budget: float, optional
+        Time (in seconds) the search can take (deafult None - no limit)
+    table_size: int, optional
+        Maximal number of transposition table entries (deafult TABLE_SIZE)
+
+    Returns
+    -------
+    dict
+        Solution
+            > "winner" - "order", "chaos" or "" if not proven within the budget
+            > "proof_size" - number of positions in the proof tree (0 if not proven)
+            > "line" - main line of the proof, moves (cell index, symbol) from the side to move
+            > "winning_cells" - the five in a row at the end of the line (empty if chaos wins)
+            > "nodes", "time" - search statistics
+    """
+
+    if side_to_move not in ("order", "chaos"):
+        raise ValueError
+    values = list(board)
+    order_to_move = side_to_move == "order"
+    search = ProofNumberSearch(table_size)
+    result = search.solve(values, order_to_move, max_nodes, time_budget)
+    solution = {
+        "winner": {ORDER_WON: "order", CHAOS_WON: "chaos"}.get(result, ""),
+        "proof_size": 0,
+        "line": [],
+        "winning_cells": [],
+        "nodes": search.nodes,
+        "time": search.search_time,
+        }
+    if result != NO_WINNER:
+        try:
+            proof_size, line = search.proof(values, order_to_move)
+        except SolverBudgetExceeded:
+            return solution
+        final_values = list(values)
+        for cell_index, value in line:
+            final_values[cell_index] = value
+        solution["proof_size"] = proof_size
+        solution["line"] = [(cell_index, "circle" if value == 1 else "cross") for cell_index, value in line]
+        solution["winning_cells"] = winning_cells(final_values) if result == ORDER_WON else []
+    return solution
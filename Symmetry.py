@@ -0,0 +1,205 @@
+from SearchPosition import BOARD_SIZE, CELLS_AMOUNT, ZOBRIST_KEYS
+
+
+def _cells_permutation(transform) -> tuple[int, ...]:
+    """
+    Returns cells permutation - index of the cell every cell is moved to by the transform.
+    """
+
+    last = BOARD_SIZE - 1
+    return tuple(
+        new_row * BOARD_SIZE + new_column
+        for row in range(BOARD_SIZE) for column in range(BOARD_SIZE)
+        for new_row, new_column in (transform(row, column, last),)
+        )
+
+
+# 8 rotations and reflections of the board - CELL_PERMUTATIONS[symmetry][cell] is the moved cell
+CELL_PERMUTATIONS = tuple(_cells_permutation(transform) for transform in (
+    lambda row, column, last: (row, column),  # identity
+    lambda row, column, last: (column, last - row),  # rotation by 90 degrees
+    lambda row, column, last: (last - row, last - column),  # rotation by 180 degrees
+    lambda row, column, last: (last - column, row),  # rotation by 270 degrees
+    lambda row, column, last: (row, last - column),  # horizontal reflection
+    lambda row, column, last: (last - row, column),  # vertical reflection
+    lambda row, column, last: (column, row),  # main diagonal reflection
+    lambda row, column, last: (last - column, last - row),  # anti-diagonal reflection
+    ))
+# symbol values after swapping circle with cross
+SWAPPED_VALUES = (0, 2, 1)
+# every symmetry is (cells permutation, symbols swapped), identity is the first one
+SYMMETRIES = tuple((permutation, swap) for swap in (False, True) for permutation in CELL_PERMUTATIONS)
+# symmetry id that undoes the symmetry with given id
+INVERSE_SYMMETRIES = tuple(
+    next(inverse_id for inverse_id, (inverse, inverse_swap) in enumerate(SYMMETRIES)
+         if inverse_swap == swap and all(inverse[permutation[cell]] == cell for cell in range(CELLS_AMOUNT)))
+    for permutation, swap in SYMMETRIES
+    )
+# SYMMETRIC_ZOBRIST_KEYS[symmetry][cell][value] - Zobrist key of the transformed cell
+SYMMETRIC_ZOBRIST_KEYS = tuple(
+    tuple(
+        tuple(ZOBRIST_KEYS[permutation[cell]][SWAPPED_VALUES[value] if swap else value] for value in range(3))
+        for cell in range(CELLS_AMOUNT)
+        )
+    for permutation, swap in SYMMETRIES
+    )
+
+
+def transform_position(values: list[int], symmetry: int) -> list[int]:
+    """
+    Returns board transformed by a symmetry.
+
+    Parameters
+    ----------
+    values: list[int]
+        Board cells values
+    symmetry: int
+        Symmetry id (index of SYMMETRIES)
+
+    Returns
+    -------
+    list[int]
+        Transformed board cells values
+    """
+
+    permutation, swap = SYMMETRIES[symmetry]
+    transformed = [0] * CELLS_AMOUNT
+    if swap:
+        for cell, value in enumerate(values):
+            transformed[permutation[cell]] = SWAPPED_VALUES[value]
+    else:
+        for cell, value in enumerate(values):
+            transformed[permutation[cell]] = value
+    return transformed
+
+
+def transform_move(move: tuple[int, int], symmetry: int) -> tuple[int, int]:
+    """
+    Returns move (cell index, symbol value) transformed by a symmetry.
+
+    Parameters
+    ----------
+    move: tuple[int, int]
+        Cell index and symbol value
+    symmetry: int
+        Symmetry id (index of SYMMETRIES)
+
+    Returns
+    -------
+    (int, int)
+        Transformed move
+    """
+
+    permutation, swap = SYMMETRIES[symmetry]
+    return (permutation[move[0]], SWAPPED_VALUES[move[1]] if swap else move[1])
+
+
+def canonical_position(values: list[int]) -> tuple[tuple[int, ...], int]:
+    """
+    Returns representative of position equivalence class - the lexicographically
+    smallest of its 16 transformed boards, and the symmetry that gives it.
+    Moves of the position are mapped to the representative by `transform_move(move, symmetry)`
+    and back by `transform_move(move, INVERSE_SYMMETRIES[symmetry])`.
+
+    Parameters
+    ----------
+    values: list[int]
+        Board cells values
+
+    Returns
+    -------
+    (tuple[int, ...], int)
+        > Canonical board cells values
+        > Symmetry id
+    """
+
+    best = None
+    best_symmetry = 0
+    for symmetry in range(len(SYMMETRIES)):
+        transformed = tuple(transform_position(values, symmetry))
+        if best is None or transformed < best:
+            best = transformed
+            best_symmetry = symmetry
+    return best, best_symmetry
+
+
+def canonical_hash(values: list[int]) -> tuple[int, int]:
+    """
+    Returns Zobrist hash of the position equivalence class - the smallest hash
+    of its 16 transformed boards, and the symmetry that gives it.
+    Cheaper than `canonical_position()`, meant for keying caches and books.
+
+    Parameters
+    ----------
+    values: list[int]
+        Board cells values
+
+    Returns
+    -------
+    (int, int)
+        > Canonical 64-bit hash
+        > Symmetry id
+    """
+
+    best_hash = None
+    best_symmetry = 0
+    for symmetry, keys in enumerate(SYMMETRIC_ZOBRIST_KEYS):
+        position_hash = 0
+        for cell, value in enumerate(values):
+            if value:
+                position_hash ^= keys[cell][value]
+        if best_hash is None or position_hash < best_hash:
+            best_hash = position_hash
+            best_symmetry = symmetry
+    return best_hash, best_symmetry
+
+
+def position_symmetries(values: list[int]) -> list[int]:
+    """
+    Returns ids of symmetries that map the position onto itself (identity included).
+
+    Parameters
+    ----------
+    values: list[int]
+        Board cells values
+
+    Returns
+    -------
+    list[int]
+        Symmetry ids
+    """
+
+    values = list(values)
+    return [symmetry for symmetry in range(len(SYMMETRIES)) if transform_position(values, symmetry) == values]
+
+
+def unique_moves(values: list[int], moves: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    Removes moves that are symmetric to an earlier move of the list - they lead
+    to equivalent positions. Order of kept moves is preserved.
+
+    Parameters
+    ----------
+    values: list[int]
+        Board cells values
+    moves: list[tuple[int, int]]
+        Moves (cell index, symbol value)
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Moves without symmetric duplicates
+    """
+
+    symmetries = position_symmetries(values)
+    if len(symmetries) == 1:
+        return list(moves)
+    kept = []
+    seen = set()
+    for move in moves:
+        if move in seen:
+            continue
+        kept.append(move)
+        for symmetry in symmetries:
+            seen.add(transform_move(move, symmetry))
+    return kept
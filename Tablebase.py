@@ -0,0 +1,510 @@
+import mmap
+import os
+import random
+import struct
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from SearchPosition import SearchPosition, CELLS_AMOUNT, CELLS_ARRAYS, ARRAYS_TABLES, NO_WINNER, ORDER_WON
+from Symmetry import SYMMETRIES, INVERSE_SYMMETRIES, transform_move
+
+# next to the game files, so the game finds it wherever it is started from
+TABLEBASE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "endgame.tablebase")
+TABLEBASE_MAX_EMPTY = 6
+TABLEBASE_MAGIC = b"OCTB"
+TABLEBASE_VERSION = 1
+TABLEBASE_HEADER = struct.Struct("<4sIII")  # magic, version, max empty cells, slots
+PART_HEADER = struct.Struct("<I")  # number of entries
+KEY = struct.Struct("<Q")
+ENTRY = struct.Struct("<H")
+SEEDS_PER_PART = 64
+
+# reduced value of a cell that lies on no winnable array - its symbol does not matter anymore
+# and an empty one is a pass move (it only passes the turn)
+OFF_CELL = 3
+# symbol value of stored pass moves
+PASS_VALUE = 3
+# entry bits - cell index (6), symbol value (2), order won (1), plies to the game end (7)
+ENTRY_VALUE_SHIFT = 6
+ENTRY_RESULT_SHIFT = 8
+ENTRY_PLIES_SHIFT = 9
+
+# keys of reduced positions - CELL_KEYS[cell][reduced value], PASS_KEYS[pass moves class]
+_key_random = random.Random(0x7AB1EBA5E)
+CELL_KEYS = [(0, *(_key_random.getrandbits(64) for _ in range(3))) for _ in range(CELLS_AMOUNT)]
+PASS_KEYS = [_key_random.getrandbits(64) for _ in range(3)]
+ORDER_TO_MOVE_KEY = _key_random.getrandbits(64)
+# SYMMETRIC_CELL_KEYS[symmetry][cell][reduced value] - key of the transformed cell
+SYMMETRIC_CELL_KEYS = tuple(
+    tuple(
+        tuple(CELL_KEYS[permutation[cell]][(0, 2, 1, 3)[value] if swap else value] for value in range(4))
+        for cell in range(CELLS_AMOUNT)
+        )
+    for permutation, swap in SYMMETRIES
+    )
+
+
+def reduced_cells(position: SearchPosition) -> tuple[list[int], int]:
+    """
+    Returns position reduced to what decides its result - cells on no winnable array
+    are OFF_CELL, and number of empty ones among them (pass moves).
+
+    Parameters
+    ----------
+    position: SearchPosition
+        Position to reduce
+
+    Returns
+    -------
+    (list[int], int)
+        > Reduced cells values
+        > Number of pass moves
+    """
+
+    codes = position.codes
+    reduced = []
+    passes = 0
+    for cell, value in enumerate(position.cells):
+        for array_id, _ in CELLS_ARRAYS[cell]:
+            if ARRAYS_TABLES[array_id].winnability[codes[array_id]]:
+                reduced.append(value)
+                break
+        else:
+            reduced.append(OFF_CELL)
+            if value == 0:
+                passes += 1
+    return reduced, passes
+
+
+def _passes_class(passes: int) -> int:
+    """
+    Returns class of number of pass moves - 0 for none, 1 for odd, 2 for even number.
+    Two more pass moves do not change the result: the winner answers an opponent's
+    extra pass with the other one.
+    """
+
+    return 0 if passes == 0 else 2 - passes % 2
+
+
+def position_key(position: SearchPosition, order_to_move: bool) -> int:
+    """
+    Returns 64-bit key of reduced position (not symmetry reduced).
+    """
+
+    reduced, passes = reduced_cells(position)
+    key = PASS_KEYS[_passes_class(passes)] ^ (ORDER_TO_MOVE_KEY if order_to_move else 0)
+    for cell, value in enumerate(reduced):
+        key ^= CELL_KEYS[cell][value]
+    return key
+
+
+def canonical_key(position: SearchPosition, order_to_move: bool) -> tuple[int, int]:
+    """
+    Returns 64-bit key of reduced position equivalence class - the smallest key
+    of its 16 transformed positions, and the symmetry that gives it. Key is never 0.
+
+    Parameters
+    ----------
+    position: SearchPosition
+        Position
+    order_to_move: bool
+        True if order is to move
+
+    Returns
+    -------
+    (int, int)
+        > Canonical key
+        > Symmetry id
+    """
+
+    return _canonical_key(*reduced_cells(position), order_to_move)
+
+
+def _canonical_key(reduced: list[int], passes: int, order_to_move: bool) -> tuple[int, int]:
+    """
+    Returns canonical key and symmetry of reduced position.
+    """
+
+    side_key = PASS_KEYS[_passes_class(passes)] ^ (ORDER_TO_MOVE_KEY if order_to_move else 0)
+    best_key = None
+    best_symmetry = 0
+    for symmetry, keys in enumerate(SYMMETRIC_CELL_KEYS):
+        key = side_key
+        for cell, value in enumerate(reduced):
+            if value:
+                key ^= keys[cell][value]
+        if best_key is None or key < best_key:
+            best_key = key
+            best_symmetry = symmetry
+    return best_key or 1, best_symmetry
+
+
+def relevant_empty_cells(position: SearchPosition) -> int:
+    """
+    Returns number of empty cells on winnable arrays (empty cells that are not pass moves).
+    """
+
+    return position.empty_cells - reduced_cells(position)[1]
+
+
+def _normalized_cells(position: SearchPosition) -> tuple[int, ...]:
+    """
+    Returns position cells with pass moves over three filled, two or three are left,
+    as many as keep the passes class (see `_passes_class()`), so every class of
+    positions the game can reach is still reached.
+    """
+
+    cells = list(position.cells)
+    reduced, passes = reduced_cells(position)
+    extra = passes - 2 - passes % 2 if passes > 3 else 0
+    for cell, value in enumerate(reduced):
+        if extra == 0:
+            break
+        if value == OFF_CELL and cells[cell] == 0:
+            cells[cell] = 1
+            extra -= 1
+    return tuple(cells)
+
+
+def _is_pass(position: SearchPosition, cell_index: int) -> bool:
+    """
+    Returns True if cell lies on no winnable array.
+    """
+
+    codes = position.codes
+    return not any(ARRAYS_TABLES[array_id].winnability[codes[array_id]] for array_id, _ in CELLS_ARRAYS[cell_index])
+
+
+def solve_positions(seeds: list[list[int]]) -> dict:
+    """
+    Solves every position reachable from seeds by retrograde analysis. Positions are
+    collected layer by layer (by number of empty cells) from the seeds down, then solved
+    from the last layer up - result of every move is already known from the layers below.
+    Pass moves over three are filled first, so only empty cells on winnable arrays make layers.
+    Side to move of seeds is given by number of empty cells (order moves first on empty board).
+    Winners pick the fastest win, losers the slowest loss.
+
+    Parameters
+    ----------
+    seeds: list[list[int]]
+        Boards cells values, finished games are skipped
+
+    Returns
+    -------
+    dict
+        Entries - canonical key: entry (see `encode_entry()`)
+    """
+
+    layers = [dict() for _ in range(CELLS_AMOUNT + 1)]
+    for values in seeds:
+        position = SearchPosition(values)
+        if position.winner() == NO_WINNER:
+            order_to_move = position.empty_cells % 2 == 0
+            cells = _normalized_cells(position)
+            layers[cells.count(0)].setdefault(position_key(position, order_to_move), (cells, order_to_move))
+    # forward - positions reachable from seeds, equal reduced positions are kept once
+    for empty_cells in range(CELLS_AMOUNT, 1, -1):
+        for cells, order_to_move in layers[empty_cells].values():
+            position = SearchPosition(cells)
+            for cell_index, value in position.generate_moves():
+                if position.play(cell_index, value) == NO_WINNER:
+                    child_cells = _normalized_cells(position)
+                    layers[child_cells.count(0)].setdefault(position_key(position, not order_to_move),
+                                                            (child_cells, not order_to_move))
+                position.undo()
+    # backward - results of the layer below are known
+    results = {}
+    entries = {}
+    for empty_cells in range(1, CELLS_AMOUNT + 1):
+        for key, (cells, order_to_move) in layers[empty_cells].items():
+            position = SearchPosition(cells)
+            winning_result = ORDER_WON if order_to_move else -ORDER_WON
+            best = None
+            for move in position.generate_moves():
+                result = position.play(move[0], move[1])
+                plies = 1
+                if result == NO_WINNER:
+                    result, plies = results[position_key(position, not order_to_move)]
+                    plies += 1
+                position.undo()
+                rank = (1, -plies) if result == winning_result else (0, plies)
+                if best is None or rank > best[0]:
+                    best = (rank, move, result, plies)
+            _, move, result, plies = best
+            results[key] = (result, plies)
+            canonical, symmetry = canonical_key(position, order_to_move)
+            if _is_pass(position, move[0]):
+                move = (0, PASS_VALUE)
+            else:
+                move = transform_move(move, symmetry)
+            entries[canonical] = encode_entry(move, result, plies)
+    return entries
+
+
+def encode_entry(move: tuple[int, int], result: int, plies: int) -> int:
+    """
+    Returns 16-bit entry of best move (cell index, symbol value or PASS_VALUE),
+    result (ORDER_WON or CHAOS_WON) and number of plies to the game end.
+    """
+
+    return move[0] | move[1] << ENTRY_VALUE_SHIFT | (result == ORDER_WON) << ENTRY_RESULT_SHIFT \
+        | min(plies, 127) << ENTRY_PLIES_SHIFT
+
+
+def decode_entry(entry: int) -> tuple[tuple[int, int], int, int]:
+    """
+    Returns best move, result and number of plies of a 16-bit entry.
+    """
+
+    move = (entry & 63, entry >> ENTRY_VALUE_SHIFT & 3)
+    result = ORDER_WON if entry >> ENTRY_RESULT_SHIFT & 1 else -ORDER_WON
+    return move, result, entry >> ENTRY_PLIES_SHIFT
+
+
+def _solve_part(part_path: str, seeds: list[list[int]]) -> int:
+    """
+    Solves seeds and writes the entries to a part file (worker process task).
+    The file is renamed into place when complete, so an interrupted part is solved again.
+    """
+
+    entries = solve_positions(seeds)
+    temporary_path = part_path + ".tmp"
+    with open(temporary_path, "wb") as part_file:
+        part_file.write(PART_HEADER.pack(len(entries)))
+        part_file.write(struct.pack(f"<{len(entries)}Q", *entries.keys()))
+        part_file.write(struct.pack(f"<{len(entries)}H", *entries.values()))
+    os.replace(temporary_path, part_path)
+    return len(entries)
+
+
+def _read_part(part_path: str) -> dict:
+    """
+    Returns entries of a part file.
+    """
+
+    with open(part_path, "rb") as part_file:
+        data = part_file.read()
+    (count,) = PART_HEADER.unpack_from(data)
+    keys = struct.unpack_from(f"<{count}Q", data, PART_HEADER.size)
+    values = struct.unpack_from(f"<{count}H", data, PART_HEADER.size + count * KEY.size)
+    return dict(zip(keys, values))
+
+
+def write_tablebase(path: str, entries: dict, max_empty: int) -> None:
+    """
+    Writes entries to a tablebase file - header, open addressing table of keys
+    (linear probing, at most half full, 0 is an empty slot) and entries of the slots.
+
+    Parameters
+    ----------
+    path: str
+        Path to the tablebase file
+    entries: dict
+        Entries - canonical key: entry
+    max_empty: int
+        Maximal number of empty cells on winnable arrays of solved positions
+    """
+
+    slots = 16
+    while slots < 2 * len(entries):
+        slots *= 2
+    keys = [0] * slots
+    values = [0] * slots
+    for key, entry in entries.items():
+        slot = key & (slots - 1)
+        while keys[slot]:
+            slot = (slot + 1) & (slots - 1)
+        keys[slot] = key
+        values[slot] = entry
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as tablebase_file:
+        tablebase_file.write(TABLEBASE_HEADER.pack(TABLEBASE_MAGIC, TABLEBASE_VERSION, max_empty, slots))
+        tablebase_file.write(struct.pack(f"<{slots}Q", *keys))
+        tablebase_file.write(struct.pack(f"<{slots}H", *values))
+    os.replace(temporary_path, path)
+
+
+def generate_tablebase(path: str, seeds: list[list[int]], max_empty: int = TABLEBASE_MAX_EMPTY,
+                       workers: int = 1, progress=None) -> int:
+    """
+    Solves every position reachable from seeds with at most `max_empty` empty cells
+    on winnable arrays and writes the tablebase file. Seeds are solved in parts over a process pool, every finished
+    part is saved in `path + ".parts"` directory - generation stopped in the middle continues
+    from the missing parts when called again with the same seeds. Parts are removed when
+    the tablebase is written.
+
+    Raises
+    ------
+    ValueError
+        If a seed has more than `max_empty` empty cells on winnable arrays
+
+    Parameters
+    ----------
+    path: str
+        Path to the tablebase file
+    seeds: list[list[int]]
+        Boards cells values
+    max_empty: int, optional
+        Maximal number of empty cells on winnable arrays (deafult TABLEBASE_MAX_EMPTY)
+    workers: int, optional
+        Number of worker processes (deafult 1 - parts are solved in this process)
+    progress: Callable[[int, int], None], optional
+        Called with numbers of done and all parts (deafult None)
+
+    Returns
+    -------
+    int
+        Number of tablebase entries
+    """
+
+    for values in seeds:
+        if relevant_empty_cells(SearchPosition(values)) > max_empty:
+            raise ValueError(f"seed has more than {max_empty} empty cells on winnable arrays")
+    parts_path = path + ".parts"
+    os.makedirs(parts_path, exist_ok=True)
+    parts = [(os.path.join(parts_path, f"part_{number:05d}.bin"), seeds[start:start + SEEDS_PER_PART])
+             for number, start in enumerate(range(0, len(seeds), SEEDS_PER_PART))]
+    missing = [(part_path, part_seeds) for part_path, part_seeds in parts if not os.path.exists(part_path)]
+    done = len(parts) - len(missing)
+    if progress is not None:
+        progress(done, len(parts))
+    if workers == 1:
+        for part_path, part_seeds in missing:
+            _solve_part(part_path, part_seeds)
+            done += 1
+            if progress is not None:
+                progress(done, len(parts))
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            for future in as_completed([executor.submit(_solve_part, *part) for part in missing]):
+                future.result()
+                done += 1
+                if progress is not None:
+                    progress(done, len(parts))
+
+    entries = {}
+    for part_path, _ in parts:
+        entries.update(_read_part(part_path))
+    write_tablebase(path, entries, max_empty)
+    for part_path, _ in parts:
+        os.remove(part_path)
+    os.rmdir(parts_path)
+    return len(entries)
+
+
+class Tablebase:
+    """
+    A class representing memory-mapped endgame tablebase - perfect moves of solved
+    late game positions. Positions are looked up by canonical key of reduced position
+    (symmetries and symbol swap, cells on no winnable array left out), one hash table
+    probe per lookup.
+
+    ...
+
+    Attributes
+    ----------
+    max_empty: int
+        Maximal number of empty cells on winnable arrays of solved positions
+    slots: int
+        Number of hash table slots
+
+    Methods
+    -------
+    probe(values: list[int], order_to_move: bool)
+        Returns best move, result and number of plies to the game end.
+    best_move(values: list[int], order_to_move: bool)
+        Returns best move of a solved position.
+    close()
+        Unmaps the file.
+    """
+
+    def __init__(self, path: str = TABLEBASE_PATH) -> None:
+        """
+        Parameters
+        ----------
+        path: str, optional
+            Path to the tablebase file (deafult TABLEBASE_PATH)
+
+        Raises
+        ------
+        ValueError
+            If file is not a tablebase
+        """
+
+        with open(path, "rb") as tablebase_file:
+            self._data = mmap.mmap(tablebase_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._data) < TABLEBASE_HEADER.size:
+            raise ValueError(f"{path} is not a tablebase")
+        magic, version, self.max_empty, self.slots = TABLEBASE_HEADER.unpack_from(self._data)
+        if magic != TABLEBASE_MAGIC or version != TABLEBASE_VERSION \
+                or len(self._data) != TABLEBASE_HEADER.size + self.slots * (KEY.size + ENTRY.size):
+            raise ValueError(f"{path} is not a tablebase (version {TABLEBASE_VERSION})")
+        self._entries_start = TABLEBASE_HEADER.size + self.slots * KEY.size
+
+    def probe(self, values: list[int], order_to_move: bool) -> tuple[tuple[int, int], int, int] | None:
+        """
+        Returns best move of a position, its result and number of plies to the game end.
+
+        Parameters
+        ----------
+        values: list[int]
+            Board cells values (not finished game)
+        order_to_move: bool
+            True if order is to move
+
+        Returns
+        -------
+        ((int, int), int, int) | None
+            > Best move (cell index, symbol value)
+            > Result with best play - ORDER_WON or CHAOS_WON
+            > Number of plies to the game end
+            None if the position is not in the tablebase
+        """
+
+        position = SearchPosition(values)
+        reduced, passes = reduced_cells(position)
+        if position.empty_cells - passes > self.max_empty:
+            return None
+        key, symmetry = _canonical_key(reduced, passes, order_to_move)
+        mask = self.slots - 1
+        slot = key & mask
+        while True:
+            (slot_key,) = KEY.unpack_from(self._data, TABLEBASE_HEADER.size + slot * KEY.size)
+            if slot_key == key:
+                break
+            if slot_key == 0:
+                return None
+            slot = (slot + 1) & mask
+        (entry,) = ENTRY.unpack_from(self._data, self._entries_start + slot * ENTRY.size)
+        move, result, plies = decode_entry(entry)
+        if move[1] == PASS_VALUE:
+            move = next((cell_index, 1) for cell_index, value in enumerate(values)
+                        if value == 0 and _is_pass(position, cell_index))
+        else:
+            move = transform_move(move, INVERSE_SYMMETRIES[symmetry])
+        return move, result, plies
+
+    def best_move(self, values: list[int], order_to_move: bool) -> tuple[int, int] | None:
+        """
+        Returns best move of a position.
+
+        Parameters
+        ----------
+        values: list[int]
+            Board cells values (not finished game)
+        order_to_move: bool
+            True if order is to move
+
+        Returns
+        -------
+        (int, int) | None
+            Best move (cell index, symbol value), None if the position is not in the tablebase
+        """
+
+        found = self.probe(values, order_to_move)
+        return None if found is None else found[0]
+
+    def close(self) -> None:
+        """
+        Unmaps the file.
+        """
+
+        self._data.close()
@@ -0,0 +1,271 @@
+import time
+from AlphaBeta import SearchTimeout
+from SearchPosition import SearchPosition, INDEXES_ARRAYS, CELLS_ARRAYS, ARRAYS_TABLES, NO_WINNER, ORDER_WON
+
+# maximal number of order threat moves in a searched sequence
+THREAT_SEARCH_DEPTH = 6
+# maximal number of nodes of one search
+THREAT_SEARCH_NODES = 20000
+# deadline is checked every (TIME_CHECK_NODES + 1) nodes
+TIME_CHECK_NODES = 63
+# ARRAYS_CELLS[array id] - (cell index, weight of the cell in array code) of every array cell
+ARRAYS_CELLS = tuple(
+    tuple((cell_index, weight) for cell_index in indexes_array
+          for cell_array_id, weight in CELLS_ARRAYS[cell_index] if cell_array_id == array_id)
+    for array_id, indexes_array in enumerate(INDEXES_ARRAYS)
+    )
+
+
+def winning_moves(position: SearchPosition) -> list[tuple[int, int]]:
+    """
+    Returns moves that make five in a row at once (order threats).
+
+    Parameters
+    ----------
+    position: SearchPosition
+        Position
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Moves (cell index, symbol value)
+    """
+
+    cells = position.cells
+    moves = []
+    for array_id, code in enumerate(position.codes):
+        table = ARRAYS_TABLES[array_id]
+        if table.potential[code] < 4:
+            continue
+        for cell_index, weight in ARRAYS_CELLS[array_id]:
+            if cells[cell_index] != 0:
+                continue
+            for value in (1, 2):
+                if table.win[code + value * weight] and (cell_index, value) not in moves:
+                    moves.append((cell_index, value))
+    return moves
+
+
+class ThreatSpaceSearch:
+    """
+    A class representing threat-space search of order's forcing wins.
+    Only order moves that make a threat (a move winning at once) are searched, and only
+    chaos replies that leave order no winning move - any other reply loses at once.
+    A threat chaos has no such reply to (e.g. a double threat) wins. As only forcing
+    moves are followed, deep wins are found in few nodes. Found wins are certain,
+    a position without one can still be won by quiet moves.
+
+    ...
+
+    Attributes
+    ----------
+    max_depth: int
+        Maximal number of order threat moves in a sequence
+    max_nodes: int
+        Maximal number of nodes of one search
+    nodes: int
+        Number of nodes visited by the last search
+    search_time: float
+        Duration of the last search (in seconds)
+    line: list[tuple[int, int]] | None
+        Winning line found by the last search, None if there was none
+    deadline: float | None
+        `time.perf_counter()` time the running search has to end by
+
+    Methods
+    -------
+    search(values: list[int], deadline=None)
+        Returns order's forcing winning line.
+    stats()
+        Returns statistics of the last search.
+    """
+
+    def __init__(self, max_depth: int = THREAT_SEARCH_DEPTH, max_nodes: int = THREAT_SEARCH_NODES) -> None:
+        """
+        Parameters
+        ----------
+        max_depth: int, optional
+            Maximal number of order threat moves in a sequence (deafult THREAT_SEARCH_DEPTH)
+        max_nodes: int, optional
+            Maximal number of nodes of one search (deafult THREAT_SEARCH_NODES)
+        """
+
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.nodes = 0
+        self.search_time = 0.0
+        self.line = None
+        self.deadline = None
+        self._position = None
+        self._failed = {}
+
+    def search(self, values: list[int], deadline: float = None) -> list[tuple[int, int]] | None:
+        """
+        Returns order's forcing winning line from a position with order to move - threats
+        answered by chaos replies, ending with five in a row. Sequences are searched
+        with more threats one by one, so the shortest win is found first.
+
+        Parameters
+        ----------
+        values: list[int]
+            Board cells values
+        deadline: float, optional
+            `time.perf_counter()` time the search has to end by (deafult None - only node limit)
+
+        Returns
+        -------
+        list[tuple[int, int]] | None
+            Moves (cell index, symbol value) of both sides, None if no forcing win was found
+        """
+
+        start_time = time.perf_counter()
+        self.nodes = 0
+        self.deadline = deadline
+        self._position = SearchPosition(values)
+        self._failed = {}
+        line = None
+        try:
+            if self._position.winner() == NO_WINNER:
+                for depth in range(1, self.max_depth + 1):
+                    line = self._search_threats(depth)
+                    if line is not None:
+                        break
+        except SearchTimeout:
+            line = None
+        finally:
+            self.search_time = time.perf_counter() - start_time
+        self.line = line
+        return line
+
+    def stats(self) -> dict:
+        """
+        Returns statistics of the last search.
+
+        Returns
+        -------
+        dict
+            > "nodes"
+            > "depth" - plies of the found line, 0 if none was found
+            > "time" - seconds
+            > "nodes_per_second"
+        """
+
+        nodes_per_second = self.nodes / self.search_time if self.search_time > 0 else 0.0
+        return {
+            'nodes': self.nodes,
+            'depth': len(self.line) if self.line is not None else 0,
+            'time': self.search_time,
+            'nodes_per_second': nodes_per_second
+            }
+
+    def _search_threats(self, depth: int) -> list[tuple[int, int]] | None:
+        """
+        Returns forcing winning line with at most `depth` threats from current position
+        (order to move), None if there is none.
+        """
+
+        self.nodes += 1
+        if self.nodes > self.max_nodes:
+            raise SearchTimeout
+        if self.deadline is not None and not self.nodes & TIME_CHECK_NODES \
+                and time.perf_counter() >= self.deadline:
+            raise SearchTimeout
+        position = self._position
+        wins = winning_moves(position)
+        if wins:
+            return [wins[0]]
+        if self._failed.get(position.hash, 0) >= depth:
+            return None
+        for move in self._threat_candidates():
+            if position.play(move[0], move[1]) != NO_WINNER:
+                position.undo()
+                continue
+            threats = winning_moves(position)
+            line = None
+            if threats:
+                line = self._answer_threats(threats, depth)
+            position.undo()
+            if line is not None:
+                return [move] + line
+        self._failed[position.hash] = depth
+        return None
+
+    def _answer_threats(self, threats: list[tuple[int, int]], depth: int) -> list[tuple[int, int]] | None:
+        """
+        Returns forcing winning line after order's threat (chaos to move) - every chaos
+        reply that stops the threats has to lose to a further threat sequence.
+        """
+
+        position = self._position
+        line = None
+        defended = False
+        for reply in self._defence_candidates(threats):
+            result = position.play(reply[0], reply[1])
+            if result == ORDER_WON or (result == NO_WINNER and winning_moves(position)):
+                position.undo()  # reply does not stop the threats
+                continue
+            defended = True
+            reply_line = None
+            if result == NO_WINNER and depth > 1:
+                reply_line = self._search_threats(depth - 1)
+            position.undo()
+            if reply_line is None:
+                return None
+            if line is None:
+                line = [reply] + reply_line
+        if not defended:  # every reply loses at once
+            cell_index, value = threats[0]
+            blocked = (cell_index, 3 - value)
+            position.play(blocked[0], blocked[1])
+            wins = winning_moves(position)
+            position.undo()
+            return [blocked, wins[0]] if wins else [threats[0]]
+        return line
+
+    def _threat_candidates(self) -> list[tuple[int, int]]:
+        """
+        Returns order moves that can make a threat - moves on arrays with three
+        same symbols in a winnable window, the symbol of the array first.
+        """
+
+        position = self._position
+        cells = position.cells
+        moves = []
+        seen = set()
+        for array_id, code in enumerate(position.codes):
+            table = ARRAYS_TABLES[array_id]
+            if table.potential[code] != 3:
+                continue
+            symbol = 1 if table.closest[code][0] == 'circle' else 2
+            for cell_index, _ in ARRAYS_CELLS[array_id]:
+                if cells[cell_index] != 0:
+                    continue
+                for value in (symbol, 3 - symbol):
+                    if (cell_index, value) not in seen:
+                        seen.add((cell_index, value))
+                        moves.append((cell_index, value))
+        return moves
+
+    def _defence_candidates(self, threats: list[tuple[int, int]]) -> list[tuple[int, int]]:
+        """
+        Returns chaos moves that can stop the threats - moves on arrays the threats win,
+        other moves leave the threats as they are.
+        """
+
+        position = self._position
+        cells = position.cells
+        codes = position.codes
+        moves = []
+        seen = set()
+        for threat_cell, threat_value in threats:
+            for array_id, weight in CELLS_ARRAYS[threat_cell]:
+                if not ARRAYS_TABLES[array_id].win[codes[array_id] + threat_value * weight]:
+                    continue
+                for cell_index, _ in ARRAYS_CELLS[array_id]:
+                    if cells[cell_index] != 0:
+                        continue
+                    for value in (1, 2):
+                        if (cell_index, value) not in seen:
+                            seen.add((cell_index, value))
+                            moves.append((cell_index, value))
+        return moves
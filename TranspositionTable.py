@@ -0,0 +1,202 @@
+from array import array
+
+
+# entry bounds
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+NO_MOVE = 0xFF
+# every bucket holds a depth-preferred entry and an always-replace entry
+BUCKET_SIZE = 2
+ENTRY_BYTES = 16  # 8 bytes key + 8 bytes data
+
+_VALUE_OFFSET = 1 << 15
+_MASK_64 = (1 << 64) - 1
+
+
+def pack_move(move: tuple[int, int] | None) -> int:
+    """
+    Packs move (cell index, symbol value) into 8 bits.
+    """
+
+    if move is None:
+        return NO_MOVE
+    return move[0] * 2 + move[1] - 1
+
+
+def unpack_move(packed_move: int) -> tuple[int, int] | None:
+    """
+    Unpacks move packed by `pack_move()`.
+    """
+
+    if packed_move == NO_MOVE:
+        return None
+    return (packed_move >> 1, (packed_move & 1) + 1)
+
+
+class TranspositionTable:
+    """
+    A class representing fixed-size, bucketed transposition table.
+    Entries live in two preallocated arrays of 64-bit integers (keys and packed data),
+    key is stored XOR-ed with data, so a torn write is seen as a miss (lock-light sharing).
+
+    Replacement policy: the first entry of a bucket is replaced by a deeper or equal search
+    or when it comes from an older search (age), otherwise the second entry is overwritten.
+
+    ...
+
+    Attributes
+    ----------
+    buckets: int
+        Number of buckets (power of two)
+    keys: array
+        Stored keys (key ^ data)
+    data: array
+        Packed entries - value, depth, bound, move, age
+    age: int
+        Current search age, increased by `new_search()`
+    probes: int
+        Number of probes
+    hits: int
+        Number of probes that found the position
+    stores: int
+        Number of stored entries
+
+    Methods
+    -------
+    size_megabytes()
+        Returns table memory size.
+    clear()
+        Removes every entry and resets statistics.
+    new_search()
+        Increases table age.
+    probe(key: int)
+        Returns stored entry of a position.
+    store(key: int, depth: int, value: int, bound: int, move: tuple[int, int])
+        Stores search result of a position.
+    hit_rate()
+        Returns fraction of probes that were hits.
+    """
+
+    def __init__(self, size_megabytes: float = 16) -> None:
+        """
+        Parameters
+        ----------
+        size_megabytes: float, optional
+            Table memory size, rounded down to a power of two buckets (deafult 16)
+        """
+
+        buckets = 1
+        while buckets * 2 * BUCKET_SIZE * ENTRY_BYTES <= size_megabytes * 2**20:
+            buckets *= 2
+        self.buckets = buckets
+        self._bucket_mask = buckets - 1
+        self.keys = array('Q', bytes(8 * buckets * BUCKET_SIZE))
+        self.data = array('Q', bytes(8 * buckets * BUCKET_SIZE))
+        self.age = 0
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    def size_megabytes(self) -> float:
+        """
+        Returns
+        -------
+        float
+            Table memory size in megabytes
+        """
+
+        return self.buckets * BUCKET_SIZE * ENTRY_BYTES / 2**20
+
+    def clear(self) -> None:
+        """
+        Removes every entry and resets statistics and age.
+        """
+
+        self.keys = array('Q', bytes(8 * self.buckets * BUCKET_SIZE))
+        self.data = array('Q', bytes(8 * self.buckets * BUCKET_SIZE))
+        self.age = 0
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    def new_search(self) -> None:
+        """
+        Increases table age - entries of older searches are replaced first.
+        """
+
+        self.age = (self.age + 1) & 0xFF
+
+    def probe(self, key: int) -> tuple[int, int, int, tuple[int, int] | None] | None:
+        """
+        Returns stored entry of a position.
+
+        Parameters
+        ----------
+        key: int
+            Position Zobrist hash
+
+        Returns
+        -------
+        (int, int, int, (int, int) | None) | None
+            > Search depth
+            > Value
+            > Bound (EXACT, LOWER_BOUND, UPPER_BOUND)
+            > Best move
+            None if position is not stored
+        """
+
+        self.probes += 1
+        index = (key & self._bucket_mask) * BUCKET_SIZE
+        for slot in range(index, index + BUCKET_SIZE):
+            data = self.data[slot]
+            if data and self.keys[slot] ^ data == key:
+                self.hits += 1
+                return ((data >> 16) & 0x3F, (data & 0xFFFF) - _VALUE_OFFSET,
+                        (data >> 22) & 0x3, unpack_move((data >> 24) & 0xFF))
+        return None
+
+    def store(self, key: int, depth: int, value: int, bound: int, move: tuple[int, int] | None) -> None:
+        """
+        Stores search result of a position.
+
+        Parameters
+        ----------
+        key: int
+            Position Zobrist hash
+        depth: int
+            Search depth (0-63)
+        value: int
+            Position value (-32768 - 32767)
+        bound: int
+            EXACT, LOWER_BOUND or UPPER_BOUND
+        move: (int, int) | None
+            Best move found
+        """
+
+        self.stores += 1
+        data = ((value + _VALUE_OFFSET) | min(depth, 0x3F) << 16 | bound << 22
+                | pack_move(move) << 24 | self.age << 32)
+        index = (key & self._bucket_mask) * BUCKET_SIZE
+        stored_data = self.data[index]
+        stored_key = self.keys[index] ^ stored_data
+        if (not stored_data or stored_key == key or (stored_data >> 32) & 0xFF != self.age
+                or depth >= (stored_data >> 16) & 0x3F):
+            slot = index
+        else:
+            slot = index + 1
+        self.data[slot] = data
+        self.keys[slot] = (key ^ data) & _MASK_64
+
+    def hit_rate(self) -> float:
+        """
+        Returns
+        -------
+        float
+            Fraction of probes that found the position (0 if there were no probes)
+        """
+
+        if self.probes == 0:
+            return 0.0
+        return self.hits / self.probes
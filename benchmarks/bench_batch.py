@@ -0,0 +1,62 @@
+"""
+Benchmark of batched board evaluation: time per board of evaluating random positions
+(winner, winnable lines, "hard" move) one by one with `Bot` and at once with
+`BatchEvaluation.evaluate_batch()`.
+
+Run from repository root:
+    python benchmarks/bench_batch.py [boards]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+from BatchEvaluation import evaluate_batch  # noqa: E402
+from Bot import Bot  # noqa: E402
+
+
+def random_positions(amount: int) -> list[list[int]]:
+    generator = random.Random(0)
+    positions = []
+    for _ in range(amount):
+        values = [0] * 36
+        for cell in generator.sample(range(36), generator.randrange(1, 30)):
+            values[cell] = generator.randint(1, 2)
+        positions.append(values)
+    return positions
+
+
+def measure_bot(positions: list[list[int]]) -> float:
+    bot = Bot()
+    bot.set_difficulty("hard")
+    start_time = time.perf_counter()
+    for values in positions:
+        bot.load_board(values)
+        if not bot.check_winning():
+            bot.make_move("order" if values.count(0) % 2 == 0 else "chaos")
+    return (time.perf_counter() - start_time) / len(positions)
+
+
+def measure_batch(positions: list[list[int]]) -> float:
+    boards = np.array(positions, dtype=np.uint8)
+    rng = np.random.default_rng(0)
+    start_time = time.perf_counter()
+    evaluate_batch(boards, rng=rng)
+    return (time.perf_counter() - start_time) / len(positions)
+
+
+def main() -> None:
+    amount = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    positions = random_positions(amount)
+    bot_time = measure_bot(positions)
+    batch_time = measure_batch(positions)
+    print(f"{amount} boards")
+    print(f"{'Bot, one by one':<20} {bot_time * 1e6:>8.2f} us/board")
+    print(f"{'evaluate_batch':<20} {batch_time * 1e6:>8.2f} us/board ({bot_time / batch_time:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark of image blitting: time of blitting every game image once to the display
+surface, for images loaded from files as before and for `AssetManager` atlas images
+(converted to the display format and pre-scaled).
+Uses SDL dummy video driver, so no window is opened.
+
+Run from repository root:
+    python benchmarks/bench_blit.py [frames]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame  # noqa: E402
+from AssetManager import AssetManager  # noqa: E402
+
+IMAGES = (("cross_img", None), ("circle_img", None), ("cross_img", 96), ("circle_img", 96),
+          ("order_img", 2/3), ("chaos_img", 2/3), ("undo_img", None), ("restart_img", None),
+          ("menu_img", None), ("start_img", None))
+
+
+def measure(screen: pygame.Surface, images: list[pygame.Surface], frames: int) -> float:
+    start_time = time.perf_counter()
+    for _ in range(frames):
+        for index, image in enumerate(images):
+            screen.blit(image, ((index % 5) * 180, (index // 5) * 120))
+    return (time.perf_counter() - start_time) / frames
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    pygame.init()
+    screen = pygame.display.set_mode((960, 720))
+
+    assets = AssetManager("config.json")
+    loaded = []
+    for name, scaling in IMAGES:
+        image = pygame.image.load(assets.path(name))
+        if scaling == 96:
+            image = pygame.transform.scale_by(image, 96 / image.get_width())
+        elif scaling is not None:
+            image = pygame.transform.scale_by(image, scaling)
+        loaded.append(image)
+
+    start_time = time.perf_counter()
+    for name, scaling in IMAGES:
+        if scaling == 96:
+            assets.add_image(name, (96, 96))
+        else:
+            assets.add_image(name, scale=scaling)
+    assets.build_atlas()
+    build_time = time.perf_counter() - start_time
+    atlas = [assets.image(name, (96, 96)) if scaling == 96 else assets.image(name, scale=scaling)
+             for name, scaling in IMAGES]
+
+    print(f"{frames} frames, {len(IMAGES)} blits each, display depth {screen.get_bitsize()} bits")
+    print(f"atlas build              {build_time * 1000:>8.3f} ms ({assets.atlas.get_size()})")
+    print(f"{'loaded images':<24} {measure(screen, loaded, frames) * 1000:>8.3f} ms/frame")
+    print(f"{'atlas images':<24} {measure(screen, atlas, frames) * 1000:>8.3f} ms/frame")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
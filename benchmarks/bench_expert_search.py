@@ -0,0 +1,55 @@
+"""
+Benchmark of "expert" alpha-beta search: nodes per second and transposition table
+hit rate for different table sizes, measured over expert vs expert games.
+
+Run from repository root:
+    python benchmarks/bench_expert_search.py [games] [depth]
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AlphaBeta import AlphaBetaSearch  # noqa: E402
+from SearchPosition import SearchPosition, NO_WINNER  # noqa: E402
+
+
+def play_games(search: AlphaBetaSearch, games: int, depth: int) -> tuple[int, float, int, int]:
+    nodes = 0
+    search_time = 0.0
+    probes = 0
+    hits = 0
+    for game in range(games):
+        random.seed(game)
+        search.new_game()
+        position = SearchPosition()
+        # a few random opening moves for game diversity
+        for cell_index in random.sample(range(36), 2):
+            position.play(cell_index, random.choice((1, 2)))
+        order_to_move = True
+        result = NO_WINNER
+        while result == NO_WINNER:
+            move = search.search(position.cells, order_to_move, depth)
+            nodes += search.nodes
+            search_time += search.search_time
+            probes += search.table.probes
+            hits += search.table.hits
+            result = position.play(move[0], move[1])
+            order_to_move = not order_to_move
+    return nodes, search_time, probes, hits
+
+
+def main() -> None:
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    print(f"{games} games, depth {depth}")
+    for size_megabytes in (0.0625, 1, 16, 64):
+        search = AlphaBetaSearch(size_megabytes)
+        nodes, search_time, probes, hits = play_games(search, games, depth)
+        print(f"table {size_megabytes:>7} MB: {nodes:>9} nodes  {nodes / search_time:>9,.0f} nodes/s  "
+              f"hit rate {hits / max(probes, 1):.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark of Lazy SMP "expert" search: 1 to N threads sharing one transposition table
+against plain `AlphaBetaSearch.iterative_deepening()` on the same positions. Every
+search starts with a cleared table and no cached root results, so both sides run the
+same alpha-beta search (no tablebase, threat-space search or root cache).
+Without a time budget every search goes to the fixed depth and time is compared,
+with one every search runs until the budget ends and reached depth is compared.
+
+Run from repository root:
+    python benchmarks/bench_lazy_smp.py [max threads] [depth] [positions] [time budget]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AlphaBeta import AlphaBetaSearch  # noqa: E402
+from LazySmp import LazySmpSearch  # noqa: E402
+
+TABLE_SIZE_MEGABYTES = 16
+
+
+def make_positions(amount: int) -> list[tuple[list[int], bool]]:
+    positions = []
+    rng = random.Random(8)
+    for _ in range(amount):
+        values = [0] * 36
+        moves = rng.randrange(4, 10)
+        for cell_index in rng.sample(range(36), moves):
+            values[cell_index] = rng.choice((1, 2))
+        positions.append((values, moves % 2 == 0))
+    return positions
+
+
+def report(name: str, search_time: float, nodes: int, depths: int, positions: int, baseline_time: float) -> None:
+    print(f"{name:<12} {search_time:>8.2f} s  speedup {baseline_time / search_time:>5.2f}x  "
+          f"{nodes / search_time:>9,.0f} nodes/s  depth {depths / positions:.2f}")
+
+
+def main() -> None:
+    max_threads = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    positions = make_positions(int(sys.argv[3]) if len(sys.argv) > 3 else 6)
+    time_budget = float(sys.argv[4]) if len(sys.argv) > 4 else None
+    if time_budget is None:
+        print(f"{len(positions)} positions, depth {depth}, {os.cpu_count()} CPUs")
+    else:
+        depth = 36
+        print(f"{len(positions)} positions, {time_budget} s per search, {os.cpu_count()} CPUs")
+
+    def deadline() -> float | None:
+        return None if time_budget is None else time.perf_counter() + time_budget
+
+    search = AlphaBetaSearch(TABLE_SIZE_MEGABYTES)
+    search.iterative_deepening(*positions[0], depth, deadline())  # warm-up, not measured
+    baseline_time = 0.0
+    nodes = 0
+    depths = 0
+    for values, order_to_move in positions:
+        search.new_game()
+        search.iterative_deepening(values, order_to_move, depth, deadline())
+        baseline_time += search.search_time
+        nodes += search.nodes
+        depths += search.completed_depth
+    report("alpha-beta", baseline_time, nodes, depths, len(positions), baseline_time)
+
+    for threads in range(1, max_threads + 1):
+        search = LazySmpSearch(threads, TABLE_SIZE_MEGABYTES)
+        search_time = 0.0
+        nodes = 0
+        depths = 0
+        for values, order_to_move in positions:
+            search.new_game()
+            search.main_search.root_cache.clear()
+            search.search(values, order_to_move, depth, deadline())
+            search_time += search.search_time
+            nodes += search.nodes
+            depths += search.completed_depth
+        search.close()
+        report(f"{threads} threads", search_time, nodes, depths, len(positions), baseline_time)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark of line checks: run-splitting functions vs precomputed line tables.
+
+Run from repository root:
+    python benchmarks/bench_line_tables.py
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Bot import Bot  # noqa: E402
+from BitBoard import BitBoard  # noqa: E402
+from LineTables import LINE_TABLES, encode_array  # noqa: E402
+
+
+def split_check_array_win(bot: Bot, array: list[int]) -> bool:
+    for subarray in bot._split_array_into_subarrays(array):
+        if len(subarray) == 5 and subarray[0] != 0:
+            return True
+    return False
+
+
+def count_check_array_winnability(bot: Bot, array: list[int]) -> bool:
+    if len(array) == 6:
+        if array[0] == array[-1] and array[0] != 0:
+            return False
+        symbol_count = bot._amount_of_each_symbol_in_array(array[1:5])
+    else:
+        symbol_count = bot._amount_of_each_symbol_in_array(array)
+    return not (symbol_count['circle'] >= 1 and symbol_count['cross'] >= 1)
+
+
+def split_update_arrays(bot: Bot) -> bool:
+    for indexes_array in bot._indexes_arrays:
+        board_values_array = bot._get_board_values_array(indexes_array)
+        if split_check_array_win(bot, board_values_array):
+            return True
+        count_check_array_winnability(bot, board_values_array)
+    return False
+
+
+def random_boards(amount: int) -> list[BitBoard]:
+    boards = []
+    for _ in range(amount):
+        values = [random.choice((0, 0, 1, 2)) for _ in range(36)]
+        boards.append(BitBoard(values))
+    return boards
+
+
+def main() -> None:
+    random.seed(0)
+    bot = Bot()
+    arrays = [[random.randrange(3) for _ in range(random.choice((5, 6)))] for _ in range(10000)]
+    codes = [(LINE_TABLES[len(array)], encode_array(array)) for array in arrays]
+
+    def old_lines():
+        for array in arrays:
+            split_check_array_win(bot, array)
+            count_check_array_winnability(bot, array)
+
+    def new_lines():
+        for table, code in codes:
+            table.win[code]
+            table.winnability[code]
+
+    old = min(timeit.repeat(old_lines, number=1, repeat=5))
+    new = min(timeit.repeat(new_lines, number=1, repeat=5))
+    print(f"line checks:  {len(arrays) / old:>12,.0f} lines/s (run-split)  "
+          f"{len(arrays) / new:>12,.0f} lines/s (tables)  x{old / new:.1f}")
+
+    boards = random_boards(2000)
+    bots = []
+    for board in boards:
+        board_bot = Bot()
+        board_bot.load_board(board)
+        bots.append(board_bot)
+
+    def old_boards():
+        for board_bot in bots:
+            split_update_arrays(board_bot)
+
+    def new_boards():
+        for board_bot in bots:
+            board_bot._load_indexes_to_check()
+            board_bot._update_arrays()
+
+    def reload_only():
+        for board_bot in bots:
+            board_bot._load_indexes_to_check()
+
+    old = min(timeit.repeat(old_boards, number=1, repeat=5))
+    new = min(timeit.repeat(new_boards, number=1, repeat=5)) - min(timeit.repeat(reload_only, number=1, repeat=5))
+    print(f"board checks: {len(bots) / old:>12,.0f} boards/s (run-split) "
+          f"{len(bots) / new:>12,.0f} boards/s (tables) x{old / new:.1f}")
+
+
+if __name__ == "__main__":
+    main()
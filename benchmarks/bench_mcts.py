@@ -0,0 +1,46 @@
+"""
+Benchmark of "mcts" Monte Carlo tree search: playouts per second with root
+parallelization over 1, 2, 4, ... worker processes (up to CPU count).
+
+Run from repository root:
+    python benchmarks/bench_mcts.py [seconds per search] [searches] [max workers]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from MonteCarlo import MonteCarloTreeSearch  # noqa: E402
+
+
+def main() -> None:
+    time_budget = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    searches = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    cpus = int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count() or 1
+    print(f"{searches} searches of {time_budget} s from empty board, {os.cpu_count()} CPUs")
+    workers_counts = []
+    workers = 1
+    while workers <= cpus:
+        workers_counts.append(workers)
+        workers *= 2
+    if workers_counts[-1] != cpus:
+        workers_counts.append(cpus)
+    single_rate = None
+    for workers in workers_counts:
+        search = MonteCarloTreeSearch(workers)
+        search.search([0] * 36, True, 10)  # start worker processes
+        playouts = 0
+        search_time = 0.0
+        for _ in range(searches):
+            search.search([0] * 36, True, time_budget=time_budget)
+            playouts += search.playouts
+            search_time += search.search_time
+        search.close()
+        rate = playouts / search_time
+        if single_rate is None:
+            single_rate = rate
+        print(f"{workers:>3} workers: {rate:>10,.0f} playouts/s  speedup {rate / single_rate:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark of random playouts from empty board: playouts per second of
+`Bot._pick_random_cell()` with `Bot.check_winning()`, of `MonteCarlo.random_playout()`
+and of `BatchEvaluation.random_playouts()` playing many games in lockstep.
+
+Run from repository root:
+    python benchmarks/bench_playouts.py [playouts] [batch size]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+from BatchEvaluation import random_playouts  # noqa: E402
+from BoardModel import BoardModel  # noqa: E402
+from Bot import Bot  # noqa: E402
+from MonteCarlo import random_playout  # noqa: E402
+from SearchPosition import SearchPosition  # noqa: E402
+
+
+def measure_bot(playouts: int) -> float:
+    random.seed(0)
+    board = BoardModel()
+    bot = Bot()
+    start_time = time.perf_counter()
+    for _ in range(playouts):
+        board.set_up_board()
+        bot.load_board(board.board)
+        winner = ""
+        while not winner:
+            move = bot._pick_random_cell()
+            board.update(move[0], move[1])
+            winner = bot.check_winning(move)
+    return playouts / (time.perf_counter() - start_time)
+
+
+def measure_search_position(playouts: int) -> float:
+    rng = random.Random(0)
+    position = SearchPosition([0] * 36)
+    start_time = time.perf_counter()
+    for _ in range(playouts):
+        random_playout(position, rng)
+    return playouts / (time.perf_counter() - start_time)
+
+
+def measure_batch(playouts: int, batch_size: int) -> float:
+    rng = np.random.default_rng(0)
+    start_time = time.perf_counter()
+    for start in range(0, playouts, batch_size):
+        random_playouts(np.zeros((min(batch_size, playouts - start), 36), dtype=np.uint8), rng)
+    return playouts / (time.perf_counter() - start_time)
+
+
+def main() -> None:
+    playouts = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 4096
+    python_rate = measure_search_position(playouts)
+    cases = (
+        ("Bot random moves", measure_bot(playouts // 10)),
+        ("MonteCarlo.random_playout", python_rate),
+        (f"random_playouts, {batch_size}", measure_batch(playouts, batch_size)),
+        )
+    print(f"{playouts} playouts from empty board")
+    for name, rate in cases:
+        print(f"{name:<30} {rate:>12,.0f} playouts/s  {rate / python_rate:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
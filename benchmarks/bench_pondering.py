@@ -0,0 +1,69 @@
+"""
+Benchmark of "expert" pondering: depth the bot search completes within its time budget
+after opponent's move, with and without pondering during the opponent's thinking time.
+Opponent is the "hard" bot, its thinking time is simulated by sleeping.
+
+Run from repository root:
+    python benchmarks/bench_pondering.py [games] [opponent seconds] [bot seconds]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Bot import Bot  # noqa: E402
+from BoardModel import BoardModel  # noqa: E402
+
+
+def play_games(games: int, opponent_time: float, bot_time: float, pondering: bool) -> tuple[int, int, int]:
+    depths = 0
+    moves = 0
+    cache_hits = 0
+    for game in range(games):
+        random.seed(game)
+        board = BoardModel()
+        board.set_up_board()
+        bot = Bot()
+        bot.load_board(board.board)
+        bot.set_difficulty("expert")
+        bot.set_search_limits(8, bot_time)
+        opponent = Bot()
+        opponent.load_board(board.board)
+        opponent.set_difficulty("hard")
+        winner = ""
+        order_turn = True  # opponent plays order
+        while not winner:
+            if order_turn:
+                if pondering:
+                    bot.start_pondering("chaos")
+                time.sleep(opponent_time)
+                move = opponent.make_move("order")
+            else:
+                move = bot.make_move("chaos")
+                stats = bot.search_stats()
+                depths += stats['depth']
+                moves += 1
+                cache_hits += stats['nodes'] == 0
+            board.update(move[0], move[1])
+            winner = bot.check_winning(move)
+            opponent.check_winning(move)
+            order_turn = not order_turn
+        bot.stop_pondering()
+    return depths, moves, cache_hits
+
+
+def main() -> None:
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    opponent_time = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    bot_time = float(sys.argv[3]) if len(sys.argv) > 3 else 0.2
+    print(f"{games} games, opponent thinks {opponent_time} s, bot budget {bot_time} s")
+    for pondering in (False, True):
+        depths, moves, cache_hits = play_games(games, opponent_time, bot_time, pondering)
+        print(f"pondering {'on ' if pondering else 'off'}: average depth {depths / moves:.2f}  "
+              f"answered from pondering {cache_hits}/{moves}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark of game screen rendering: time of one `GameEngine` render call when
+the whole screen, a single board cell or nothing has changed.
+Uses SDL dummy video driver, so no window is opened.
+
+Run from repository root:
+    python benchmarks/bench_render.py [frames]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame  # noqa: E402
+from GameEngine import GameEngine  # noqa: E402
+
+
+def measure(render, prepare, frames: int) -> float:
+    total = 0.0
+    for _ in range(frames):
+        prepare()
+        start_time = time.perf_counter()
+        render()
+        total += time.perf_counter() - start_time
+    return total / frames
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    pygame.init()
+    engine = GameEngine()
+    engine._menu_assets_future.result()
+    engine._loading_update()
+    engine._start_game()
+    for cell_index, symbol in ((0, "circle"), (7, "cross"), (14, "circle"), (21, "cross")):
+        engine._board.update(cell_index, symbol)
+    dirty_regions = engine._dirty_regions
+    cases = (
+        ("menu, whole screen", engine._menu_render, dirty_regions.mark_all),
+        ("game, whole screen", engine._game_render, dirty_regions.mark_all),
+        ("game, one cell", engine._game_render, lambda: dirty_regions.mark(engine._board.cell_rect(14))),
+        ("game, nothing changed", engine._game_render, lambda: None),
+        )
+    print(f"{frames} frames each")
+    for name, render, prepare in cases:
+        print(f"{name:<24} {measure(render, prepare, frames) * 1000:>8.3f} ms/frame")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
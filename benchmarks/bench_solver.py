@@ -0,0 +1,76 @@
+"""
+Benchmark of df-pn solver: time and expanded nodes of proving late positions of
+simulated "hard" games, against exhaustive minimax over every (cell, symbol) move
+(memoized by position, without pruning).
+
+Run from repository root:
+    python benchmarks/bench_solver.py [empty cells] [positions]
+"""
+import functools
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Simulation import play_game  # noqa: E402
+from SearchPosition import SearchPosition, NO_WINNER  # noqa: E402
+from Solver import solve  # noqa: E402
+
+
+@functools.lru_cache(maxsize=None)
+def minimax(cells: tuple[int, ...], order_to_move: bool) -> int:
+    position = SearchPosition(list(cells))
+    results = []
+    for cell_index, value in enumerate(cells):
+        if value:
+            continue
+        for symbol in (1, 2):
+            result = position.play(cell_index, symbol)
+            if result == NO_WINNER:
+                result = minimax(tuple(position.cells), not order_to_move)
+            position.undo()
+            results.append(result)
+    return max(results) if order_to_move else min(results)
+
+
+def game_positions(empty_cells: int, amount: int) -> list[list[int]]:
+    positions = []
+    game_seed = 0
+    while len(positions) < amount:
+        position = SearchPosition()
+        for cell_index, value in play_game("easy", "easy", game_seed)["moves"]:
+            if position.empty_cells == empty_cells or position.play(cell_index, value) != NO_WINNER:
+                break
+        if position.empty_cells == empty_cells and position.winner() == NO_WINNER:
+            positions.append(list(position.cells))
+        game_seed += 1
+    return positions
+
+
+def main() -> None:
+    empty_cells = int(sys.argv[1]) if len(sys.argv) > 1 else 9
+    amount = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    positions = game_positions(empty_cells, amount)
+    side_to_move = "order" if empty_cells % 2 == 0 else "chaos"
+    print(f"{amount} positions with {empty_cells} empty cells, {side_to_move} to move")
+
+    start_time = time.perf_counter()
+    solutions = [solve(values, side_to_move) for values in positions]
+    solver_time = time.perf_counter() - start_time
+    nodes = sum(solution["nodes"] for solution in solutions)
+    proof_size = sum(solution["proof_size"] for solution in solutions)
+    print(f"{'df-pn':<10} {solver_time / amount * 1000:>10.1f} ms/position  "
+          f"{nodes / amount:>10.0f} nodes  proof {proof_size / amount:.0f} positions")
+
+    start_time = time.perf_counter()
+    results = [minimax(tuple(values), side_to_move == "order") for values in positions]
+    minimax_time = time.perf_counter() - start_time
+    print(f"{'minimax':<10} {minimax_time / amount * 1000:>10.1f} ms/position  "
+          f"{minimax.cache_info().currsize / amount:>10.0f} nodes")
+    winners = [{1: "order", -1: "chaos"}[result] for result in results]
+    assert winners == [solution["winner"] for solution in solutions]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark of cold start: every run is a new process creating `GameEngine` and running
+loading updates until every asset is applied. Reported times (from engine creation):
+first frame (splash screen shown), menu interactive and game assets applied.
+Assets are loaded once from config.json files and once from the memory-mapped
+assets bundle. The bundle is built first if it is missing.
+Uses SDL dummy video driver, so no window is opened.
+
+Run from repository root:
+    python benchmarks/bench_startup.py [runs]
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RUN = """
+import os, sys, time
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+sys.path.insert(0, ".")
+import pygame
+import GameEngine
+if sys.argv[1] == "config":
+    GameEngine.ASSETS_BUNDLE_PATH = "missing.bundle"
+pygame.init()
+engine = GameEngine.GameEngine()
+while "game" not in engine._startup_times:
+    engine._loading_update() if engine._game_state == "loading" else engine._menu_update()
+    time.sleep(0.0002)
+print(engine._startup_times["first_frame"], engine._startup_times["menu"], engine._startup_times["game"])
+"""
+
+
+def measure(mode: str, runs: int) -> list[float]:
+    times = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", RUN, mode], cwd=ROOT, check=True,
+                                capture_output=True, text=True).stdout.split()
+        times.append([float(value) for value in output])
+    return [min(column) for column in zip(*times)]
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    if not os.path.exists(os.path.join(ROOT, "assets.bundle")):
+        subprocess.run([sys.executable, "build_assets.py"], cwd=ROOT, check=True)
+    print(f"best of {runs} runs, ms from engine creation")
+    print(f"{'':<8} {'first frame':>12} {'menu':>8} {'game':>8}")
+    for mode in ("config", "bundle"):
+        first_frame, menu, game = measure(mode, runs)
+        print(f"{mode:<8} {first_frame * 1000:>12.2f} {menu * 1000:>8.2f} {game * 1000:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
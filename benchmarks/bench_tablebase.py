@@ -0,0 +1,41 @@
+"""
+Benchmark of endgame tablebase: generation time, file size, share of late game
+positions of new simulated games found in it and time of one lookup.
+
+Run from repository root:
+    python benchmarks/bench_tablebase.py [games] [max empty cells]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from build_tablebase import game_seeds  # noqa: E402
+from Tablebase import Tablebase, generate_tablebase  # noqa: E402
+
+
+def main() -> None:
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    max_empty = int(sys.argv[2]) if len(sys.argv) > 2 else 6
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.tablebase")
+        start_time = time.perf_counter()
+        seeds = game_seeds(games, max_empty)
+        entries = generate_tablebase(path, seeds, max_empty)
+        generation_time = time.perf_counter() - start_time
+        print(f"{games} games, {len(seeds)} seeds, {entries} positions in {generation_time:.1f} s, "
+              f"{os.path.getsize(path) / 1024:.0f} KiB")
+
+        tablebase = Tablebase(path)
+        positions = game_seeds(games, max_empty, seed=1)
+        start_time = time.perf_counter()
+        found = sum(tablebase.probe(values, values.count(0) % 2 == 0) is not None for values in positions)
+        probe_time = (time.perf_counter() - start_time) / len(positions)
+        print(f"new games: {found}/{len(positions)} late positions found, {probe_time * 1e6:.0f} us/lookup")
+        tablebase.close()
+
+
+if __name__ == "__main__":
+    main()
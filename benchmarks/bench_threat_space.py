@@ -0,0 +1,72 @@
+"""
+Benchmark of threat-space search: time and nodes of finding order's forcing wins in
+positions of simulated "easy" games with order to move, against "expert" alpha-beta
+search of deafult depth. Plies of found lines show how far past alpha-beta horizon they go.
+
+Run from repository root:
+    python benchmarks/bench_threat_space.py [positions] [alpha-beta depth]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AlphaBeta import AlphaBetaSearch  # noqa: E402
+from Simulation import play_game  # noqa: E402
+from SearchPosition import SearchPosition, NO_WINNER  # noqa: E402
+from ThreatSpace import ThreatSpaceSearch  # noqa: E402
+
+
+def forcing_positions(amount: int) -> list[list[int]]:
+    """
+    Returns positions with order to move that have a forcing win - from every game the first one.
+    """
+
+    search = ThreatSpaceSearch()
+    positions = []
+    game_seed = 0
+    while len(positions) < amount:
+        position = SearchPosition()
+        for cell_index, value in play_game("easy", "easy", game_seed)["moves"]:
+            if position.empty_cells % 2 == 0 and search.search(position.cells) is not None:
+                positions.append(list(position.cells))
+                break
+            if position.play(cell_index, value) != NO_WINNER:
+                break
+        game_seed += 1
+    return positions
+
+
+def main() -> None:
+    amount = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 6
+    positions = forcing_positions(amount)
+    empty_cells = sum(values.count(0) for values in positions) / amount
+    print(f"{amount} positions with forcing wins, order to move, {empty_cells:.1f} empty cells")
+
+    search = ThreatSpaceSearch()
+    nodes = 0
+    plies = 0
+    start_time = time.perf_counter()
+    for values in positions:
+        plies += len(search.search(values))
+        nodes += search.nodes
+    threat_time = time.perf_counter() - start_time
+    print(f"{'threats':<12} {threat_time / amount * 1000:>10.2f} ms/position  "
+          f"{nodes / amount:>10.0f} nodes  line {plies / amount:.1f} plies")
+
+    alpha_beta = AlphaBetaSearch()
+    nodes = 0
+    start_time = time.perf_counter()
+    for values in positions:
+        alpha_beta.new_game()
+        alpha_beta.search(values, True, depth)
+        nodes += alpha_beta.stats()["nodes"]
+    alpha_beta_time = time.perf_counter() - start_time
+    print(f"{'alpha-beta':<12} {alpha_beta_time / amount * 1000:>10.2f} ms/position  "
+          f"{nodes / amount:>10.0f} nodes  depth {depth}")
+
+
+if __name__ == "__main__":
+    main()
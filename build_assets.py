@@ -0,0 +1,20 @@
+from AssetManager import AssetManager
+from GameEngine import GameEngine, ASSETS_CONFIG_PATH, ASSETS_BUNDLE_PATH
+
+
+def main():
+    """
+    Packs every image (pre-scaled, in one atlas) and font from config.json
+    into the assets bundle loaded on game start. Run again after changing assets.
+    """
+
+    assets = AssetManager(ASSETS_CONFIG_PATH)
+    GameEngine.add_menu_images(assets)
+    GameEngine.add_game_images(assets)
+    assets.build_atlas()
+    assets.save_bundle(ASSETS_BUNDLE_PATH)
+    print(f"{ASSETS_BUNDLE_PATH}: {len(assets.regions)} images, atlas {assets.atlas.get_size()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import argparse
+import sys
+import time
+from SearchPosition import SearchPosition, NO_WINNER
+from Simulation import play_game, simulation_games
+from Tablebase import TABLEBASE_PATH, TABLEBASE_MAX_EMPTY, generate_tablebase, relevant_empty_cells
+
+SEED_DIFFICULTIES = ("easy", "hard")
+
+
+def game_seeds(games: int, max_empty: int, seed: int = 0) -> list[list[int]]:
+    """
+    Returns tablebase seeds - from every simulated game the first position with at most
+    `max_empty` empty cells on winnable arrays (if the game gets there).
+
+    Parameters
+    ----------
+    games: int
+        Number of simulated games
+    max_empty: int
+        Maximal number of empty cells on winnable arrays
+    seed: int, optional
+        Simulation seed (deafult 0)
+
+    Returns
+    -------
+    list[list[int]]
+        Boards cells values
+    """
+
+    seeds = []
+    for _, order_difficulty, chaos_difficulty, game_seed in simulation_games(games, SEED_DIFFICULTIES, seed):
+        position = SearchPosition()
+        for cell_index, value in play_game(order_difficulty, chaos_difficulty, game_seed)["moves"]:
+            if position.play(cell_index, value) != NO_WINNER:
+                break
+            if relevant_empty_cells(position) <= max_empty:
+                seeds.append(list(position.cells))
+                break
+    return seeds
+
+
+def main(argv: list[str] = None) -> None:
+    """
+    Solves late game positions of simulated games and writes the endgame tablebase
+    loaded on game start. Interrupted generation continues when run again with the same arguments.
+    """
+
+    parser = argparse.ArgumentParser(description="Endgame tablebase generation.")
+    parser.add_argument("--games", type=int, default=4000, help="number of simulated games seeds come from")
+    parser.add_argument("--max-empty", type=int, default=TABLEBASE_MAX_EMPTY,
+                        help="maximal number of empty cells on winnable arrays")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--seed", type=int, default=0, help="simulation seed")
+    parser.add_argument("--output", default=TABLEBASE_PATH, help="tablebase file")
+    args = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+    seeds = game_seeds(args.games, args.max_empty, args.seed)
+    # equal seeds are solved once
+    seeds = [list(cells) for cells in dict.fromkeys(tuple(cells) for cells in seeds)]
+
+    def progress(done: int, parts: int) -> None:
+        print(f"\r{done}/{parts} parts", end="", file=sys.stderr, flush=True)
+
+    entries = generate_tablebase(args.output, seeds, args.max_empty, args.workers, progress)
+    print(f"\n{args.output}: {entries} positions from {len(seeds)} seeds in "
+          f"{time.perf_counter() - start_time:.1f} s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import time
+import pytest
+from AlphaBeta import AlphaBetaSearch, WIN_THRESHOLD
+
+
+def test_search_order_finds_win():
+    search = AlphaBetaSearch(1)
+    values = [0] * 36
+    for index in range(4):
+        values[index] = 1
+    assert search.search(values, True, 2) == (4, 1)
+    assert search.best_value > WIN_THRESHOLD
+
+
+def test_search_chaos_blocks_win():
+    search = AlphaBetaSearch(1)
+    values = [0] * 36
+    for index in range(4):
+        values[index] = 1
+    assert search.search(values, False, 2) == (4, 2)
+
+
+def test_search_chaos_sees_open_four_loss():
+    search = AlphaBetaSearch(1)
+    values = [0] * 36
+    for index in range(7, 11):
+        values[index] = 2
+    search.search(values, False, 3)
+    assert search.best_value < -WIN_THRESHOLD
+
+
+def test_search_no_moves():
+    search = AlphaBetaSearch(1)
+    values = [1 if index % 2 == 0 else 2 for index in range(36)]
+    with pytest.raises(ValueError):
+        search.search(values, True, 2)
+
+
+def test_search_stats():
+    search = AlphaBetaSearch(1)
+    search.search([0] * 36, True, 2)
+    stats = search.stats()
+    assert stats['nodes'] > 0
+    assert stats['nodes_per_second'] > 0
+    assert 0 <= stats['table_hit_rate'] <= 1
+    assert stats['table_size_megabytes'] == 1
+
+
+def test_table_kept_between_searches():
+    search = AlphaBetaSearch(1)
+    values = [0] * 36
+    values[14] = 1
+    search.search(values, False, 3)
+    values[15] = 2
+    search.search(values, True, 3)
+    assert search.table.hits > 0
+    search.new_game()
+    assert search.table.stores == 0
+
+
+def test_search_deadline():
+    search = AlphaBetaSearch(1)
+    start_time = time.perf_counter()
+    move = search.search([0] * 36, True, 20, start_time + 0.05)
+    assert time.perf_counter() - start_time < 0.5
+    assert move in search.position.generate_moves()
+    assert search.position.moves == []
+    assert search.completed_depth < 20
+
+
+def test_search_deadline_already_passed():
+    search = AlphaBetaSearch(1)
+    values = [0] * 36
+    for index in range(4):
+        values[index] = 1
+    move = search.search(values, True, 5, time.perf_counter())
+    assert move in search.position.generate_moves()
+
+
+def test_search_stops_on_proven_win():
+    search = AlphaBetaSearch(1)
+    values = [0] * 36
+    for index in range(4):
+        values[index] = 1
+    search.search(values, True, 10)
+    assert search.completed_depth == 1
+
+
+def test_root_cache_symmetric_position():
+    search = AlphaBetaSearch(1)
+    values = [0] * 36
+    for index in range(4):
+        values[index] = 1
+    assert search.search(values, True, 2) == (4, 1)
+    search.new_game()
+    # rotated by 90 degrees with symbols swapped - crosses in the last column
+    rotated = [0] * 36
+    for index in range(0, 24, 6):
+        rotated[index + 5] = 2
+    assert search.search(rotated, True, 2) == (29, 2)
+    assert search.nodes == 0
+    assert search.best_value > WIN_THRESHOLD
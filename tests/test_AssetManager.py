@@ -0,0 +1,105 @@
+import json
+import os
+import pygame
+import pytest
+from AssetManager import AssetManager
+from FontCache import font_cache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_assets(tmp_path) -> AssetManager:
+    with open(os.path.join(ROOT, "config.json")) as json_file:
+        paths = json.load(json_file)
+    paths = {name: os.path.join(ROOT, path) for name, path in paths.items()}
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps(paths))
+    return AssetManager(str(config_path))
+
+
+def test_path(tmp_path):
+    assets = make_assets(tmp_path)
+    assert assets.path("font_path").endswith("RubikDoodleShadow-Regular.ttf")
+
+
+def test_atlas_regions_do_not_overlap(tmp_path):
+    assets = make_assets(tmp_path)
+    assert assets.add_image("order_img") == (96, 96)
+    assert assets.add_image("order_img", scale=2/3) == (64, 64)
+    assert assets.add_image("cross_img", (96, 96)) == (96, 96)
+    assert assets.add_image("undo_img") == (164, 50)
+    assets.build_atlas()
+    rects = list(assets.regions.values())
+    assert len(rects) == 4
+    for index, rect in enumerate(rects):
+        assert assets.atlas.get_rect().contains(rect)
+        assert rect.collidelist(rects[index + 1:]) == -1
+
+
+def test_image_matches_scaled_file(tmp_path):
+    assets = make_assets(tmp_path)
+    assets.add_image("chaos_img", scale=2/3)
+    assets.build_atlas()
+    image = assets.image("chaos_img", scale=2/3)
+    expected = pygame.transform.scale_by(pygame.image.load(assets.path("chaos_img")), 2/3)
+    assert image.get_size() == expected.get_size()
+    assert image.get_parent() is assets.atlas
+    for position in ((0, 0), (32, 32), (20, 40), (63, 63)):
+        assert image.get_at(position) == expected.get_at(position)
+
+
+def test_image_not_added_rebuilds_atlas(tmp_path):
+    assets = make_assets(tmp_path)
+    assets.add_image("menu_img")
+    assets.build_atlas()
+    image = assets.image("start_img")
+    assert image.get_size() == (164, 50)
+    assert image.get_parent() is assets.atlas
+    assert len(assets.regions) == 2
+
+
+def test_bundle_round_trip(tmp_path):
+    assets = make_assets(tmp_path)
+    assets.add_image("order_img", scale=2/3)
+    assets.add_image("cross_img", (96, 96))
+    assets.add_image("undo_img")
+    assets.build_atlas()
+    bundle_path = str(tmp_path / "assets.bundle")
+    assets.save_bundle(bundle_path)
+
+    loaded = AssetManager(bundle_path=bundle_path)
+    assert loaded.paths == assets.paths
+    assert loaded.regions == assets.regions
+    for name, size, scale in (("order_img", None, 2/3), ("cross_img", (96, 96), None), ("undo_img", None, None)):
+        image = loaded.image(name, size, scale)
+        expected = assets.image(name, size, scale)
+        assert image.get_size() == expected.get_size()
+        for position in ((0, 0), (20, 30), (40, 10)):
+            assert image.get_at(position) == expected.get_at(position)
+    # bundled images are not read from files
+    assert loaded._sources == {}
+
+
+def test_bundle_fonts_registered(tmp_path):
+    pygame.font.init()
+    assets = make_assets(tmp_path)
+    assets.build_atlas()
+    bundle_path = str(tmp_path / "assets.bundle")
+    assets.save_bundle(bundle_path)
+    AssetManager(bundle_path=bundle_path)
+    font = font_cache.font(assets.path("font_path"), 20)
+    assert font.size("(YOU)") == pygame.font.Font(assets.path("font_path"), 20).size("(YOU)")
+
+
+def test_bundle_wrong_file(tmp_path):
+    bundle_path = tmp_path / "assets.bundle"
+    bundle_path.write_bytes(b"not a bundle at all")
+    with pytest.raises(ValueError):
+        AssetManager(bundle_path=str(bundle_path))
+
+
+def test_config_paths_relative_to_config(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assets = AssetManager(os.path.join(ROOT, "config.json"))
+    assert assets.path("font_path") == os.path.join(ROOT, "assets", "RubikDoodleShadow-Regular.ttf")
+    assert all(os.path.exists(path) for path in assets.paths.values())
@@ -0,0 +1,115 @@
+import random
+import numpy as np
+import pytest
+from BatchEvaluation import LINES_INDEXES, NO_MOVE, evaluate_batch, evaluate_boards, hard_moves, \
+    playout_statistics, random_playouts
+from Bot import Bot, symbol_dict
+from SearchPosition import NO_WINNER, ORDER_WON, CHAOS_WON
+
+
+def random_positions(amount: int, seed: int) -> list[list[int]]:
+    generator = random.Random(seed)
+    positions = []
+    for _ in range(amount):
+        values = [0] * 36
+        for cell in generator.sample(range(36), generator.randrange(0, 30)):
+            values[cell] = generator.randint(1, 2)
+        positions.append(values)
+    return positions
+
+
+def bot_for(values: list[int]) -> Bot:
+    bot = Bot()
+    bot.load_board(list(values))
+    return bot
+
+
+def test_index_matrix():
+    assert LINES_INDEXES.shape == (18, 6)
+    assert list(LINES_INDEXES[0]) == [0, 1, 2, 3, 4, 5]
+
+
+def test_evaluate_boards_matches_bot():
+    positions = random_positions(300, 1)
+    winners, winnable_counts = evaluate_boards(np.array(positions, dtype=np.uint8))
+    expected_winners = {"order": ORDER_WON, "chaos": CHAOS_WON, "": NO_WINNER}
+    for values, winner, winnable_count in zip(positions, winners, winnable_counts):
+        bot = bot_for(values)
+        assert winner == expected_winners[bot.check_winning()]
+        if winner != ORDER_WON:
+            assert winnable_count == len(bot._indexes_arrays)
+
+
+def test_hard_moves_match_bot():
+    positions = [values for values in random_positions(300, 2) if any(values)]
+    boards = np.array(positions, dtype=np.uint8)
+    winners, _ = evaluate_boards(boards)
+    for order_to_move in (False, True):
+        moves = hard_moves(boards, order_to_move, np.random.default_rng(3))
+        for values, winner, move in zip(positions, winners, moves):
+            if winner != NO_WINNER:
+                continue
+            bot = bot_for(values)
+            bot.check_winning()
+            array_info = bot._find_arrays_closest_to_win()[0]
+            indexes_array = array_info['indexes_array']
+            if order_to_move:
+                candidates, symbol = array_info['table'].order_reply[array_info['code']]
+                expected = {(indexes_array[position], symbol_dict[symbol]) for position in candidates}
+            else:
+                chaos_reply = array_info['table'].chaos_reply[array_info['code']]
+                if chaos_reply is None:
+                    expected = {(indexes_array[position], symbol_dict[array_info['symbol']]) for position in (1, 2, 3)}
+                else:
+                    expected = {(indexes_array[chaos_reply[0]], symbol_dict[chaos_reply[1]])}
+            assert tuple(move) in expected
+            assert values[move[0]] == 0
+
+
+def test_evaluate_batch():
+    boards = np.zeros((3, 36), dtype=np.uint8)
+    boards[1, :5] = 1
+    boards[2] = np.tile([1, 2], 18)
+    winners, winnable_counts, moves = evaluate_batch(boards, rng=np.random.default_rng(0))
+    assert list(winners) == [NO_WINNER, ORDER_WON, CHAOS_WON]
+    assert list(winnable_counts) == [18, 18, 0]
+    assert 0 <= moves[0, 0] < 36 and moves[0, 1] in (1, 2)
+    assert list(moves[1]) == [NO_MOVE, NO_MOVE]
+    assert list(moves[2]) == [NO_MOVE, NO_MOVE]
+
+
+def test_evaluate_batch_wrong_shape():
+    with pytest.raises(ValueError):
+        evaluate_batch(np.zeros((2, 35), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        evaluate_batch(np.full((2, 36), 3, dtype=np.uint8))
+
+
+def test_random_playouts_finished_games():
+    positions = random_positions(200, 4)
+    boards = np.array(positions, dtype=np.uint8)
+    expected_winners, _ = evaluate_boards(boards)
+    winners, plies = random_playouts(boards, np.random.default_rng(5))
+    assert set(winners) <= {ORDER_WON, CHAOS_WON}
+    finished = expected_winners != NO_WINNER
+    assert list(winners[finished]) == list(expected_winners[finished])
+    assert not plies[finished].any()
+    assert (plies[~finished] > 0).all()
+    assert (plies <= np.count_nonzero(boards == 0, axis=1)).all()
+
+
+def test_random_playouts_last_cell():
+    # circle in the last empty cell wins for order, cross leaves no winnable line
+    values = [1, 2, 1, 1, 0, 1, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 1, 1,
+              2, 1, 2, 2, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 2, 1]
+    winners, plies = random_playouts(np.array([values] * 200, dtype=np.uint8), np.random.default_rng(6))
+    assert set(winners) == {ORDER_WON, CHAOS_WON}
+    assert list(plies) == [1] * 200
+
+
+def test_playout_statistics():
+    statistics = playout_statistics([0] * 36, 1000, np.random.default_rng(7), batch_size=300)
+    assert statistics["playouts"] == 1000
+    assert statistics["order_wins"] + statistics["chaos_wins"] == 1000
+    assert 0.6 < statistics["order_win_rate"] < 0.9
+    assert 5 <= statistics["average_plies"] <= 36
@@ -0,0 +1,86 @@
+from BitBoard import BitBoard, cells_mask, line_windows, check_line_win, check_line_winnability
+
+
+def test_bitboard_initialization():
+    board = BitBoard([1, 0, 2, 0])
+    assert board == [1, 0, 2, 0]
+    assert board.circles == 0b0001
+    assert board.crosses == 0b0100
+    assert board.occupied == 0b0101
+
+
+def test_bitboard_reset():
+    board = BitBoard([1, 2, 1])
+    board.reset(36)
+    assert board == [0] * 36
+    assert board.occupied == 0
+
+
+def test_bitboard_place_and_remove():
+    board = BitBoard()
+    board.reset(36)
+    board.place(35, 2)
+    assert board[35] == 2
+    assert board.crosses == 1 << 35
+    assert board.is_empty(35) is False
+    board.remove(35)
+    assert board[35] == 0
+    assert board.crosses == 0
+    assert board.is_empty(35) is True
+
+
+def test_bitboard_setitem_keeps_bitmasks():
+    board = BitBoard()
+    board.reset(6)
+    board[1] = 1
+    board[2] = 2
+    board[1] = 2
+    assert board.circles == 0
+    assert board.crosses == 0b110
+    board[2] = 0
+    assert board.occupied == 0b010
+
+
+def test_cells_mask():
+    assert cells_mask([0, 2, 5]) == 0b100101
+
+
+def test_line_windows_six_cells():
+    windows = line_windows([0, 1, 2, 3, 4, 5])
+    assert windows == ((0b011111, 0b100000), (0b111110, 0b000001))
+
+
+def test_line_windows_five_cells():
+    windows = line_windows([1, 8, 15, 22, 29])
+    assert len(windows) == 1
+    assert windows[0][1] == 0
+
+
+def test_check_line_win():
+    windows = line_windows(list(range(6)))
+    board = BitBoard([1, 1, 1, 1, 1, 2])
+    assert check_line_win(board.circles, board.crosses, windows) is True
+
+
+def test_check_line_win_six_in_a_row():
+    windows = line_windows(list(range(6)))
+    board = BitBoard([1, 1, 1, 1, 1, 1])
+    assert check_line_win(board.circles, board.crosses, windows) is False
+
+
+def test_check_line_winnability_same_ends():
+    windows = line_windows(list(range(6)))
+    board = BitBoard([2, 0, 0, 0, 0, 2])
+    assert check_line_winnability(board.circles, board.crosses, windows) is False
+
+
+def test_check_line_winnability_mixed_middle():
+    windows = line_windows(list(range(6)))
+    board = BitBoard([0, 1, 0, 0, 2, 0])
+    assert check_line_winnability(board.circles, board.crosses, windows) is False
+
+
+def test_check_line_winnability_different_ends():
+    windows = line_windows(list(range(6)))
+    board = BitBoard([1, 0, 0, 0, 0, 2])
+    assert check_line_winnability(board.circles, board.crosses, windows) is True
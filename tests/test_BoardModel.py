@@ -0,0 +1,40 @@
+import subprocess
+import sys
+from BoardModel import BoardModel
+
+
+def test_import_does_not_load_pygame():
+    code = "import sys, BoardModel, GameBoard, Bot; print('pygame' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "False"
+
+
+def test_cell_box_matches_cell_index():
+    board = BoardModel()
+    assert board.cell_box(0) == (42, 42, 96, 96)
+    assert board.cell_box(7) == (42 + 108, 42 + 108, 96, 96)
+    for index in range(36):
+        x, y, width, height = board.cell_box(index)
+        assert board.calculate_cell_index((x + width // 2, y + height // 2)) == (True, index)
+
+
+def test_changes_reported():
+    class Board(BoardModel):
+        def __init__(self):
+            super().__init__()
+            self.changed = []
+
+        def _cell_changed(self, cell_index):
+            self.changed.append(cell_index)
+
+        def _board_changed(self):
+            self.changed.append("board")
+
+    board = Board()
+    board.set_up_board()
+    board.update(3, "cross")
+    board.update(3, "circle")
+    board.undo_move()
+    board.redo_move()
+    board.undo_moves([3])
+    assert board.changed == ["board", 3, 3, 3, 3]
@@ -1,11 +1,12 @@
+import time
 from Bot import Bot
-from GameBoard import GameBoard
+from BoardModel import BoardModel
 import pytest
 
 
 def test_bot_initialization():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     bot.load_board(board.board)
     assert bot._board == board.board
@@ -15,7 +16,7 @@ def test_bot_initialization():
 
 def test_set_difficulty_easy():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     bot.load_board(board.board)
     assert bot._dificulty == "hard"
@@ -25,7 +26,7 @@ def test_set_difficulty_easy():
 
 def test_set_difficulty_hard():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     bot.load_board(board.board)
     assert bot._dificulty == "hard"
@@ -37,7 +38,7 @@ def test_set_difficulty_hard():
 
 def test_set_difficulty_incorrect_difficulty():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     bot.load_board(board.board)
     with pytest.raises(ValueError):
@@ -46,7 +47,7 @@ def test_set_difficulty_incorrect_difficulty():
 
 def test_check_winning_no_winner():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     bot.load_board(board.board)
     result = bot.check_winning()
@@ -55,7 +56,7 @@ def test_check_winning_no_winner():
 
 def test_check_winning_order():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(5):
         board._board[i] = 1
@@ -66,7 +67,7 @@ def test_check_winning_order():
 
 def test_check_winning_chaos():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(36):
         if i % 2 == 0:
@@ -80,7 +81,7 @@ def test_check_winning_chaos():
 
 def test_make_move_order_easy_difficulty():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(35):
         board._board[i] = 1
@@ -93,7 +94,7 @@ def test_make_move_order_easy_difficulty():
 
 def test_make_move_chaos_easy_difficulty():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(35):
         board._board[i] = 1
@@ -107,7 +108,7 @@ def test_make_move_chaos_easy_difficulty():
 
 def test_make_move_order_hard_difficulty():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(4):
         board._board[i] = 1
@@ -121,7 +122,7 @@ def test_make_move_order_hard_difficulty():
 
 def test_make_move_chaos_hard_difficulty():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(4):
         board._board[i] = 1
@@ -135,7 +136,7 @@ def test_make_move_chaos_hard_difficulty():
 
 def test_get_board_values_array():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(4):
         board._board[i] = 1
@@ -146,7 +147,7 @@ def test_get_board_values_array():
 
 def test_get_board_values_array_index_out_of_range():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     bot.load_board(board.board)
     with pytest.raises(IndexError):
@@ -155,7 +156,7 @@ def test_get_board_values_array_index_out_of_range():
 
 def test_load_indexes_to_check():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     bot.load_board(board.board)
     bot._load_indexes_to_check()
@@ -184,7 +185,7 @@ def test_load_indexes_to_check():
 
 def test_find_arrays_closest_to_win_one_array():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(4):
         board._board[i] = 1
@@ -198,7 +199,7 @@ def test_find_arrays_closest_to_win_one_array():
 
 def test_find_arrays_closest_to_win_multiple_arrays():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(4):
         board._board[i] = 1
@@ -217,7 +218,7 @@ def test_find_arrays_closest_to_win_multiple_arrays():
 
 def test_pick_optimal_cell_chaos_block_row_case_1():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(4):
         board._board[i] = 1
@@ -230,7 +231,7 @@ def test_pick_optimal_cell_chaos_block_row_case_1():
 
 def test_pick_optimal_cell_chaos_block_row_case_2():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(4):
         board._board[i] = 2
@@ -243,7 +244,7 @@ def test_pick_optimal_cell_chaos_block_row_case_2():
 
 def test_pick_optimal_cell_chaos_block_row_case_3():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(12, 15):
         board._board[i] = 2
@@ -257,7 +258,7 @@ def test_pick_optimal_cell_chaos_block_row_case_3():
 
 def test_pick_optimal_cell_chaos_block_column_case_1():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(0, 19, 6):
         board._board[i] = 1
@@ -270,7 +271,7 @@ def test_pick_optimal_cell_chaos_block_column_case_1():
 
 def test_pick_optimal_cell_chaos_block_column_case_2():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(0, 19, 6):
         board._board[i] = 1
@@ -284,7 +285,7 @@ def test_pick_optimal_cell_chaos_block_column_case_2():
 
 def test_pick_optimal_cell_chaos_block_column_case_3():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     board._board[0] = 1
     board._board[5] = 1
@@ -297,7 +298,7 @@ def test_pick_optimal_cell_chaos_block_column_case_3():
 
 def test_pick_optimal_cell_chaos_block_diagonal_case_1():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(5, 21, 5):
         board._board[i] = 1
@@ -310,7 +311,7 @@ def test_pick_optimal_cell_chaos_block_diagonal_case_1():
 
 def test_pick_optimal_cell_chaos_block_diagonal_case_2():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(11, 30, 5):
         board._board[i] = 2
@@ -323,7 +324,7 @@ def test_pick_optimal_cell_chaos_block_diagonal_case_2():
 
 def test_pick_optimal_cell_chaos_block_diagonal_case_3():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(6, 33, 7):
         board._board[i] = 2
@@ -336,7 +337,7 @@ def test_pick_optimal_cell_chaos_block_diagonal_case_3():
 
 def test_pick_optimal_cell_order_row_case_1():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(4):
         board._board[i] = 1
@@ -350,7 +351,7 @@ def test_pick_optimal_cell_order_row_case_1():
 
 def test_pick_optimal_cell_order_row_case_2():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(4):
         board._board[i] = 2
@@ -364,7 +365,7 @@ def test_pick_optimal_cell_order_row_case_2():
 
 def test_pick_optimal_cell_order_row_case_3():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(12, 15):
         board._board[i] = 2
@@ -379,7 +380,7 @@ def test_pick_optimal_cell_order_row_case_3():
 
 def test_pick_optimal_cell_order_column_case_1():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(0, 19, 6):
         board._board[i] = 1
@@ -393,7 +394,7 @@ def test_pick_optimal_cell_order_column_case_1():
 
 def test_pick_optimal_cell_order_column_case_2():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(0, 19, 6):
         board._board[i] = 1
@@ -408,7 +409,7 @@ def test_pick_optimal_cell_order_column_case_2():
 
 def test_pick_optimal_cell_order_column_case_3():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     board._board[0] = 1
     board._board[5] = 1
@@ -422,7 +423,7 @@ def test_pick_optimal_cell_order_column_case_3():
 
 def test_pick_optimal_cell_order_diagonal_case_1():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(5, 21, 5):
         board._board[i] = 1
@@ -436,7 +437,7 @@ def test_pick_optimal_cell_order_diagonal_case_1():
 
 def test_pick_optimal_cell_order_diagonal_case_2():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(11, 30, 5):
         board._board[i] = 2
@@ -450,7 +451,7 @@ def test_pick_optimal_cell_order_diagonal_case_2():
 
 def test_pick_optimal_cell_order_diagonal_case_3():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(6, 33, 7):
         board._board[i] = 2
@@ -638,7 +639,7 @@ def test_check_array_winnability_case_10():
 
 def test_update_arrays_case_1():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(0, 5):
         board._board[i] = 2
@@ -649,7 +650,7 @@ def test_update_arrays_case_1():
 
 def test_update_arrays_case_2():
     bot = Bot()
-    board = GameBoard()
+    board = BoardModel()
     board.set_up_board()
     for i in range(36):
         if i % 2 == 0:
@@ -660,3 +661,301 @@ def test_update_arrays_case_2():
     result = bot._update_arrays()
     assert result is False
     assert len(bot._indexes_arrays) == 0
+
+
+def test_check_winning_last_move_order():
+    bot = Bot()
+    board = BoardModel()
+    board.set_up_board()
+    bot.load_board(board.board)
+    for i in range(5):
+        board.update(i * 7, 'cross')
+        result = bot.check_winning((i * 7, 'cross'))
+    assert result == "order"
+
+
+def test_check_winning_last_move_removes_unwinnable_arrays():
+    bot = Bot()
+    board = BoardModel()
+    board.set_up_board()
+    bot.load_board(board.board)
+    board.update(0, 'circle')
+    assert bot.check_winning((0, 'circle')) == ""
+    board.update(5, 'circle')
+    assert bot.check_winning((5, 'circle')) == ""
+    assert [0, 1, 2, 3, 4, 5] not in bot._indexes_arrays
+    assert len(bot._indexes_arrays) == 17
+
+
+def test_check_winning_last_move_same_as_full_check():
+    bot = Bot()
+    full_check_bot = Bot()
+    board = BoardModel()
+    board.set_up_board()
+    bot.load_board(board.board)
+    full_check_bot.load_board(board.board)
+    for index, symbol in [(14, 'cross'), (15, 'circle'), (20, 'cross'), (9, 'circle'), (21, 'cross')]:
+        board.update(index, symbol)
+        assert bot.check_winning((index, symbol)) == full_check_bot.check_winning()
+        assert bot._indexes_arrays == full_check_bot._indexes_arrays
+        assert bot._arrays_codes == full_check_bot._arrays_codes
+
+
+def test_cells_arrays():
+    bot = Bot()
+    bot._load_indexes_to_check()
+    assert len(bot._cells_arrays[0]) == 3
+    assert len(bot._cells_arrays[14]) == 4
+    assert (0, 1) in bot._cells_arrays[0]
+
+
+def test_undo_move_restores_arrays():
+    bot = Bot()
+    board = BoardModel()
+    board.set_up_board()
+    bot.load_board(board.board)
+    board.update(0, 'circle')
+    bot.check_winning((0, 'circle'))
+    codes = list(bot._arrays_codes)
+    indexes_arrays = list(bot._indexes_arrays)
+    board.update(5, 'circle')
+    bot.check_winning((5, 'circle'))
+    assert len(bot._indexes_arrays) == 17
+    assert bot.undo_move() == (5, 'circle')
+    assert bot._arrays_codes == codes
+    assert bot._indexes_arrays == indexes_arrays
+
+
+def test_undo_move_empty_stack():
+    bot = Bot()
+    board = BoardModel()
+    board.set_up_board()
+    bot.load_board(board.board)
+    with pytest.raises(IndexError):
+        bot.undo_move()
+
+
+def test_undo_move_same_as_full_check():
+    bot = Bot()
+    full_check_bot = Bot()
+    board = BoardModel()
+    board.set_up_board()
+    bot.load_board(board.board)
+    moves = [(14, 'cross'), (15, 'circle'), (20, 'cross'), (9, 'circle'), (21, 'cross'), (0, 'cross')]
+    for index, symbol in moves:
+        board.update(index, symbol)
+        bot.check_winning((index, symbol))
+    for _ in moves:
+        board.undo_move()
+        bot.undo_move()
+        full_check_bot.load_board(board.board)
+        full_check_bot.check_winning()
+        assert bot._indexes_arrays == full_check_bot._indexes_arrays
+        assert bot._arrays_codes == full_check_bot._arrays_codes
+
+
+def test_set_difficulty_expert():
+    bot = Bot()
+    bot.set_difficulty("expert")
+    assert bot._dificulty == "expert"
+    assert bot._search is not None
+
+
+def test_make_move_order_expert_difficulty():
+    bot = Bot()
+    board = BoardModel()
+    board.set_up_board()
+    for i in range(0, 24, 6):
+        board._board[i] = 2
+    bot.load_board(board.board)
+    bot.set_transposition_table_size(1)
+    bot.set_difficulty("expert")
+    result = bot.make_move("order")
+    assert result == (24, "cross")
+    # forcing win is found by threat-space search, alpha-beta search is not run
+    stats = bot.search_stats()
+    assert stats['engine'] == "threat_space"
+    assert stats['nodes'] == bot._threat_search.nodes > 0
+    assert stats['depth'] >= 1
+    assert bot._search.nodes == 0
+
+
+def test_make_move_chaos_expert_difficulty():
+    bot = Bot()
+    board = BoardModel()
+    board.set_up_board()
+    for i in range(0, 24, 6):
+        board._board[i] = 2
+    bot.load_board(board.board)
+    bot.set_transposition_table_size(1)
+    bot.set_difficulty("expert")
+    result = bot.make_move("chaos")
+    assert result in ((24, "circle"), (30, "cross"))
+
+
+def test_search_stats_no_search():
+    bot = Bot()
+    assert bot.search_stats() == {}
+
+
+def test_make_move_expert_difficulty_time_budget():
+    bot = Bot()
+    board = BoardModel()
+    board.set_up_board()
+    bot.load_board(board.board)
+    bot.set_transposition_table_size(1)
+    bot.set_difficulty("expert")
+    bot.set_search_limits(20)
+    start_time = time.perf_counter()
+    result = bot.make_move("order", 0.05)
+    assert time.perf_counter() - start_time < 0.5
+    assert board.board[result[0]] == 0
+
+
+def test_set_difficulty_mcts():
+    bot = Bot()
+    bot.set_difficulty("mcts")
+    assert bot._dificulty == "mcts"
+    assert bot._monte_carlo is not None
+
+
+def test_make_move_order_mcts_difficulty():
+    bot = Bot()
+    board = BoardModel()
+    board.set_up_board()
+    for i in range(0, 24, 6):
+        board._board[i] = 2
+    bot.load_board(board.board)
+    bot.set_difficulty("mcts")
+    bot.set_search_limits(6, None)
+    result = bot.make_move("order")
+    assert result == (24, "cross")
+    assert bot.search_stats()['playouts'] == 2000
+
+
+def test_set_search_threads():
+    bot = Bot()
+    bot.set_transposition_table_size(1)
+    bot.set_difficulty("expert")
+    bot.set_search_threads(2)
+    assert bot._search.threads == 2
+    board = BoardModel()
+    board.set_up_board()
+    for i in range(0, 24, 6):
+        board._board[i] = 2
+    bot.load_board(board.board)
+    bot.set_search_limits(3)
+    assert bot.make_move("order") == (24, "cross")
+    bot.set_search_threads(1)
+    assert bot.search_stats() == {'nodes': 0, 'depth': 0, 'time': 0.0, 'nodes_per_second': 0.0,
+                                  'table_hit_rate': 0.0, 'table_size_megabytes': 1.0}
+
+
+def test_pondering_expert():
+    bot = Bot()
+    board = BoardModel()
+    board.set_up_board()
+    bot.load_board(board.board)
+    bot.set_transposition_table_size(1)
+    bot.set_difficulty("expert")
+    bot.set_search_limits(2)
+    bot.start_pondering("chaos")
+    assert bot._ponderer.is_running()
+    board.update(14, "circle")
+    bot.check_winning((14, "circle"))
+    result = bot.make_move("chaos")
+    assert not bot._ponderer.is_running()
+    assert board.board[result[0]] == 0
+
+
+def test_pondering_stopped_on_undo():
+    bot = Bot()
+    board = BoardModel()
+    board.set_up_board()
+    bot.load_board(board.board)
+    bot.set_difficulty("expert")
+    board.update(14, "circle")
+    bot.check_winning((14, "circle"))
+    bot.start_pondering("order")
+    board.undo_move()
+    bot.undo_move()
+    assert not bot._ponderer.is_running()
+
+
+def test_pondering_not_expert():
+    bot = Bot()
+    bot.start_pondering("order")
+    assert bot._ponderer is None
+
+
+def test_clear_search_cache():
+    bot = Bot()
+    board = BoardModel()
+    board.set_up_board()
+    bot.load_board(board.board)
+    bot.clear_search_cache()
+    bot.set_transposition_table_size(1)
+    bot.set_search_limits(2, None)
+    bot.set_difficulty("expert")
+    bot.make_move("order")
+    assert bot._search.root_cache
+    root_cache = bot._search.root_cache
+    bot.clear_search_cache()
+    assert bot._search.root_cache is root_cache
+    assert not root_cache
+
+
+def test_pondering_keeps_search_stats():
+    bot = Bot()
+    board = BoardModel()
+    board.set_up_board()
+    bot.load_board(board.board)
+    bot.set_transposition_table_size(1)
+    bot.set_difficulty("expert")
+    bot.set_search_limits(3, None)
+    move = bot.make_move("chaos")
+    board.update(*move)
+    bot.check_winning(move)
+    stats = bot.search_stats()
+    assert stats['nodes'] > 0
+    bot.start_pondering("chaos")
+    bot._ponderer.thread.join(10)
+    assert bot._ponderer.searched_replies > 0
+    assert bot.search_stats() == stats
+
+
+def test_pondered_reply_reused_with_threads():
+    bot = Bot()
+    board = BoardModel()
+    board.set_up_board()
+    bot.load_board(board.board)
+    bot.set_transposition_table_size(1)
+    bot.set_difficulty("expert")
+    bot.set_search_threads(2)
+    bot.set_search_limits(2, None)
+    board.update(14, "circle")
+    bot.check_winning((14, "circle"))
+    bot.start_pondering("chaos")
+    bot._ponderer.thread.join(10)
+    assert bot._ponderer.reached_depth == 2
+    # order replied on a cell next to its circle, chaos answer is already known
+    board.update(15, "circle")
+    bot.check_winning((15, "circle"))
+    bot.make_move("chaos")
+    assert bot.search_stats()['nodes'] == 0
+    bot.set_search_threads(1)
+
+
+def test_search_stats_alpha_beta_engine():
+    bot = Bot()
+    board = BoardModel()
+    board.set_up_board()
+    bot.load_board(board.board)
+    bot.set_transposition_table_size(1)
+    bot.set_difficulty("expert")
+    bot.set_search_limits(2, None)
+    bot.make_move("order")
+    stats = bot.search_stats()
+    assert stats['engine'] == "alpha_beta"
+    assert stats['nodes'] > 0
+    assert stats['threat_nodes'] > 0
@@ -0,0 +1,117 @@
+import time
+from Bot import Bot
+from BotWorker import BotWorker
+from BoardModel import BoardModel
+
+
+def prepare_bot(difficulty: str) -> tuple[Bot, BoardModel]:
+    bot = Bot()
+    board = BoardModel()
+    board.set_up_board()
+    bot.load_board(board.board)
+    bot.set_transposition_table_size(1)
+    bot.set_difficulty(difficulty)
+    return bot, board
+
+
+def test_request_and_poll():
+    bot, board = prepare_bot("hard")
+    worker = BotWorker(bot)
+    worker.request_move("order")
+    assert worker.is_thinking()
+    move = None
+    for _ in range(100):
+        move = worker.poll()
+        if move is not None:
+            break
+        time.sleep(0.01)
+    assert board.board[move[0]] == 0
+    assert not worker.is_thinking()
+    assert worker.poll() is None
+    worker.close()
+
+
+def test_poll_not_ready():
+    bot, _ = prepare_bot("expert")
+    bot.set_search_limits(20)
+    worker = BotWorker(bot)
+    worker.request_move("order", 5)
+    assert worker.poll() is None
+    worker.close()
+
+
+def test_cancel_stops_search():
+    bot, board = prepare_bot("expert")
+    bot.set_search_limits(20)
+    worker = BotWorker(bot)
+    worker.request_move("order", 5)
+    time.sleep(0.05)
+    start_time = time.perf_counter()
+    worker.cancel()
+    assert time.perf_counter() - start_time < 0.5
+    assert not worker.is_thinking()
+    assert not bot._cancel_event.is_set()
+    # next move is not affected by the cancel
+    board.update(0, "circle")
+    bot.check_winning((0, "circle"))
+    worker.request_move("chaos", 0.05)
+    worker.future.result()
+    assert bot.search_stats()['depth'] > 0
+    worker.close()
+
+
+def test_close_without_request():
+    bot, _ = prepare_bot("easy")
+    worker = BotWorker(bot)
+    worker.cancel()
+    worker.close()
+
+
+def test_cancel_finished_move():
+    bot, _ = prepare_bot("hard")
+    worker = BotWorker(bot)
+    worker.request_move("order")
+    worker.future.result()
+    worker.cancel()
+    assert not bot._cancel_event.is_set()
+    worker.close()
+
+
+def test_cancel_move_without_running_move():
+    bot, _ = prepare_bot("expert")
+    bot.cancel_move()
+    assert not bot._cancel_event.is_set()
+    bot.make_move("order", 0.05)
+    assert bot.search_stats()['depth'] > 0
+
+
+def test_cancel_before_search_starts(monkeypatch):
+    bot, _ = prepare_bot("expert")
+    bot.set_search_limits(20)
+    stop_pondering = bot.stop_pondering
+
+    def slow_stop_pondering():
+        time.sleep(0.1)  # move has started, its search has not
+        stop_pondering()
+
+    monkeypatch.setattr(bot, "stop_pondering", slow_stop_pondering)
+    worker = BotWorker(bot)
+    worker.request_move("order", 5)
+    time.sleep(0.02)
+    start_time = time.perf_counter()
+    worker.cancel()
+    assert time.perf_counter() - start_time < 0.5
+    assert not bot._cancel_event.is_set()
+    worker.close()
+
+
+def test_cancel_stops_mcts():
+    bot, _ = prepare_bot("mcts")
+    worker = BotWorker(bot)
+    worker.request_move("order", 5)
+    time.sleep(0.05)
+    start_time = time.perf_counter()
+    worker.cancel()
+    assert time.perf_counter() - start_time < 0.5
+    assert not bot._cancel_event.is_set()
+    worker.close()
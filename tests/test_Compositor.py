@@ -0,0 +1,54 @@
+import pygame
+from Compositor import Compositor
+
+
+def test_layer_reused_for_same_inputs():
+    compositor = Compositor()
+    draws = []
+
+    def draw(surface):
+        draws.append(surface)
+        surface.fill((10, 20, 30))
+
+    first = compositor.layer("background", (1,), (20, 10), draw)
+    second = compositor.layer("background", (1,), (20, 10), draw)
+    assert first is second
+    assert len(draws) == 1
+    assert compositor.builds == 1
+    assert compositor.reuses == 1
+    assert first.get_size() == (20, 10)
+    assert first.get_at((5, 5))[:3] == (10, 20, 30)
+
+
+def test_layer_redrawn_for_changed_inputs():
+    compositor = Compositor()
+    colors = {1: (255, 0, 0), 2: (0, 0, 255)}
+    state = [1]
+
+    def draw(surface):
+        surface.fill(colors[state[0]])
+
+    first = compositor.layer("background", (state[0],), (4, 4), draw)
+    state[0] = 2
+    second = compositor.layer("background", (state[0],), (4, 4), draw)
+    assert first is not second
+    assert second.get_at((0, 0))[:3] == (0, 0, 255)
+    assert compositor.builds == 2
+
+
+def test_alpha_layer_transparent():
+    compositor = Compositor()
+    layer = compositor.layer("overlay", (), (4, 4), lambda surface: None, True)
+    assert layer.get_flags() & pygame.SRCALPHA
+    assert layer.get_at((0, 0)).a == 0
+
+
+def test_invalidate():
+    compositor = Compositor()
+    compositor.layer("a", (), (2, 2), lambda surface: None)
+    compositor.layer("b", (), (2, 2), lambda surface: None)
+    compositor.invalidate("a")
+    assert "a" not in compositor.layers
+    assert "b" in compositor.layers
+    compositor.invalidate()
+    assert compositor.layers == {}
@@ -0,0 +1,41 @@
+import pygame
+from DirtyRegions import DirtyRegions
+
+
+def test_mark_and_clear():
+    regions = DirtyRegions((100, 100))
+    assert not regions.is_dirty()
+    regions.mark((10, 10, 5, 5))
+    assert regions.is_dirty()
+    assert regions.rects() == [pygame.Rect(10, 10, 5, 5)]
+    regions.clear()
+    assert not regions.is_dirty()
+    assert regions.rects() == []
+
+
+def test_mark_merges_overlapping():
+    regions = DirtyRegions((100, 100))
+    regions.mark((0, 0, 10, 10))
+    regions.mark((50, 50, 10, 10))
+    regions.mark((5, 5, 10, 10))
+    assert sorted(regions.rects()) == [pygame.Rect(0, 0, 15, 15), pygame.Rect(50, 50, 10, 10)]
+    # bridge between both rectangles merges them
+    regions.mark((10, 10, 45, 45))
+    assert regions.rects() == [pygame.Rect(0, 0, 60, 60)]
+
+
+def test_mark_clipped_to_screen():
+    regions = DirtyRegions((100, 100))
+    regions.mark((90, 90, 50, 50))
+    regions.mark((200, 200, 5, 5))
+    assert regions.rects() == [pygame.Rect(90, 90, 10, 10)]
+
+
+def test_mark_all():
+    regions = DirtyRegions((100, 100))
+    regions.mark((0, 0, 10, 10))
+    regions.mark_all()
+    regions.mark((50, 50, 10, 10))
+    assert regions.rects() == [pygame.Rect(0, 0, 100, 100)]
+    regions.clear()
+    assert not regions.full
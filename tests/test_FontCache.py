@@ -0,0 +1,48 @@
+import pygame
+from FontCache import FontCache
+
+
+def setup_module():
+    pygame.font.init()
+
+
+def test_font_loaded_once():
+    cache = FontCache()
+    font = cache.font(None, 20)
+    assert cache.font(None, 20) is font
+    assert cache.font(None, 21) is not font
+    assert len(cache.fonts) == 2
+
+
+def test_render_cached():
+    cache = FontCache()
+    first = cache.render(None, 20, "ORDER", 'black')
+    second = cache.render(None, 20, "ORDER", (0, 0, 0))
+    assert first is second
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.render(None, 20, "ORDER", 'red') is not first
+    assert cache.render(None, 22, "ORDER", 'black') is not first
+    assert cache.misses == 3
+
+
+def test_render_least_recently_used_dropped():
+    cache = FontCache(max_size=2)
+    first = cache.render(None, 20, "a")
+    cache.render(None, 20, "b")
+    assert cache.render(None, 20, "a") is first
+    cache.render(None, 20, "c")
+    assert len(cache) == 2
+    # "b" was used least recently
+    assert cache.render(None, 20, "a") is first
+    misses = cache.misses
+    cache.render(None, 20, "b")
+    assert cache.misses == misses + 1
+
+
+def test_clear():
+    cache = FontCache()
+    cache.render(None, 20, "a")
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.fonts == {}
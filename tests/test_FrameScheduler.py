@@ -0,0 +1,74 @@
+from FrameScheduler import FrameScheduler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+def test_advance_fixed_steps():
+    clock = FakeClock()
+    scheduler = FrameScheduler(60, 50, clock=clock)
+    clock.time = 0.05
+    assert scheduler.advance() == 2
+    clock.time = 0.055
+    assert scheduler.advance() == 0
+    clock.time = 0.07
+    assert scheduler.advance() == 1
+
+
+def test_advance_drops_long_frames():
+    clock = FakeClock()
+    scheduler = FrameScheduler(60, 60, max_updates=5, clock=clock)
+    clock.time = 10.0
+    assert scheduler.advance() == 5
+    clock.time = 10.001
+    assert scheduler.advance() == 0
+
+
+def test_reset_one_update_due():
+    clock = FakeClock()
+    scheduler = FrameScheduler(clock=clock)
+    clock.time = 100.0
+    scheduler.reset()
+    assert scheduler.advance() == 1
+    assert scheduler.advance() == 0
+
+
+def test_render_cap():
+    clock = FakeClock()
+    scheduler = FrameScheduler(10, clock=clock)
+    assert scheduler.should_render()
+    clock.time = 0.05
+    assert not scheduler.should_render()
+    scheduler.advance()
+    assert 0 < scheduler.time_to_next_frame() <= 0.05
+    clock.time = 0.1
+    assert scheduler.should_render()
+    # long frame - next frame is not rendered at once to catch up
+    clock.time = 1.0
+    assert scheduler.should_render()
+    clock.time = 1.01
+    assert not scheduler.should_render()
+
+
+def test_no_cap():
+    clock = FakeClock()
+    scheduler = FrameScheduler(None, clock=clock)
+    assert scheduler.fps_cap is None
+    assert scheduler.should_render()
+    assert scheduler.should_render()
+    scheduler.set_fps_cap(30)
+    assert scheduler.fps_cap == 30
+
+
+def test_time_to_next_frame():
+    clock = FakeClock()
+    scheduler = FrameScheduler(20, 50, clock=clock)
+    scheduler.should_render()
+    assert abs(scheduler.time_to_next_frame() - 0.02) < 1e-9
+    clock.time = 0.5
+    assert scheduler.time_to_next_frame() == 0.0
@@ -1,4 +1,6 @@
-from GUI import Button
+import pygame
+from DirtyRegions import DirtyRegions
+from GUI import Button, Text
 
 
 def test_button_check_if_clicked_contains():
@@ -11,3 +13,39 @@ def test_button_check_if_clicked_does_not_contain():
     button = Button()
     position = (100, 10)
     assert button.check_if_clicked(position) is False
+
+
+def test_button_is_pressed():
+    button = Button()
+    assert button.is_pressed() is False
+    button.on_click()
+    assert button.is_pressed() is True
+    button.reset_pressing(0.2)
+    assert button.is_pressed() is True
+    button.reset_pressing(0.4)
+    assert button.is_pressed() is False
+
+
+def test_button_marks_dirty_regions():
+    regions = DirtyRegions((960, 720))
+    button = Button((32, 32), (10, 10))
+    button.set_dirty_regions(regions)
+    regions.clear()
+    button.update_colors(("white", "black"))
+    assert not regions.is_dirty()
+    button.on_click()
+    assert regions.rects() == [button.rect()]
+    regions.clear()
+    button.update_position((100, 100))
+    assert sorted(regions.rects()) == [pygame.Rect(10, 10, 32, 32), pygame.Rect(100, 100, 32, 32)]
+
+
+def test_text_shares_rendered_text():
+    pygame.font.init()
+    first = Text(30)
+    second = Text(30)
+    first.set_text("CHAOS")
+    second.set_text("CHAOS")
+    second.set_text_position((100, 0))
+    assert first.rect().size == second.rect().size
+    assert first.rect().topleft == (0, 0)
@@ -1,4 +1,6 @@
 import pytest
+import pygame
+from DirtyRegions import DirtyRegions
 from GameBoard import GameBoard
 
 
@@ -125,3 +127,100 @@ def test_undo_moves_index_out_of_range():
     board.set_up_board()
     with pytest.raises(IndexError):
         board.undo_moves([60])
+
+
+def test_update_adds_move_to_history():
+    board = GameBoard()
+    board.set_up_board()
+    board.update(2, 'cross')
+    board.update(7, 'circle')
+    assert board.moves == [(2, 'cross'), (7, 'circle')]
+
+
+def test_undo_move_typical():
+    board = GameBoard()
+    board.set_up_board()
+    board.update(2, 'cross')
+    board.update(7, 'circle')
+    assert board.undo_move() == (7, 'circle')
+    assert board.board[7] == 0
+    assert board.moves == [(2, 'cross')]
+    assert board.undone_moves == [(7, 'circle')]
+
+
+def test_undo_move_no_moves():
+    board = GameBoard()
+    board.set_up_board()
+    with pytest.raises(IndexError):
+        board.undo_move()
+
+
+def test_redo_move_typical():
+    board = GameBoard()
+    board.set_up_board()
+    board.update(2, 'cross')
+    board.undo_move()
+    assert board.redo_move() == (2, 'cross')
+    assert board.board[2] == 2
+    assert board.undone_moves == []
+
+
+def test_update_clears_undone_moves():
+    board = GameBoard()
+    board.set_up_board()
+    board.update(2, 'cross')
+    board.undo_move()
+    board.update(3, 'cross')
+    assert board.undone_moves == []
+    with pytest.raises(IndexError):
+        board.redo_move()
+
+
+def test_go_to_move_typical():
+    board = GameBoard()
+    board.set_up_board()
+    for index in range(6):
+        board.update(index, 'circle')
+    undone, redone = board.go_to_move(2)
+    assert undone == [(5, 'circle'), (4, 'circle'), (3, 'circle'), (2, 'circle')]
+    assert redone == []
+    assert board.board[:6] == [1, 1, 0, 0, 0, 0]
+    undone, redone = board.go_to_move(5)
+    assert undone == []
+    assert redone == [(2, 'circle'), (3, 'circle'), (4, 'circle')]
+    assert board.board[:6] == [1, 1, 1, 1, 1, 0]
+
+
+def test_go_to_move_out_of_history():
+    board = GameBoard()
+    board.set_up_board()
+    board.update(2, 'cross')
+    with pytest.raises(IndexError):
+        board.go_to_move(2)
+    with pytest.raises(IndexError):
+        board.go_to_move(-1)
+
+
+def test_board_marks_dirty_regions():
+    regions = DirtyRegions((960, 720))
+    board = GameBoard()
+    board.set_up_board()
+    board.set_dirty_regions(regions)
+    assert regions.rects() == [board.board_rect()]
+    regions.clear()
+    board.update(7, "cross")
+    assert regions.rects() == [board.cell_rect(7)]
+    regions.clear()
+    board.update(7, "circle")  # not empty - nothing changes
+    assert not regions.is_dirty()
+    board.undo_move()
+    board.redo_move()
+    assert regions.rects() == [board.cell_rect(7)]
+
+
+def test_cell_rect():
+    board = GameBoard()
+    assert board.cell_rect(0) == pygame.Rect(42, 42, 96, 96)
+    assert board.cell_rect(7) == pygame.Rect(42 + 108, 42 + 108, 96, 96)
+    assert board.board_rect() == pygame.Rect(42, 42, 636, 636)
+    assert board.calculate_cell_index(board.cell_rect(20).center) == (True, 20)
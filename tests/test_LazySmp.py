@@ -0,0 +1,84 @@
+import time
+import pytest
+from AlphaBeta import WIN_THRESHOLD
+from LazySmp import LazySmpSearch
+
+
+def test_search_order_finds_win():
+    search = LazySmpSearch(3, 1)
+    values = [0] * 36
+    for index in range(4):
+        values[index] = 1
+    try:
+        assert search.search(values, True, 3) == (4, 1)
+        assert search.best_value > WIN_THRESHOLD
+    finally:
+        search.close()
+
+
+def test_search_completes_depth():
+    values = [0] * 36
+    values[14] = 1
+    values[21] = 2
+    search = LazySmpSearch(2, 1)
+    try:
+        move = search.search(values, False, 3)
+    finally:
+        search.close()
+    assert values[move[0]] == 0
+    assert search.completed_depth == 3
+
+
+def test_helpers_share_table():
+    search = LazySmpSearch(3, 1)
+    assert all(helper.table is search.table for helper in search.helpers)
+    assert search.main_search.table is search.table
+    try:
+        search.search([0] * 36, True, 3)
+    finally:
+        search.close()
+    stats = search.stats()
+    assert stats['threads'] == 3
+    assert stats['nodes'] >= search.main_search.nodes
+
+
+def test_search_deadline_stops_helpers():
+    search = LazySmpSearch(2, 1)
+    try:
+        start_time = time.perf_counter()
+        move = search.search([0] * 36, True, 20, time.perf_counter() + 0.05)
+        assert time.perf_counter() - start_time < 0.5
+    finally:
+        search.close()
+    assert move is not None
+
+
+def test_search_no_moves():
+    search = LazySmpSearch(2, 1)
+    values = [1 if index % 2 == 0 else 2 for index in range(36)]
+    try:
+        with pytest.raises(ValueError):
+            search.search(values, True, 2)
+    finally:
+        search.close()
+
+
+def test_single_thread_has_no_helpers():
+    search = LazySmpSearch(1, 1)
+    assert search.helpers == []
+    assert search.executor is None
+    assert search.search([0] * 36, True, 1) is not None
+
+
+def test_search_reuses_root_cache():
+    values = [0] * 36
+    values[14] = 1
+    search = LazySmpSearch(2, 1)
+    try:
+        first_move = search.search(values, False, 3)
+        assert search.nodes > 0
+        assert search.search(values, False, 3) == first_move
+        assert search.nodes == 0
+        assert search.completed_depth == 3
+    finally:
+        search.close()
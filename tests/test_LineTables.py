@@ -0,0 +1,62 @@
+from LineTables import LINE_TABLES, encode_array, decode_code, codes_lookup, line_key, line_lookups
+from BitBoard import BitBoard
+
+
+def test_encode_array():
+    assert encode_array([0, 0, 0, 0, 0, 0]) == 0
+    assert encode_array([1, 0, 0, 0, 0, 0]) == 1
+    assert encode_array([0, 2, 0, 0, 0]) == 6
+    assert encode_array([2, 2, 2, 2, 2, 2]) == 728
+
+
+def test_decode_code():
+    for code in range(243):
+        assert encode_array(decode_code(code, 5)) == code
+
+
+def test_line_tables_sizes():
+    assert len(LINE_TABLES[6].win) == 729
+    assert len(LINE_TABLES[5].winnability) == 243
+
+
+def test_line_table_win():
+    table = LINE_TABLES[6]
+    assert table.win[encode_array([2, 2, 2, 2, 2, 0])] is True
+    assert table.win[encode_array([1, 1, 1, 1, 1, 1])] is False
+    assert LINE_TABLES[5].win[encode_array([1, 1, 1, 1, 1])] is True
+
+
+def test_line_table_winnability():
+    table = LINE_TABLES[6]
+    assert table.winnability[encode_array([1, 0, 0, 0, 0, 1])] is False
+    assert table.winnability[encode_array([1, 2, 0, 0, 0, 2])] is True
+    assert LINE_TABLES[5].winnability[encode_array([1, 0, 2, 0, 0])] is False
+
+
+def test_line_table_closest():
+    table = LINE_TABLES[6]
+    assert table.closest[encode_array([1, 1, 2, 0, 0, 0])] == ('circle', 2)
+    assert table.closest[encode_array([1, 2, 0, 0, 0, 0])] == ('cross', 1)
+
+
+def test_line_table_chaos_reply():
+    table = LINE_TABLES[6]
+    assert table.chaos_reply[encode_array([1, 1, 1, 1, 0, 0])] == (4, 'cross')
+    assert table.chaos_reply[encode_array([1, 0, 0, 0, 0, 1])] == (1, 'cross')
+    assert table.chaos_reply[encode_array([1, 0, 0, 0, 0, 2])] is None
+
+
+def test_line_table_order_reply():
+    table = LINE_TABLES[6]
+    assert table.order_reply[encode_array([1, 1, 1, 1, 0, 0])] == ((4,), 'circle')
+    assert table.order_reply[encode_array([0, 2, 2, 2, 2, 0])] == ((0, 5), 'cross')
+
+
+def test_codes_lookup():
+    indexes_array = [1, 8, 15, 22, 29]
+    lookup = codes_lookup(indexes_array)
+    board = BitBoard([0] * 36)
+    board.place(8, 1)
+    board.place(29, 2)
+    code = lookup[line_key(board.circles, board.crosses, line_lookups(tuple(indexes_array))[0])]
+    assert code == encode_array([0, 1, 0, 0, 2])
@@ -0,0 +1,122 @@
+import random
+import threading
+import time
+import pytest
+import MonteCarlo
+from MonteCarlo import MonteCarloTreeSearch, run_playouts, random_playout
+from SearchPosition import SearchPosition, ORDER_WON, CHAOS_WON
+
+
+def test_random_playout_restores_position():
+    position = SearchPosition()
+    position.play(14, 1)
+    cells = list(position.cells)
+    codes = list(position.codes)
+    rng = random.Random(0)
+    for _ in range(50):
+        assert random_playout(position, rng) in (ORDER_WON, CHAOS_WON)
+    assert position.cells == cells
+    assert position.codes == codes
+    assert position.moves == [(14, 1)]
+
+
+def test_run_playouts_visits():
+    moves_stats, done = run_playouts([0] * 36, True, 200, seed=1)
+    assert done == 200
+    assert sum(visits for visits, _ in moves_stats.values()) == 200
+    assert all(wins <= visits for visits, wins in moves_stats.values())
+
+
+def test_run_playouts_seed():
+    assert run_playouts([0] * 36, True, 100, seed=5) == run_playouts([0] * 36, True, 100, seed=5)
+
+
+def test_search_order_finds_win():
+    search = MonteCarloTreeSearch()
+    values = [0] * 36
+    for index in range(4):
+        values[index] = 1
+    assert search.search(values, True, 2000) == (4, 1)
+
+
+def test_search_chaos_blocks_win():
+    search = MonteCarloTreeSearch()
+    values = [0] * 36
+    for index in range(4):
+        values[index] = 1
+    # cross on 4 or circle on 5 (six in a row does not win) both block the row
+    assert search.search(values, False, 3000) in ((4, 2), (5, 1))
+
+
+def test_search_no_limits():
+    search = MonteCarloTreeSearch()
+    with pytest.raises(ValueError):
+        search.search([0] * 36, True)
+
+
+def test_search_time_budget():
+    search = MonteCarloTreeSearch()
+    search.search([0] * 36, True, time_budget=0.05)
+    stats = search.stats()
+    assert stats['playouts'] > 0
+    assert stats['time'] < 0.5
+    assert stats['playouts_per_second'] > 0
+
+
+def test_search_workers_merge_visits():
+    search = MonteCarloTreeSearch(2)
+    try:
+        move = search.search([0] * 36, True, 100)
+    finally:
+        search.close()
+    assert search.playouts == 200
+    assert sum(visits for visits, _ in search.root_stats.values()) == 200
+    assert move in search.root_stats
+    assert search.executor is None
+
+
+def test_run_playouts_passed_deadline():
+    moves_stats, done = run_playouts([0] * 36, True, deadline=time.perf_counter() - 1.0, seed=1)
+    assert done == 1
+    assert sum(visits for visits, _ in moves_stats.values()) == 1
+
+
+def test_search_workers_time_budget_includes_start():
+    search = MonteCarloTreeSearch(2)
+    try:
+        search.search([0] * 36, True, time_budget=0.1)  # first search starts the pool
+    finally:
+        search.close()
+    assert search.playouts >= 2
+    # bound left for slow process start, the deadline itself is checked below
+    assert search.search_time < 2 * 0.1 + 0.5
+
+
+def test_search_deadline_set_before_workers(monkeypatch):
+    deadlines = []
+
+    def fake_run_playouts(values, order_to_move, playouts, deadline, seed, stop_event=None):
+        deadlines.append(deadline)
+        return {(0, 1): (1, 1.0)}, 1
+
+    monkeypatch.setattr(MonteCarlo, "run_playouts", fake_run_playouts)
+    search = MonteCarloTreeSearch()
+    before = time.perf_counter()
+    search.search([0] * 36, True, time_budget=0.1)
+    after = time.perf_counter()
+    assert before + 0.1 <= deadlines[0] <= after + 0.1
+
+
+def test_search_workers_stop_event():
+    search = MonteCarloTreeSearch(2)
+    search.stop_event = threading.Event()
+    timer = threading.Timer(0.2, search.stop_event.set)
+    try:
+        timer.start()
+        start_time = time.perf_counter()
+        search.search([0] * 36, True, time_budget=20)
+        assert time.perf_counter() - start_time < 5
+        assert search.playouts >= 2
+    finally:
+        timer.cancel()
+        search.close()
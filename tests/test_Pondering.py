@@ -0,0 +1,56 @@
+import time
+from AlphaBeta import AlphaBetaSearch
+from Pondering import Ponderer
+from Symmetry import canonical_hash
+
+
+def test_ponder_fills_root_cache():
+    bot_search = AlphaBetaSearch(1)
+    ponderer = Ponderer(bot_search, 2)
+    values = [0] * 36
+    values[14] = 1
+    ponderer.start(values, False)
+    ponderer.thread.join(10)
+    assert not ponderer.is_running()
+    assert ponderer.reached_depth == 2
+    assert ponderer.searched_replies > 0
+    # order replied on a cell next to its circle, chaos answer is already known
+    values[15] = 1
+    assert (canonical_hash(values)[0], False) in bot_search.root_cache
+    bot_search.search(values, False, 2)
+    assert bot_search.nodes == 0
+
+
+def test_ponder_stop():
+    bot_search = AlphaBetaSearch(1)
+    ponderer = Ponderer(bot_search, 20)
+    ponderer.start([0] * 36, True)
+    time.sleep(0.05)
+    start_time = time.perf_counter()
+    ponderer.stop()
+    assert time.perf_counter() - start_time < 0.2
+    assert not ponderer.is_running()
+    assert ponderer.thread is None
+
+
+def test_ponder_restart():
+    bot_search = AlphaBetaSearch(1)
+    ponderer = Ponderer(bot_search, 20)
+    ponderer.start([0] * 36, True)
+    values = [0] * 36
+    values[0] = 2
+    ponderer.start(values, True)
+    assert ponderer.is_running()
+    ponderer.stop()
+
+
+def test_ponder_advances_table_age_once():
+    bot_search = AlphaBetaSearch(1)
+    ponderer = Ponderer(bot_search, 2)
+    age = bot_search.table.age
+    values = [0] * 36
+    values[14] = 1
+    ponderer.start(values, False)
+    ponderer.thread.join(10)
+    assert ponderer.searched_replies > 1
+    assert bot_search.table.age == (age + 1) & 0xFF
@@ -0,0 +1,73 @@
+from SearchPosition import SearchPosition, ORDER_WON, CHAOS_WON, NO_WINNER, zobrist_hash
+
+
+def test_search_position_initialization():
+    position = SearchPosition()
+    assert position.empty_cells == 36
+    assert position.winnable_arrays == 18
+    assert position.hash == 0
+
+
+def test_play_and_undo_restore_position():
+    position = SearchPosition()
+    codes = list(position.codes)
+    score = position.score
+    position.play(14, 1)
+    position.play(15, 2)
+    assert position.hash == zobrist_hash(position.cells)
+    position.undo()
+    position.undo()
+    assert position.codes == codes
+    assert position.score == score
+    assert position.hash == 0
+    assert position.empty_cells == 36
+
+
+def test_play_order_won():
+    position = SearchPosition()
+    for index in range(4):
+        assert position.play(index, 2) == NO_WINNER
+    assert position.play(4, 2) == ORDER_WON
+
+
+def test_play_chaos_won():
+    values = [1 if index % 2 == 0 else 2 for index in range(36)]
+    values[35] = 0
+    position = SearchPosition(values)
+    assert position.play(35, 2) == CHAOS_WON
+
+
+def test_winner():
+    values = [0] * 36
+    for index in range(0, 30, 6):
+        values[index] = 1
+    assert SearchPosition(values).winner() == ORDER_WON
+    assert SearchPosition().winner() == NO_WINNER
+
+
+def test_generate_moves_empty_board():
+    moves = SearchPosition().generate_moves()
+    assert len(moves) == 72
+    assert (0, 1) in moves and (0, 2) in moves
+
+
+def test_generate_moves_single_pass_move():
+    values = [0] * 36
+    # first row and first column are not winnable anymore, cell 0 lies only on them and main diagonal
+    values[1] = 1
+    values[4] = 2
+    values[6] = 1
+    values[24] = 2
+    values[7] = 1
+    values[28] = 2
+    moves = SearchPosition(values).generate_moves()
+    assert (0, 1) in moves
+    assert (0, 2) not in moves
+
+
+def test_move_score_change():
+    position = SearchPosition()
+    change = position.move_score_change(14, 1)
+    score = position.score
+    position.play(14, 1)
+    assert position.score - score == change
@@ -0,0 +1,66 @@
+import io
+import json
+import pytest
+from BoardModel import BoardModel
+from Bot import Bot
+from Simulation import IllegalMoveException, play_game, run_simulation, simulation_games
+
+
+def test_play_game_result():
+    result = play_game("hard", "easy", 5)
+    assert result["winner"] in ("order", "chaos")
+    assert result["plies"] == len(result["moves"])
+    assert 5 <= result["plies"] <= 36
+    assert len({cell for cell, _ in result["moves"]}) == result["plies"]
+    # replayed moves give the same winner
+    board = BoardModel()
+    board.set_up_board()
+    bot = Bot()
+    bot.load_board(board.board)
+    winner = ""
+    for cell, value in result["moves"]:
+        assert not winner
+        move = (cell, "circle" if value == 1 else "cross")
+        board.update(*move)
+        winner = bot.check_winning(move)
+    assert winner == result["winner"]
+
+
+def test_play_game_reproducible():
+    first = play_game("easy", "easy", 11)
+    second = play_game("easy", "easy", 11)
+    assert first["moves"] == second["moves"]
+
+
+def test_simulation_games_cover_difficulty_pairs():
+    games = simulation_games(8, ("easy", "hard"), seed=3)
+    assert {(order, chaos) for _, order, chaos, _ in games} == {
+        ("easy", "easy"), ("easy", "hard"), ("hard", "easy"), ("hard", "hard")}
+    assert [number for number, _, _, _ in games] == list(range(8))
+    assert simulation_games(8, ("easy", "hard"), seed=3) == games
+
+
+def test_run_simulation_streams_results():
+    output = io.StringIO()
+    summary = run_simulation(40, output, difficulties=("easy", "hard", "expert"), seed=1, expert_depth=1)
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert sorted(result["game"] for result in results) == list(range(40))
+    assert summary["games"] == 40
+    assert sum(wins["order"] + wins["chaos"] for wins in summary["wins"].values()) == 40
+    assert len(summary["wins"]) == 9
+
+
+def test_run_simulation_same_for_any_workers():
+    records = []
+    for workers in (1, 3):
+        output = io.StringIO()
+        run_simulation(96, output, workers, difficulties=("hard", "expert"), seed=3)
+        results = sorted((json.loads(line) for line in output.getvalue().splitlines()), key=lambda r: r["game"])
+        records.append([(result["winner"], result["moves"]) for result in results])
+    assert records[0] == records[1]
+
+
+def test_play_game_illegal_move(monkeypatch):
+    monkeypatch.setattr(Bot, "make_move", lambda self, role, time_budget=None: (0, "circle"))
+    with pytest.raises(IllegalMoveException):
+        play_game("easy", "easy", 0)
@@ -0,0 +1,99 @@
+import functools
+import random
+import pytest
+from SearchPosition import SearchPosition, NO_WINNER, ORDER_WON
+from Solver import solve, winning_cells
+
+
+@functools.lru_cache(maxsize=None)
+def exact_result(cells: tuple[int, ...], order_to_move: bool) -> int:
+    position = SearchPosition(list(cells))
+    results = []
+    for cell_index, value in enumerate(cells):
+        if value:
+            continue
+        for symbol in (1, 2):
+            result = position.play(cell_index, symbol)
+            if result == NO_WINNER:
+                result = exact_result(tuple(position.cells), not order_to_move)
+            position.undo()
+            results.append(result)
+    return max(results) if order_to_move else min(results)
+
+
+def late_positions(amount: int, empty_cells: int, seed: int) -> list[list[int]]:
+    generator = random.Random(seed)
+    positions = []
+    while len(positions) < amount:
+        position = SearchPosition()
+        for cell_index in generator.sample(range(36), 36 - empty_cells):
+            if position.play(cell_index, generator.randint(1, 2)) != NO_WINNER:
+                break
+        else:
+            positions.append(list(position.cells))
+    return positions
+
+
+def play_line(values: list[int], line: list[tuple[int, str]]) -> tuple[list[int], int]:
+    position = SearchPosition(values)
+    result = NO_WINNER
+    for cell_index, symbol in line:
+        assert position.cells[cell_index] == 0
+        result = position.play(cell_index, 1 if symbol == "circle" else 2)
+    return position.cells, result
+
+
+@pytest.mark.parametrize("table_size", [1 << 20, 8])
+def test_solve_matches_minimax(table_size):
+    for index, values in enumerate(late_positions(20, 7, 0)):
+        side_to_move = "order" if index % 2 else "chaos"
+        solution = solve(values, side_to_move, table_size=table_size)
+        result = exact_result(tuple(values), side_to_move == "order")
+        assert solution["winner"] == ("order" if result == ORDER_WON else "chaos")
+        assert solution["proof_size"] >= 1
+        final_values, line_result = play_line(values, solution["line"])
+        assert line_result == result
+        if result == ORDER_WON:
+            assert len(solution["winning_cells"]) == 5
+            assert len({final_values[cell] for cell in solution["winning_cells"]}) == 1
+        else:
+            assert solution["winning_cells"] == []
+
+
+def test_solve_open_three():
+    values = [0] * 36
+    for index in (13, 14, 15):
+        values[index] = 1
+    solution = solve(values, "order")
+    assert solution["winner"] == "order"
+    assert len(solution["line"]) == 3
+    final_values, result = play_line(values, solution["line"])
+    assert result == ORDER_WON
+    assert winning_cells(final_values) == solution["winning_cells"]
+
+
+def test_solve_budget():
+    solution = solve([0] * 36, "order", max_nodes=50)
+    assert solution["winner"] == ""
+    assert solution["proof_size"] == 0
+    assert solution["line"] == []
+    assert solution["nodes"] <= 51
+    solution = solve([0] * 36, "order", max_nodes=None, time_budget=0.05)
+    assert solution["winner"] == ""
+    assert solution["time"] < 1
+
+
+def test_solve_finished_game():
+    values = [0] * 36
+    for index in range(5):
+        values[index] = 2
+    solution = solve(values, "chaos")
+    assert solution["winner"] == "order"
+    assert solution["proof_size"] == 1
+    assert solution["line"] == []
+    assert solution["winning_cells"] == [0, 1, 2, 3, 4]
+
+
+def test_solve_wrong_side():
+    with pytest.raises(ValueError):
+        solve([0] * 36, "circle")
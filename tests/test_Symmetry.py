@@ -0,0 +1,84 @@
+import random
+from Symmetry import (CELL_PERMUTATIONS, SYMMETRIES, INVERSE_SYMMETRIES, transform_position, transform_move,
+                      canonical_position, canonical_hash, position_symmetries, unique_moves)
+from SearchPosition import SearchPosition, zobrist_hash
+
+
+def random_values(seed: int) -> list[int]:
+    rng = random.Random(seed)
+    values = [0] * 36
+    for cell_index in rng.sample(range(36), rng.randrange(1, 20)):
+        values[cell_index] = rng.choice((1, 2))
+    return values
+
+
+def test_permutations():
+    assert len(set(CELL_PERMUTATIONS)) == 8
+    assert CELL_PERMUTATIONS[0] == tuple(range(36))
+    for permutation in CELL_PERMUTATIONS:
+        assert sorted(permutation) == list(range(36))
+    # rotation by 90 degrees moves top left corner to top right one
+    assert CELL_PERMUTATIONS[1][0] == 5
+    assert len(SYMMETRIES) == 16
+
+
+def test_inverse_symmetries():
+    values = random_values(0)
+    for symmetry in range(16):
+        transformed = transform_position(values, symmetry)
+        assert transform_position(transformed, INVERSE_SYMMETRIES[symmetry]) == values
+        assert transform_move(transform_move((7, 1), symmetry), INVERSE_SYMMETRIES[symmetry]) == (7, 1)
+
+
+def test_symmetries_keep_winner():
+    for seed in range(50):
+        values = random_values(seed)
+        winner = SearchPosition(values).winner()
+        for symmetry in range(16):
+            assert SearchPosition(transform_position(values, symmetry)).winner() == winner
+
+
+def test_canonical_position_same_for_class():
+    values = random_values(1)
+    canonical, symmetry = canonical_position(values)
+    assert tuple(transform_position(values, symmetry)) == canonical
+    for other in range(16):
+        assert canonical_position(transform_position(values, other))[0] == canonical
+
+
+def test_canonical_hash_same_for_class():
+    values = random_values(2)
+    position_hash, symmetry = canonical_hash(values)
+    assert zobrist_hash(transform_position(values, symmetry)) == position_hash
+    for other in range(16):
+        assert canonical_hash(transform_position(values, other))[0] == position_hash
+
+
+def test_canonical_move_mapping():
+    values = random_values(3)
+    move = (values.index(0), 2)
+    canonical, symmetry = canonical_position(values)
+    canonical_move = transform_move(move, symmetry)
+    assert canonical[canonical_move[0]] == 0
+    assert transform_move(canonical_move, INVERSE_SYMMETRIES[symmetry]) == move
+
+
+def test_position_symmetries():
+    assert len(position_symmetries([0] * 36)) == 16
+    values = [0] * 36
+    values[0] = 1
+    assert position_symmetries(values) == [0, 6]
+    assert position_symmetries(random_values(4)) == [0]
+
+
+def test_unique_moves_empty_board():
+    moves = [(cell_index, value) for cell_index in range(36) for value in (1, 2)]
+    kept = unique_moves([0] * 36, moves)
+    assert len(kept) == 6
+    assert kept[0] == (0, 1)
+
+
+def test_unique_moves_no_symmetry():
+    values = random_values(4)
+    moves = [(cell_index, 1) for cell_index in range(36) if values[cell_index] == 0]
+    assert unique_moves(values, moves) == moves
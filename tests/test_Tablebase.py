@@ -0,0 +1,134 @@
+import functools
+import os
+import random
+import pytest
+import Tablebase
+from Bot import Bot
+from SearchPosition import SearchPosition, NO_WINNER
+from Symmetry import transform_position
+from Tablebase import generate_tablebase, relevant_empty_cells, solve_positions
+
+
+@functools.lru_cache(maxsize=None)
+def exact_result(cells: tuple[int, ...], order_to_move: bool) -> int:
+    position = SearchPosition(list(cells))
+    results = []
+    for cell_index, value in enumerate(cells):
+        if value:
+            continue
+        for symbol in (1, 2):
+            result = position.play(cell_index, symbol)
+            if result == NO_WINNER:
+                result = exact_result(tuple(position.cells), not order_to_move)
+            position.undo()
+            results.append(result)
+    return max(results) if order_to_move else min(results)
+
+
+def late_positions(amount: int, empty_cells: int, seed: int) -> list[list[int]]:
+    generator = random.Random(seed)
+    positions = []
+    while len(positions) < amount:
+        position = SearchPosition()
+        for cell_index in generator.sample(range(36), 36 - empty_cells):
+            if position.play(cell_index, generator.randint(1, 2)) != NO_WINNER:
+                break
+        else:
+            positions.append(list(position.cells))
+    return positions
+
+
+@pytest.fixture(scope="module")
+def tablebase(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("tablebase") / "test.tablebase")
+    generate_tablebase(path, late_positions(6, 6, 0), max_empty=6)
+    tablebase = Tablebase.Tablebase(path)
+    yield tablebase
+    tablebase.close()
+
+
+def test_results_are_perfect(tablebase):
+    for values in late_positions(6, 6, 0):
+        position = SearchPosition(values)
+        order_to_move = position.empty_cells % 2 == 0
+        move, result, plies = tablebase.probe(values, order_to_move)
+        assert result == exact_result(tuple(values), order_to_move)
+        assert values[move[0]] == 0
+        move_result = position.play(move[0], move[1])
+        if move_result == NO_WINNER:
+            assert exact_result(tuple(position.cells), not order_to_move) == result
+            assert plies > 1
+        else:
+            assert move_result == result
+            assert plies == 1
+
+
+def test_symmetric_positions(tablebase):
+    values = late_positions(6, 6, 0)[0]
+    order_to_move = values.count(0) % 2 == 0
+    _, result, plies = tablebase.probe(values, order_to_move)
+    for symmetry in (1, 6, 10):
+        transformed = transform_position(values, symmetry)
+        move, transformed_result, transformed_plies = tablebase.probe(transformed, order_to_move)
+        assert (transformed_result, transformed_plies) == (result, plies)
+        position = SearchPosition(transformed)
+        move_result = position.play(move[0], move[1])
+        if move_result == NO_WINNER:
+            assert exact_result(tuple(position.cells), not order_to_move) == result
+
+
+def test_probe_outside_tablebase(tablebase):
+    assert tablebase.probe([0] * 36, True) is None
+    values = late_positions(1, 12, 0)[0]
+    assert relevant_empty_cells(SearchPosition(values)) > 6
+    assert tablebase.probe(values, True) is None
+
+
+def test_solve_positions_skips_finished():
+    assert solve_positions([[1] * 5 + [0] * 31]) == {}
+
+
+def test_generation_resumes(tmp_path, monkeypatch):
+    path = str(tmp_path / "test.tablebase")
+    seeds = late_positions(Tablebase.SEEDS_PER_PART + 1, 5, 1)
+    expected = solve_positions(seeds[:Tablebase.SEEDS_PER_PART])
+    expected.update(solve_positions(seeds[Tablebase.SEEDS_PER_PART:]))
+    os.makedirs(path + ".parts")
+    Tablebase._solve_part(os.path.join(path + ".parts", "part_00000.bin"), seeds[:Tablebase.SEEDS_PER_PART])
+    solved = []
+    original = Tablebase.solve_positions
+    monkeypatch.setattr(Tablebase, "solve_positions", lambda part_seeds: solved.append(part_seeds) or original(part_seeds))
+    assert generate_tablebase(path, seeds, max_empty=5) == len(expected)
+    assert solved == [seeds[Tablebase.SEEDS_PER_PART:]]
+    assert not os.path.exists(path + ".parts")
+    tablebase = Tablebase.Tablebase(path)
+    for values in seeds:
+        assert tablebase.probe(values, values.count(0) % 2 == 0) is not None
+    tablebase.close()
+
+
+def test_generation_wrong_seed(tmp_path):
+    with pytest.raises(ValueError):
+        generate_tablebase(str(tmp_path / "test.tablebase"), [[0] * 36], max_empty=6)
+
+
+def test_not_a_tablebase(tmp_path):
+    path = tmp_path / "wrong.tablebase"
+    path.write_bytes(b"OCAB" + bytes(60))
+    with pytest.raises(ValueError):
+        Tablebase.Tablebase(str(path))
+
+
+def test_bot_plays_tablebase_move(tablebase):
+    values = late_positions(6, 6, 0)[1]
+    order_to_move = values.count(0) % 2 == 0
+    role = "order" if order_to_move else "chaos"
+    move = tablebase.best_move(values, order_to_move)
+    bot = Bot()
+    bot.load_board(values)
+    bot.set_tablebase(tablebase)
+    bot.set_difficulty("hard")
+    assert bot.make_move(role) == (move[0], "circle" if move[1] == 1 else "cross")
+    bot.set_tablebase(None)
+    cell_index, symbol = bot.make_move(role)
+    assert values[cell_index] == 0
@@ -0,0 +1,100 @@
+import random
+from SearchPosition import SearchPosition, NO_WINNER, ORDER_WON
+from Bot import Bot
+from Solver import solve
+from ThreatSpace import ThreatSpaceSearch, winning_moves
+
+
+def random_positions(amount: int, seed: int) -> list[list[int]]:
+    generator = random.Random(seed)
+    positions = []
+    while len(positions) < amount:
+        position = SearchPosition()
+        for cell_index in generator.sample(range(36), generator.randint(10, 22)):
+            if position.play(cell_index, generator.randint(1, 2)) != NO_WINNER:
+                break
+        else:
+            positions.append(list(position.cells))
+    return positions
+
+
+def play_line(values: list[int], line: list[tuple[int, int]]) -> int:
+    position = SearchPosition(values)
+    result = NO_WINNER
+    for cell_index, value in line:
+        assert position.cells[cell_index] == 0
+        result = position.play(cell_index, value)
+    return result
+
+
+def test_winning_moves():
+    values = [0] * 36
+    for cell_index in (12, 13, 14, 15):
+        values[cell_index] = 1
+    assert sorted(winning_moves(SearchPosition(values))) == [(16, 1)]
+    # five in a row would make six
+    values[17] = 1
+    assert winning_moves(SearchPosition(values)) == []
+
+
+def test_open_three_is_forcing_win():
+    values = [0] * 36
+    for cell_index in (13, 14, 15):
+        values[cell_index] = 1
+    search = ThreatSpaceSearch()
+    line = search.search(values)
+    assert line is not None
+    assert len(line) == 3
+    assert play_line(values, line) == ORDER_WON
+    assert search.nodes > 0
+
+
+def test_no_threats_no_line():
+    assert ThreatSpaceSearch().search([0] * 36) is None
+
+
+def test_found_lines_are_wins():
+    search = ThreatSpaceSearch()
+    found = 0
+    for values in random_positions(60, 0):
+        line = search.search(values)
+        if line is None:
+            continue
+        found += 1
+        assert play_line(values, line) == ORDER_WON
+        if values.count(0) <= 16:
+            assert solve(values, "order", max_nodes=300000)["winner"] == "order"
+    assert found > 0
+
+
+def test_depth_limit():
+    values = [0] * 36
+    for cell_index in (13, 14, 15):
+        values[cell_index] = 1
+    assert ThreatSpaceSearch(max_depth=0).search(values) is None
+    assert ThreatSpaceSearch(max_nodes=0).search(values) is None
+
+
+def test_expert_order_plays_threat():
+    values = [0] * 36
+    for cell_index in (13, 14, 15):
+        values[cell_index] = 1
+    bot = Bot()
+    bot.set_difficulty("expert")
+    bot.load_board(values)
+    line = ThreatSpaceSearch().search(values)
+    cell_index, symbol = bot._pick_expert_cell("order", 1.0)
+    assert (cell_index, symbol) == (line[0][0], "circle" if line[0][1] == 1 else "cross")
+
+
+def test_stats():
+    values = [0] * 36
+    for cell_index in (13, 14, 15):
+        values[cell_index] = 1
+    search = ThreatSpaceSearch()
+    line = search.search(values)
+    stats = search.stats()
+    assert stats['nodes'] == search.nodes
+    assert stats['depth'] == len(line)
+    search.search([0] * 36)
+    assert search.stats()['depth'] == 0
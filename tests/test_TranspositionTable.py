@@ -0,0 +1,52 @@
+from TranspositionTable import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND, pack_move, unpack_move
+
+
+def test_table_size():
+    table = TranspositionTable(1)
+    assert table.size_megabytes() == 1
+    assert table.buckets == 2**15
+
+
+def test_pack_move():
+    for move in [(0, 1), (0, 2), (35, 1), (35, 2), None]:
+        assert unpack_move(pack_move(move)) == move
+
+
+def test_store_and_probe():
+    table = TranspositionTable(1)
+    key = 0x123456789ABCDEF0
+    table.store(key, 3, -250, LOWER_BOUND, (14, 2))
+    assert table.probe(key) == (3, -250, LOWER_BOUND, (14, 2))
+    assert table.probe(key ^ 1 << 40) is None
+    assert table.hits == 1
+    assert table.probes == 2
+    assert table.hit_rate() == 0.5
+
+
+def test_replacement_keeps_deeper_entry():
+    table = TranspositionTable(1)
+    deep_key = 5
+    shallow_key = 5 + table.buckets  # same bucket
+    table.store(deep_key, 6, 10, EXACT, None)
+    table.store(shallow_key, 2, 20, UPPER_BOUND, None)
+    assert table.probe(deep_key) == (6, 10, EXACT, None)
+    assert table.probe(shallow_key) == (2, 20, UPPER_BOUND, None)
+    table.store(shallow_key + table.buckets, 1, 30, EXACT, None)
+    assert table.probe(deep_key) is not None
+    assert table.probe(shallow_key) is None
+
+
+def test_replacement_of_older_search():
+    table = TranspositionTable(1)
+    table.store(5, 6, 10, EXACT, None)
+    table.new_search()
+    table.store(5 + table.buckets, 1, 20, EXACT, None)
+    assert table.probe(5) is None
+
+
+def test_clear():
+    table = TranspositionTable(1)
+    table.store(5, 6, 10, EXACT, None)
+    table.clear()
+    assert table.probe(5) is None
+    assert table.stores == 0